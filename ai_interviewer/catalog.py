@@ -0,0 +1,238 @@
+"""Model catalog index: static size hints merged with what Ollama reports.
+
+``utils.model_catalog.MODEL_CATALOG`` only has estimated download sizes for a
+fixed list of models. The index adds, per host, the real ``size`` from
+/api/tags and the parameter count, quantization, family and context length
+from /api/show, and persists them in the state directory
+(``model_catalog.json``) so the setup tab renders without network calls.
+
+``model_index()`` never blocks on the network: it answers from memory/disk
+and starts a background refresh when
+
+    - the installed models (name + digest, from the cached ollama_status)
+      differ from the index, e.g. after a pull or delete, or
+    - the host's index is older than MODEL_CATALOG_TTL (default one day).
+
+/api/show answers are reused per digest, so a refresh after a pull only asks
+about the new model.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, fields
+from typing import Any, Dict, List, Optional
+
+from ai_interviewer.llm import OllamaStatus, _base_url, clear_show_cache, ollama_show, ollama_status
+from ai_interviewer.utils.log import debug, warn
+from ai_interviewer.utils.model_catalog import MODEL_CATALOG
+from ai_interviewer.utils.paths import state_dir
+
+
+MODEL_CATALOG_TTL_S = float(os.getenv("MODEL_CATALOG_TTL", str(24 * 3600)))
+CATALOG_CACHE_VERSION = 1
+
+
+@dataclass
+class ModelInfo:
+    name: str
+    size_gb: Optional[float] = None
+    size_is_estimate: bool = True
+    parameter_size: str = ""  # as reported, e.g. "1.1B"
+    parameter_count: Optional[int] = None
+    quantization: str = ""
+    family: str = ""
+    context_length: Optional[int] = None
+    digest: str = ""
+    modified_at: str = ""
+    installed: bool = False  # filled in per call from the live status, not persisted
+
+
+def _from_tags(entry: Dict[str, Any]) -> ModelInfo:
+    details = entry.get("details") or {}
+    size = entry.get("size")
+    return ModelInfo(
+        name=entry["name"],
+        size_gb=round(size / 1024**3, 2) if isinstance(size, (int, float)) and size > 0 else MODEL_CATALOG.get(entry["name"]),
+        size_is_estimate=not (isinstance(size, (int, float)) and size > 0),
+        parameter_size=str(details.get("parameter_size") or ""),
+        quantization=str(details.get("quantization_level") or ""),
+        family=str(details.get("family") or ""),
+        digest=str(entry.get("digest") or ""),
+        modified_at=str(entry.get("modified_at") or ""),
+    )
+
+
+def _apply_show(mi: ModelInfo, show: Dict[str, Any]) -> None:
+    details = show.get("details") or {}
+    mi.parameter_size = mi.parameter_size or str(details.get("parameter_size") or "")
+    mi.quantization = mi.quantization or str(details.get("quantization_level") or "")
+    mi.family = mi.family or str(details.get("family") or "")
+    for k, v in (show.get("model_info") or {}).items():
+        if not isinstance(v, (int, float)):
+            continue
+        if k == "general.parameter_count":
+            mi.parameter_count = int(v)
+        elif k.endswith(".context_length"):
+            mi.context_length = int(v)
+
+
+class _CatalogIndex:
+    def __init__(self, ttl_s: float = MODEL_CATALOG_TTL_S) -> None:
+        self.ttl_s = ttl_s
+        self._hosts: Optional[Dict[str, Dict[str, Any]]] = None  # host -> {"refreshed_at", "models": {name: ModelInfo}}
+        self._refreshing: set = set()
+        self._lock = threading.Lock()
+
+    # -- persistence --
+
+    def _path(self):
+        return state_dir() / "model_catalog.json"
+
+    def _load_locked(self) -> Dict[str, Dict[str, Any]]:
+        if self._hosts is not None:
+            return self._hosts
+        self._hosts = {}
+        try:
+            data = json.loads(self._path().read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return self._hosts
+        if not isinstance(data, dict) or data.get("version") != CATALOG_CACHE_VERSION:
+            return self._hosts
+        known = {f.name for f in fields(ModelInfo)}
+        for h, entry in (data.get("hosts") or {}).items():
+            try:
+                models = {
+                    name: ModelInfo(**{k: v for k, v in m.items() if k in known})
+                    for name, m in (entry.get("models") or {}).items()
+                }
+                self._hosts[h] = {"refreshed_at": float(entry.get("refreshed_at") or 0), "models": models}
+            except (TypeError, AttributeError):
+                continue
+        return self._hosts
+
+    def _save_locked(self) -> None:
+        hosts = self._hosts or {}
+        doc = {
+            "version": CATALOG_CACHE_VERSION,
+            "hosts": {
+                h: {
+                    "refreshed_at": e["refreshed_at"],
+                    "models": {n: {k: v for k, v in asdict(m).items() if k != "installed"} for n, m in e["models"].items()},
+                }
+                for h, e in hosts.items()
+            },
+        }
+        try:
+            tmp = self._path().with_suffix(".tmp")
+            tmp.write_text(json.dumps(doc, indent=2), encoding="utf-8")
+            os.replace(tmp, self._path())
+        except OSError as e:
+            warn(f"Could not write model catalog cache: {e}")
+
+    # -- queries --
+
+    def get(self, host: Optional[str] = None, status: Optional[OllamaStatus] = None) -> Dict[str, ModelInfo]:
+        h = _base_url(host)
+        status = status if status is not None else ollama_status(h)
+        with self._lock:
+            entry = self._load_locked().get(h) or {"refreshed_at": 0.0, "models": {}}
+            cached: Dict[str, ModelInfo] = entry["models"]
+            out: Dict[str, ModelInfo] = {}
+            for name, gb in MODEL_CATALOG.items():
+                out[name] = ModelInfo(name=name, size_gb=gb)
+            for name, mi in cached.items():
+                out[name] = ModelInfo(**asdict(mi))
+            stale = time.time() - entry["refreshed_at"] > self.ttl_s
+        if status.ok:
+            changed = False
+            for e in status.entries:
+                name = e["name"]
+                if name not in cached or cached[name].digest != str(e.get("digest") or ""):
+                    # Real size and details from /api/tags until the refresh adds /api/show facts
+                    changed = True
+                    out[name] = _from_tags(e)
+                out[name].installed = True
+            if changed or stale:
+                self._refresh_async(h, status, full=stale)
+        return out
+
+    def refresh(self, host: Optional[str] = None, status: Optional[OllamaStatus] = None, full: bool = False) -> Dict[str, ModelInfo]:
+        """Rebuild the host's index from /api/tags (+ /api/show for new digests)."""
+        h = _base_url(host)
+        status = status if status is not None else ollama_status(h, max_age=0)
+        if not status.ok:
+            return self.get(h, status)
+        with self._lock:
+            prev: Dict[str, ModelInfo] = dict((self._load_locked().get(h) or {}).get("models") or {})
+        if full:
+            clear_show_cache(h)
+        models: Dict[str, ModelInfo] = dict(prev)  # keep metadata of deleted models for re-download
+        for e in status.entries:
+            mi = _from_tags(e)
+            old = prev.get(mi.name)
+            if not full and old is not None and old.digest == mi.digest and old.context_length is not None:
+                mi.parameter_count, mi.context_length = old.parameter_count, old.context_length
+                mi.parameter_size = mi.parameter_size or old.parameter_size
+                mi.quantization = mi.quantization or old.quantization
+                mi.family = mi.family or old.family
+            else:
+                _apply_show(mi, ollama_show(mi.name, h))
+            models[mi.name] = mi
+        with self._lock:
+            self._load_locked()[h] = {"refreshed_at": time.time(), "models": models}
+            self._save_locked()
+        debug(f"Model catalog refreshed for {h}: {len(status.entries)} installed, {len(models)} indexed")
+        return self.get(h, status)
+
+    def _refresh_async(self, h: str, status: OllamaStatus, full: bool) -> None:
+        with self._lock:
+            if h in self._refreshing:
+                return
+            self._refreshing.add(h)
+
+        def _run() -> None:
+            try:
+                self.refresh(h, status, full)
+            except Exception as e:
+                warn(f"Model catalog refresh failed for {h}: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(h)
+
+        threading.Thread(target=_run, name="model-catalog-refresh", daemon=True).start()
+
+
+_index = _CatalogIndex()
+
+
+def model_index(host: Optional[str] = None, status: Optional[OllamaStatus] = None) -> Dict[str, ModelInfo]:
+    """Catalog hints + installed models for ``host`` from the cached index (no blocking I/O
+    beyond the cached ollama_status); stale or changed entries refresh in the background."""
+    return _index.get(host, status)
+
+
+def refresh_model_index(host: Optional[str] = None, full: bool = True) -> Dict[str, ModelInfo]:
+    """Synchronously re-read /api/tags and /api/show for ``host``."""
+    return _index.refresh(host, full=full)
+
+
+def describe_model(mi: ModelInfo) -> List[str]:
+    """Short facts for a model card: size, parameters, quantization, context."""
+    from ai_interviewer.utils.model_catalog import format_size_gb
+
+    parts: List[str] = []
+    if mi.size_gb:
+        parts.append(format_size_gb(mi.size_gb, estimate=mi.size_is_estimate))
+    if mi.parameter_size:
+        parts.append(f"{mi.parameter_size} params")
+    elif mi.parameter_count:
+        parts.append(f"{mi.parameter_count / 1e9:.1f}B params")
+    if mi.quantization:
+        parts.append(mi.quantization)
+    if mi.context_length:
+        parts.append(f"{mi.context_length // 1024}k context" if mi.context_length >= 1024 else f"{mi.context_length} context")
+    return parts
@@ -6,7 +6,7 @@ from ai_interviewer.profiles import PCProfile, normalize_profile
 
 @dataclass(frozen=True)
 class Config:
-    pc_profile: PCProfile = PCProfile.LOW
+    pc_profile: PCProfile = PCProfile.AUTO
     llm_backend: str = "ollama"
     llm_model: str = "tinyllama:1.1b"
     tts_voice: str = "default"
@@ -19,7 +19,7 @@ def _map_legacy_profile(value: str) -> PCProfile:
 
 def load_config() -> Config:
     return Config(
-        pc_profile=_map_legacy_profile(os.getenv("PC_PROFILE", PCProfile.LOW.value)),
+        pc_profile=_map_legacy_profile(os.getenv("PC_PROFILE", PCProfile.AUTO.value)),
         llm_backend=os.getenv("LLM_BACKEND", "ollama"),
         llm_model=os.getenv("LLM_MODEL", "tinyllama:1.1b"),
         tts_voice=os.getenv("TTS_VOICE", "default"),
@@ -0,0 +1,332 @@
+"""Hardware probing for the Auto PC profile.
+
+``get_hardware()`` measures the machine once (cores, RAM, CPU flags, GPU and a
+short memory-bandwidth micro-benchmark) and caches the result in the state
+directory; free memory is read once per process, at startup, so a model the
+app has since loaded doesn't shrink the budget it was chosen from.
+``auto_plan()`` turns that into concrete choices:
+
+    llm_model     largest catalog model that fits free memory and still
+                  generates a question within AUTO_MAX_REPLY_S
+    stt_model     measured pick from the STT benchmark if available, else by cores
+    compute_type  int8 needs AVX2 to be fast in CTranslate2; float32 otherwise
+    llm_threads / stt_threads   split of the physical cores
+
+CPU decoding is memory-bound: every generated token streams the whole model
+through memory once, so tokens/s is roughly bandwidth / model size.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import shutil
+import socket
+import subprocess
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+from ai_interviewer.utils.log import debug, info
+from ai_interviewer.utils.paths import state_dir
+
+
+HARDWARE_CACHE_VERSION = 1
+# Latency budget for one interviewer question (~40 generated tokens)
+AUTO_MAX_REPLY_S = float(os.getenv("AUTO_MAX_REPLY_S", "4"))
+AUTO_REPLY_TOKENS = 40
+# Share of free memory the LLM may take; the rest is left for STT, TTS and the OS
+AUTO_MEMORY_SHARE = float(os.getenv("AUTO_MEMORY_SHARE", "0.7"))
+# Resident size relative to the download size (KV cache, runtime buffers)
+_LLM_OVERHEAD = 1.3
+# Fraction of measured copy bandwidth a CPU decoder actually achieves
+_DECODE_EFFICIENCY = 0.5
+
+
+@dataclass
+class HardwareInfo:
+    hostname: str = ""
+    platform: str = ""
+    logical_cores: int = 1
+    physical_cores: int = 1
+    ram_gb: float = 0.0
+    free_gb: float = 0.0
+    avx2: Optional[bool] = None  # None = could not be determined
+    avx512: Optional[bool] = None
+    gpu_name: str = ""
+    gpu_vram_gb: float = 0.0
+    mem_bandwidth_gbs: float = 0.0
+    probed_at: float = 0.0
+    version: int = HARDWARE_CACHE_VERSION
+
+
+@dataclass
+class AutoPlan:
+    llm_model: str
+    stt_model: str
+    stt_compute_type: str
+    llm_threads: int
+    stt_threads: int
+    est_tokens_per_sec: float
+    reasons: List[str] = field(default_factory=list)
+
+
+# --- Probes ---
+
+def _meminfo_gb() -> Dict[str, float]:
+    try:
+        import psutil  # type: ignore
+
+        vm = psutil.virtual_memory()
+        return {"total": vm.total / 1024**3, "free": vm.available / 1024**3}
+    except Exception:
+        pass
+    out: Dict[str, float] = {}
+    try:
+        with open("/proc/meminfo", "r", encoding="ascii") as f:
+            for line in f:
+                k, _, rest = line.partition(":")
+                if k in ("MemTotal", "MemAvailable"):
+                    out["total" if k == "MemTotal" else "free"] = int(rest.split()[0]) / 1024**2
+    except Exception:
+        pass
+    if "total" not in out:
+        try:
+            out["total"] = os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") / 1024**3
+        except Exception:
+            pass
+    out.setdefault("free", out.get("total", 0.0) * 0.5)
+    return out
+
+
+def _physical_cores(logical: int) -> int:
+    try:
+        import psutil  # type: ignore
+
+        n = psutil.cpu_count(logical=False)
+        if n:
+            return int(n)
+    except Exception:
+        pass
+    try:
+        cores = set()
+        phys = core = None
+        with open("/proc/cpuinfo", "r", encoding="ascii", errors="ignore") as f:
+            for line in f:
+                k, _, v = line.partition(":")
+                k = k.strip()
+                if k == "physical id":
+                    phys = v.strip()
+                elif k == "core id":
+                    core = v.strip()
+                elif not line.strip():
+                    if core is not None:
+                        cores.add((phys, core))
+                    phys = core = None
+        if cores:
+            return len(cores)
+    except Exception:
+        pass
+    return logical
+
+
+def _cpu_flags() -> Dict[str, Optional[bool]]:
+    try:
+        with open("/proc/cpuinfo", "r", encoding="ascii", errors="ignore") as f:
+            for line in f:
+                if line.startswith("flags"):
+                    flags = set(line.partition(":")[2].split())
+                    return {"avx2": "avx2" in flags, "avx512": "avx512f" in flags}
+    except Exception:
+        pass
+    if platform.machine().lower() in ("arm64", "aarch64"):
+        return {"avx2": False, "avx512": False}
+    try:
+        import cpuinfo  # type: ignore  # py-cpuinfo, optional
+
+        flags = set(cpuinfo.get_cpu_info().get("flags", []))
+        return {"avx2": "avx2" in flags, "avx512": "avx512f" in flags}
+    except Exception:
+        return {"avx2": None, "avx512": None}
+
+
+def _gpu() -> Dict[str, Any]:
+    exe = shutil.which("nvidia-smi")
+    if not exe:
+        return {}
+    try:
+        out = subprocess.run(
+            [exe, "--query-gpu=name,memory.total", "--format=csv,noheader,nounits"],
+            capture_output=True, text=True, timeout=5,
+        ).stdout.strip().splitlines()
+        name, mem = out[0].rsplit(",", 1)
+        return {"gpu_name": name.strip(), "gpu_vram_gb": round(float(mem) / 1024, 1)}
+    except Exception:
+        return {}
+
+
+def _mem_bandwidth_gbs(size_mb: int = 64, budget_s: float = 0.3) -> float:
+    """Copy bandwidth (read + write) of a buffer larger than the CPU caches."""
+    src = bytearray(size_mb * 1024 * 1024)
+    dst = bytearray(len(src))
+    view = memoryview(dst)
+    view[:] = src  # fault the pages in before timing
+    copies = 0
+    t0 = time.perf_counter()
+    while True:
+        view[:] = src  # plain memcpy, no allocation
+        copies += 1
+        dt = time.perf_counter() - t0
+        if dt >= budget_s and copies >= 2:
+            break
+    return round(2 * len(src) * copies / dt / 1024**3, 2)
+
+
+def probe_hardware() -> HardwareInfo:
+    logical = os.cpu_count() or 1
+    mem = _meminfo_gb()
+    hw = HardwareInfo(
+        hostname=socket.gethostname(),
+        platform=platform.platform(),
+        logical_cores=logical,
+        physical_cores=_physical_cores(logical),
+        ram_gb=round(mem.get("total", 0.0), 1),
+        free_gb=round(mem.get("free", 0.0), 1),
+        mem_bandwidth_gbs=_mem_bandwidth_gbs(),
+        probed_at=time.time(),
+        **_cpu_flags(),
+        **_gpu(),
+    )
+    info(
+        f"Hardware: {hw.physical_cores}/{hw.logical_cores} cores, {hw.ram_gb} GB RAM ({hw.free_gb} free), "
+        f"AVX2={hw.avx2} AVX512={hw.avx512}, {hw.mem_bandwidth_gbs} GB/s"
+        + (f", GPU {hw.gpu_name} {hw.gpu_vram_gb} GB" if hw.gpu_name else "")
+    )
+    return hw
+
+
+# --- Cached access ---
+
+_hw: Optional[HardwareInfo] = None
+_hw_lock = threading.Lock()
+
+
+def _cache_path():
+    return state_dir() / "hardware.json"
+
+
+def _load_cached() -> Optional[HardwareInfo]:
+    try:
+        data = json.loads(_cache_path().read_text(encoding="utf-8"))
+        hw = HardwareInfo(**data)
+    except Exception:
+        return None
+    # A copied home directory or a different container is a different machine
+    if hw.version != HARDWARE_CACHE_VERSION or hw.hostname != socket.gethostname() or hw.logical_cores != (os.cpu_count() or 1):
+        return None
+    return hw
+
+
+def get_hardware(refresh: bool = False) -> HardwareInfo:
+    """Probe once per machine (cached on disk); free memory once per process.
+
+    Free memory is not re-read on later calls: once the Auto pick is resident
+    it would no longer fit what is left, and the plan would flip to a smaller
+    model on the next rerun. ``refresh=True`` measures everything again.
+    """
+    global _hw
+    with _hw_lock:
+        if _hw is None or refresh:
+            hw = None if refresh else _load_cached()
+            if hw is None:
+                hw = probe_hardware()
+                try:
+                    tmp = _cache_path().with_suffix(".tmp")
+                    tmp.write_text(json.dumps(asdict(hw), indent=2), encoding="utf-8")
+                    os.replace(tmp, _cache_path())
+                except OSError:
+                    pass
+            hw.free_gb = round(_meminfo_gb().get("free", hw.free_gb), 1)
+            _hw = hw
+        return _hw
+
+
+def start_hardware_probe() -> threading.Thread:
+    """Probe in the background at startup so the first Auto lookup doesn't wait."""
+    t = threading.Thread(target=get_hardware, name="hardware-probe", daemon=True)
+    t.start()
+    return t
+
+
+# --- Planning ---
+
+def est_tokens_per_sec(hw: HardwareInfo, model_gb: float) -> float:
+    if model_gb <= 0:
+        return 0.0
+    return hw.mem_bandwidth_gbs * _DECODE_EFFICIENCY / model_gb
+
+
+def fitting_llm_models(hw: Optional[HardwareInfo] = None) -> List[str]:
+    """Catalog LLMs that fit memory and the latency budget, largest first."""
+    from ai_interviewer.utils.model_catalog import MODEL_CATALOG
+
+    hw = hw or get_hardware()
+    on_gpu = hw.gpu_vram_gb > 0
+    mem_budget = (hw.gpu_vram_gb if on_gpu else hw.free_gb * AUTO_MEMORY_SHARE)
+    need_tps = AUTO_REPLY_TOKENS / AUTO_MAX_REPLY_S
+    fits = []
+    for name, gb in MODEL_CATALOG.items():
+        if gb * _LLM_OVERHEAD > mem_budget:
+            continue
+        if not on_gpu and est_tokens_per_sec(hw, gb) < need_tps:
+            continue
+        fits.append((gb, name))
+    return [n for _, n in sorted(fits, reverse=True)]
+
+
+def auto_plan(hw: Optional[HardwareInfo] = None) -> AutoPlan:
+    from ai_interviewer.stt import best_stt_benchmark_row
+    from ai_interviewer.utils.model_catalog import MODEL_CATALOG
+
+    hw = hw or get_hardware()
+    reasons: List[str] = []
+
+    fits = fitting_llm_models(hw)
+    if fits:
+        llm = fits[0]
+        reasons.append(f"{llm}: largest model within {hw.free_gb * AUTO_MEMORY_SHARE:.1f} GB and {AUTO_MAX_REPLY_S:g}s per question")
+    else:
+        llm = min(MODEL_CATALOG, key=MODEL_CATALOG.get)
+        reasons.append(f"{llm}: nothing fits the memory/latency budget; using the smallest model")
+
+    # Same split the interview uses (see ai_interviewer.resources)
+    from ai_interviewer.resources import plan_resources
+
+    split = plan_resources(physical_cores=hw.physical_cores, pin=False)
+    stt_threads, llm_threads = split.stt_threads, split.llm_threads
+
+    best = best_stt_benchmark_row("AUTO")
+    compute_type = "int8" if hw.avx2 or hw.gpu_name else "float32"
+    if best is not None:
+        stt = best["model"]
+        compute_type = str(best.get("compute_type") or compute_type)
+        reasons.append(f"{stt} ({compute_type}): measured fastest within the WER target")
+    else:
+        stt = "tiny.en" if hw.physical_cores <= 4 else "base.en" if hw.physical_cores <= 8 else "small.en"
+        reasons.append(f"{stt}: sized for {hw.physical_cores} physical cores (no STT benchmark results)")
+        if compute_type == "float32":
+            reasons.append("STT float32: no AVX2, int8 kernels would be slower")
+
+    plan = AutoPlan(
+        llm_model=llm,
+        stt_model=stt,
+        stt_compute_type=compute_type,
+        llm_threads=llm_threads,
+        stt_threads=stt_threads,
+        est_tokens_per_sec=round(est_tokens_per_sec(hw, MODEL_CATALOG.get(llm, 1.0)), 1),
+        reasons=reasons,
+    )
+    debug(f"Auto plan: {plan}")
+    return plan
@@ -3,135 +3,1350 @@
 Exposes a simple interface:
     - LLM.generate_reply(system_prompt: str, user_text: str) -> str
     - LLM.stream_reply(system_prompt: str, user_text: str) -> Iterator[str]
+    - LLM.chat_reply(messages: list[dict]) -> str
+    - LLM.stream_chat(messages: list[dict]) -> Iterator[str]
+
+and async counterparts (agenerate_reply, astream_reply, achat_reply,
+astream_chat) so several generations can run concurrently in one event loop.
 
 Backends:
-    - OllamaLLM: calls local Ollama HTTP API (ollama serve)
+    - OllamaLLM: calls local Ollama HTTP API (ollama serve). Sync calls use
+      requests and async calls use httpx (falling back to the sync call in a
+      thread without it); the two transports share payloads, line handling
+      and stop_when. Its streams are LLMStream/AsyncLLMStream objects that
+      carry the request's own stats and host.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional, Dict, Any, List, Tuple, Iterator
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, List, Tuple, Iterator, AsyncIterator, Callable
 import subprocess
 import shutil
 import time
 import platform
 import stat
 import json
+import math
+import re
 import os
 import signal
+import threading
+import functools
+import asyncio
+import weakref
 from pathlib import Path
+from contextlib import contextmanager
 
 try:
     import requests  # type: ignore
+    from requests.adapters import HTTPAdapter  # type: ignore
+    from urllib3.util.retry import Retry  # type: ignore
 except Exception:  # pragma: no cover - optional import at runtime
     requests = None  # type: ignore
 
+try:
+    import httpx  # type: ignore
+except Exception:  # pragma: no cover - optional import at runtime
+    httpx = None  # type: ignore
+
+from ai_interviewer.utils.log import debug, warn
+from ai_interviewer.utils.paths import state_dir
+
+
+# --- Pooled HTTP sessions ---
+
+# One keep-alive session per Ollama host, shared by every helper in this module.
+# Streamlit reruns the script on each interaction; without pooling each call paid
+# a fresh TCP handshake.
+HTTP_POOL_SIZE = int(os.getenv("OLLAMA_POOL_SIZE", "8"))
+HTTP_RETRIES = int(os.getenv("OLLAMA_RETRIES", "2"))
+HTTP_CONNECT_TIMEOUT = float(os.getenv("OLLAMA_CONNECT_TIMEOUT", "3"))
+
+# How long the server keeps a model resident after a request (Ollama duration string)
+DEFAULT_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+# When stop_when cuts a stream the response is closed, so Ollama aborts the
+# generation, and token counts are taken from the chunks received. A positive
+# value instead reads the discarded tail for up to this many seconds, in the
+# background and after giving back the scheduler slot, only to pick up the
+# server's prompt timings from the final line; the server keeps generating
+# meanwhile, so leave it at 0 unless those numbers are needed.
+STOP_DRAIN_S = float(os.getenv("OLLAMA_STOP_DRAIN", "0"))
+
+_sessions: Dict[str, Any] = {}
+_sessions_lock = threading.Lock()
+
+
+def _base_url(host: Optional[str]) -> str:
+    return (host or os.getenv("OLLAMA_HOST", "http://localhost:11434")).rstrip("/")
+
+
+def _timeout(read_s: float) -> Tuple[float, float]:
+    """(connect, read) timeout tuple; connect never exceeds the read budget."""
+    return (min(HTTP_CONNECT_TIMEOUT, float(read_s)), float(read_s))
+
+
+def get_session(host: Optional[str] = None):
+    """Return the shared, connection-pooled session for an Ollama host.
+
+    Retries only cover connection failures and idempotent requests (GET/HEAD/DELETE);
+    a POST that reached the server is never replayed.
+    """
+    if requests is None:
+        raise RuntimeError("'requests' package not installed; required for Ollama backend")
+    base = _base_url(host)
+    with _sessions_lock:
+        s = _sessions.get(base)
+        if s is None:
+            retry = Retry(
+                total=HTTP_RETRIES,
+                connect=HTTP_RETRIES,
+                read=0,
+                status=HTTP_RETRIES,
+                backoff_factor=0.2,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset({"GET", "HEAD", "DELETE"}),
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+            s = requests.Session()
+            s.mount("http://", adapter)
+            s.mount("https://", adapter)
+            _sessions[base] = s
+        return s
+
+
+def http_pool_stats() -> Dict[str, Dict[str, int]]:
+    """Per-host request/connection counters from the underlying urllib3 pools.
+
+    ``reused`` is the number of requests that did not need a new connection.
+    """
+    with _sessions_lock:
+        items = list(_sessions.items())
+    out: Dict[str, Dict[str, int]] = {}
+    for base, s in items:
+        reqs = conns = 0
+        try:
+            pm = s.get_adapter(base).poolmanager
+            for key in list(pm.pools.keys()):
+                pool = pm.pools.get(key)
+                if pool is None:
+                    continue
+                reqs += int(getattr(pool, "num_requests", 0))
+                conns += int(getattr(pool, "num_connections", 0))
+        except Exception:
+            pass
+        out[base] = {"requests": reqs, "connections": conns, "reused": max(0, reqs - conns)}
+    return out
+
+
+def close_sessions() -> None:
+    """Close and forget all pooled sessions (e.g. after the server restarts)."""
+    with _sessions_lock:
+        items = list(_sessions.values())
+        _sessions.clear()
+    for s in items:
+        try:
+            s.close()
+        except Exception:
+            pass
+
+
+# httpx clients are bound to the event loop that created them, so the async
+# pool is keyed by loop first and dropped together with it.
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+
+
+def get_async_client(host: Optional[str] = None):
+    """Return the pooled httpx.AsyncClient for ``host`` on the running event loop."""
+    if httpx is None:
+        raise RuntimeError("'httpx' package not installed; required for the async Ollama backend")
+    loop = asyncio.get_running_loop()
+    base = _base_url(host)
+    clients = _async_clients.setdefault(loop, {})
+    c = clients.get(base)
+    if c is None or c.is_closed:
+        c = httpx.AsyncClient(
+            base_url=base,
+            limits=httpx.Limits(max_connections=HTTP_POOL_SIZE, max_keepalive_connections=HTTP_POOL_SIZE),
+            transport=httpx.AsyncHTTPTransport(retries=HTTP_RETRIES),  # connection failures only
+        )
+        clients[base] = c
+    return c
+
+
+async def aclose_async_clients() -> None:
+    """Close the async clients that belong to the running event loop."""
+    clients = _async_clients.pop(asyncio.get_running_loop(), {})
+    for c in clients.values():
+        try:
+            await c.aclose()
+        except Exception:
+            pass
+
+
+def _async_timeout(read_s: float):
+    connect_s, read_s = _timeout(read_s)
+    return httpx.Timeout(read_s, connect=connect_s)
+
+
+# --- Request scheduler ---
+
+# Several interview sessions share one Ollama box. Without coordination the
+# server queues their requests in arbitrary order and, when sessions use
+# different models, keeps swapping weights in and out. Every generation goes
+# through one process-wide scheduler that caps in-flight requests per host and
+# per (host, model), admits waiters in FIFO order, and prefers waiters for the
+# model the host is already serving. A waiter can be passed over only
+# SCHED_MAX_SKIPS times, so batching never starves anyone.
+SCHED_PER_HOST = int(os.getenv("OLLAMA_SCHED_PER_HOST", "2"))
+SCHED_PER_MODEL = int(os.getenv("OLLAMA_SCHED_PER_MODEL", "0"))  # 0 = same as per-host
+SCHED_TIMEOUT_S = float(os.getenv("OLLAMA_SCHED_TIMEOUT", "120"))
+SCHED_MAX_SKIPS = int(os.getenv("OLLAMA_SCHED_MAX_SKIPS", "4"))
+
+
+class SchedulerTimeout(TimeoutError):
+    """Raised when a request was not admitted within the admission timeout."""
+
+
+@dataclass
+class Ticket:
+    host: str
+    model: str
+    seq: int
+    queued_at: float
+    admitted_at: float = 0.0
+    skipped: int = 0
+    admitted: bool = False
+    # Async waiters: (loop, asyncio.Event) set whenever the queue changes
+    wake: Any = field(default=None, repr=False, compare=False)
+
+    @property
+    def waited_s(self) -> float:
+        return max(0.0, self.admitted_at - self.queued_at)
+
+
+class RequestScheduler:
+    """FIFO admission with per-host/per-model caps and same-model batching.
+
+    ``acquire`` blocks until the request may run and returns a ``Ticket`` that
+    must be passed to ``release``; ``slot`` wraps both as a context manager.
+    ``on_position`` is called on the waiting thread with the 1-based queue
+    position whenever it changes, and with 0 once admitted.
+    """
+
+    def __init__(
+        self,
+        per_host: int = SCHED_PER_HOST,
+        per_model: int = SCHED_PER_MODEL,
+        timeout_s: float = SCHED_TIMEOUT_S,
+        max_skips: int = SCHED_MAX_SKIPS,
+    ) -> None:
+        self.per_host = max(1, int(per_host))
+        self.per_model = max(1, int(per_model)) if per_model else self.per_host
+        self.timeout_s = float(timeout_s)
+        self.max_skips = max(0, int(max_skips))
+        self._cond = threading.Condition()
+        self._seq = 0
+        self._waiting: List[Ticket] = []
+        self._running: Dict[str, List[Ticket]] = {}
+        self._last_model: Dict[str, str] = {}
+
+    def acquire(
+        self,
+        host: Optional[str],
+        model: str,
+        on_position: Optional[Callable[[int], None]] = None,
+        timeout_s: Optional[float] = None,
+    ) -> Ticket:
+        h = _base_url(host)
+        timeout = self.timeout_s if timeout_s is None else float(timeout_s)
+        with self._cond:
+            self._seq += 1
+            t = Ticket(h, model, self._seq, time.monotonic())
+            self._waiting.append(t)
+            self._dispatch_locked(h)
+        deadline = t.queued_at + timeout if timeout > 0 else None
+        last_pos = -1
+        while True:
+            with self._cond:
+                if not t.admitted:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        self._waiting.remove(t)
+                        self._dispatch_locked(h)
+                        raise SchedulerTimeout(
+                            f"Waited {timeout:g}s for a free slot on {h} ({model}); server is busy"
+                        )
+                    self._cond.wait(0.5 if remaining is None else min(0.5, remaining))
+                pos = 0 if t.admitted else self._position_locked(t)
+            # Callbacks run outside the lock, on the caller's own thread
+            if on_position is not None and pos != last_pos:
+                try:
+                    on_position(pos)
+                except Exception:
+                    pass
+            last_pos = pos
+            if pos == 0:
+                return t
+
+    def release(self, t: Ticket) -> None:
+        with self._cond:
+            running = self._running.get(t.host, [])
+            if t in running:
+                running.remove(t)
+            self._dispatch_locked(t.host)
+
+    @contextmanager
+    def slot(
+        self,
+        host: Optional[str],
+        model: str,
+        on_position: Optional[Callable[[int], None]] = None,
+        timeout_s: Optional[float] = None,
+    ) -> Iterator[Ticket]:
+        t = self.acquire(host, model, on_position, timeout_s)
+        try:
+            yield t
+        finally:
+            self.release(t)
+
+    async def aacquire(
+        self,
+        host: Optional[str],
+        model: str,
+        on_position: Optional[Callable[[int], None]] = None,
+        timeout_s: Optional[float] = None,
+    ) -> Ticket:
+        """``acquire`` for coroutines: waits on the event loop, not on a thread.
+
+        A cancelled or timed-out waiter leaves the queue (or gives back a slot
+        it was granted in the meantime).
+        """
+        h = _base_url(host)
+        timeout = self.timeout_s if timeout_s is None else float(timeout_s)
+        wake = asyncio.Event()
+        with self._cond:
+            self._seq += 1
+            t = Ticket(h, model, self._seq, time.monotonic(), wake=(asyncio.get_running_loop(), wake))
+            self._waiting.append(t)
+            self._dispatch_locked(h)
+        deadline = t.queued_at + timeout if timeout > 0 else None
+        last_pos = -1
+        try:
+            while True:
+                with self._cond:
+                    pos = 0 if t.admitted else self._position_locked(t)
+                    # Cleared under the lock: a dispatch after this point sets it again
+                    wake.clear()
+                if on_position is not None and pos != last_pos:
+                    try:
+                        on_position(pos)
+                    except Exception:
+                        pass
+                last_pos = pos
+                if pos == 0:
+                    return t
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise SchedulerTimeout(f"Waited {timeout:g}s for a free slot on {h} ({model}); server is busy")
+                try:
+                    await asyncio.wait_for(wake.wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
+        except BaseException:
+            with self._cond:
+                if t in self._waiting:
+                    self._waiting.remove(t)
+                elif t in self._running.get(h, []):
+                    self._running[h].remove(t)
+                self._dispatch_locked(h)
+            raise
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._cond:
+            hosts = set(self._running) | {t.host for t in self._waiting}
+            return {
+                h: {
+                    "running": len(self._running.get(h, [])),
+                    "waiting": sum(1 for t in self._waiting if t.host == h),
+                    "models": sorted({t.model for t in self._running.get(h, [])}),
+                    "last_model": self._last_model.get(h, ""),
+                }
+                for h in hosts
+            }
+
+    def _position_locked(self, t: Ticket) -> int:
+        pos = 0
+        for w in self._waiting:
+            if w.host == t.host:
+                pos += 1
+            if w is t:
+                return pos
+        return 0
+
+    def _dispatch_locked(self, host: str) -> None:
+        running = self._running.setdefault(host, [])
+        while len(running) < self.per_host:
+            eligible = [
+                w for w in self._waiting
+                if w.host == host and sum(1 for r in running if r.model == w.model) < self.per_model
+            ]
+            if not eligible:
+                break
+            pick = eligible[0]
+            # Batch by model: while the host is serving a model, let its waiters
+            # go ahead of a request that would force a swap, within the skip budget.
+            serving = {r.model for r in running} or {self._last_model.get(host, "")}
+            if pick.model not in serving and pick.skipped < self.max_skips:
+                same = next((w for w in eligible if w.model in serving), None)
+                if same is not None:
+                    for w in eligible:
+                        if w is same:
+                            break
+                        w.skipped += 1
+                    pick = same
+            self._waiting.remove(pick)
+            pick.admitted = True
+            pick.admitted_at = time.monotonic()
+            running.append(pick)
+            self._last_model[host] = pick.model
+        # Wake everyone: admitted waiters return, the rest report their new position
+        self._cond.notify_all()
+        for t in self._waiting + running:
+            if t.wake is not None and t.host == host:
+                loop, ev = t.wake
+                try:
+                    loop.call_soon_threadsafe(ev.set)
+                except RuntimeError:  # loop already closed
+                    pass
+
+
+_scheduler = RequestScheduler()
+
+
+def get_scheduler() -> RequestScheduler:
+    """The process-wide scheduler every OllamaLLM request goes through."""
+    return _scheduler
+
+
+def scheduler_stats() -> Dict[str, Dict[str, Any]]:
+    return _scheduler.stats()
+
+
+# --- Host pool ---
+
+# An OllamaLLM may be given several hosts. Each request goes to the best
+# healthy host: one that already has the model resident (GET /api/ps), then
+# one that has it installed, then the least loaded by scheduler counts. Hosts
+# that fail a request are backed off exponentially and skipped until the
+# backoff expires and the cached health probe (ollama_status) reports them up.
+HOST_BACKOFF_S = float(os.getenv("OLLAMA_HOST_BACKOFF", "2"))
+HOST_BACKOFF_MAX_S = float(os.getenv("OLLAMA_HOST_BACKOFF_MAX", "60"))
+
+
+def parse_hosts(value: Optional[Any]) -> List[str]:
+    """Normalize a host list given as a list or a comma/space separated string."""
+    if not value:
+        return []
+    items = value if isinstance(value, (list, tuple)) else str(value).replace(",", " ").split()
+    out: List[str] = []
+    for h in items:
+        h = _base_url(str(h).strip()) if str(h).strip() else ""
+        if h and h not in out:
+            out.append(h)
+    return out
+
+
+@dataclass
+class HostHealth:
+    failures: int = 0
+    backoff_until: float = 0.0
+    last_error: str = ""
+    loaded: List[str] = field(default_factory=list)  # resident models from /api/ps
+    loaded_at: float = 0.0
+    ps: List[Dict[str, Any]] = field(default_factory=list)  # raw /api/ps entries (expires_at, size, ...)
+
+
+class HostPool:
+    def __init__(self) -> None:
+        self._health: Dict[str, HostHealth] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, host: str) -> HostHealth:
+        return self._health.setdefault(host, HostHealth())
+
+    def is_available(self, host: str) -> bool:
+        h = _base_url(host)
+        with self._lock:
+            if time.monotonic() < self._get(h).backoff_until:
+                return False
+        return ollama_status(h).ok
+
+    def loaded_models(self, host: str) -> List[str]:
+        h = _base_url(host)
+        with self._lock:
+            st = self._get(h)
+            if time.monotonic() - st.loaded_at < STATUS_TTL_S:
+                return list(st.loaded)
+        entries = ollama_loaded_models(h)
+        names = [m.get("name", "") for m in entries]
+        with self._lock:
+            st.loaded, st.loaded_at, st.ps = names, time.monotonic(), entries
+        return names
+
+    def resident(self, host: str) -> Dict[str, Dict[str, Any]]:
+        """Resident models with their /api/ps entry ({} if only known from a request)."""
+        names = self.loaded_models(host)
+        with self._lock:
+            by_name = {m.get("name"): m for m in self._get(_base_url(host)).ps}
+        return {n: dict(by_name.get(n) or {}) for n in names}
+
+    def rank(self, hosts: List[str], model: str) -> List[str]:
+        """Hosts in the order requests should try them; backed-off hosts go last."""
+        sched = get_scheduler().stats()
+        scored = []
+        for i, h in enumerate(parse_hosts(hosts)):
+            up = self.is_available(h)
+            loaded = up and model in self.loaded_models(h)
+            installed = up and model in ollama_status(h).models
+            load = sched.get(h, {})
+            busy = load.get("running", 0) + load.get("waiting", 0)
+            scored.append(((not up, not loaded, not installed, busy, i), h))
+        return [h for _, h in sorted(scored)]
+
+    def mark_success(self, host: str, model: str) -> None:
+        h = _base_url(host)
+        with self._lock:
+            st = self._get(h)
+            st.failures, st.backoff_until, st.last_error = 0, 0.0, ""
+            if model and model not in st.loaded:
+                st.loaded.append(model)
+
+    def mark_failure(self, host: str, err: Any) -> None:
+        h = _base_url(host)
+        with self._lock:
+            st = self._get(h)
+            st.failures += 1
+            st.backoff_until = time.monotonic() + min(HOST_BACKOFF_MAX_S, HOST_BACKOFF_S * 2 ** (st.failures - 1))
+            st.last_error = str(err)
+            st.loaded, st.loaded_at, st.ps = [], 0.0, []
+        invalidate_ollama_status(h)
+        warn(f"Ollama host {h} failed ({err}); backing off")
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                h: {
+                    "failures": st.failures,
+                    "backoff_s": round(max(0.0, st.backoff_until - now), 1),
+                    "last_error": st.last_error,
+                    "loaded": list(st.loaded),
+                }
+                for h, st in self._health.items()
+            }
+
+
+_host_pool = HostPool()
+
+
+def get_host_pool() -> HostPool:
+    return _host_pool
+
+
+def host_pool_stats() -> Dict[str, Dict[str, Any]]:
+    return _host_pool.stats()
+
+
+def resident_models(host: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """Models loaded on ``host`` (GET /api/ps, cached for STATUS_TTL_S)."""
+    return _host_pool.resident(_base_url(host))
+
+
+def _failover_reason(e: BaseException) -> Optional[str]:
+    """'down' if another host should be tried and this one backed off,
+    'missing' if only this host lacks the model, None if retrying won't help."""
+    if requests is not None:
+        if isinstance(e, (requests.ConnectionError, requests.Timeout)):
+            return "down"
+        if isinstance(e, requests.HTTPError) and e.response is not None:
+            code = e.response.status_code
+            return "down" if code >= 500 else "missing" if code == 404 else None
+    if httpx is not None:
+        if isinstance(e, httpx.TransportError):
+            return "down"
+        if isinstance(e, httpx.HTTPStatusError):
+            code = e.response.status_code
+            return "down" if code >= 500 else "missing" if code == 404 else None
+    return None
+
+
+def flatten_messages(messages: List[Dict[str, str]]) -> Tuple[str, str]:
+    """Collapse chat messages into a (system, prompt) pair for /api/generate.
+
+    Used as the fallback for backends without a native chat endpoint.
+    """
+    system_parts: list[str] = []
+    parts: list[str] = []
+    for m in messages:
+        r = m.get("role")
+        c = (m.get("content") or "").strip()
+        if not c:
+            continue
+        if r == "system":
+            system_parts.append(c)
+        elif r == "assistant":
+            parts.append(f"Interviewer: {c}")
+        else:
+            parts.append(f"Candidate: {c}")
+    parts.append("Respond as the Interviewer with the next single question only.")
+    return "\n".join(system_parts), "\n".join(parts)
+
+
+# Streaming calls take ``on_queue``: called with the request's queue position
+# while a scheduler holds it back (0 once it runs). Backends without a queue
+# ignore it.
+QueueCallback = Callable[[int], None]
+
 
 class LLM:
     def generate_reply(self, system_prompt: str, user_text: str) -> str:  # pragma: no cover - interface only
         raise NotImplementedError
-    def stream_reply(self, system_prompt: str, user_text: str) -> Iterator[str]:  # pragma: no cover - interface only
+    def stream_reply(
+        self, system_prompt: str, user_text: str, on_queue: Optional[QueueCallback] = None
+    ) -> Iterator[str]:  # pragma: no cover - interface only
         raise NotImplementedError
 
+    def chat_reply(self, messages: List[Dict[str, str]]) -> str:
+        system_prompt, user_text = flatten_messages(messages)
+        return self.generate_reply(system_prompt, user_text)
+
+    def stream_chat(self, messages: List[Dict[str, str]], on_queue: Optional[QueueCallback] = None) -> Iterator[str]:
+        system_prompt, user_text = flatten_messages(messages)
+        return self.stream_reply(system_prompt, user_text, on_queue)
+
+    # Async interface. The defaults run the blocking call on a worker thread so
+    # every backend is usable from asyncio; backends override with native I/O.
+
+    async def agenerate_reply(self, system_prompt: str, user_text: str) -> str:
+        return await asyncio.to_thread(self.generate_reply, system_prompt, user_text)
+
+    def astream_reply(
+        self, system_prompt: str, user_text: str, on_queue: Optional[QueueCallback] = None
+    ) -> AsyncIterator[str]:
+        return _athreaded(lambda: self.stream_reply(system_prompt, user_text, on_queue))
+
+    async def achat_reply(self, messages: List[Dict[str, str]]) -> str:
+        return await asyncio.to_thread(self.chat_reply, messages)
+
+    def astream_chat(self, messages: List[Dict[str, str]], on_queue: Optional[QueueCallback] = None) -> AsyncIterator[str]:
+        return _athreaded(lambda: self.stream_chat(messages, on_queue))
+
+
+_END = object()
+
+
+async def _athreaded(make_iter: Callable[[], Iterator[str]]) -> AsyncIterator[str]:
+    """Drive a blocking iterator from a worker thread, one item at a time."""
+    it = await asyncio.to_thread(make_iter)
+    try:
+        while True:
+            item = await asyncio.to_thread(next, it, _END)
+            if item is _END:
+                return
+            yield item
+    finally:
+        close = getattr(it, "close", None)
+        if close:
+            await asyncio.to_thread(close)
+
+
+def _parse_ndjson_line(line: Any) -> Optional[Dict[str, Any]]:
+    if not line:
+        return None
+    try:
+        j = json.loads(line)
+    except Exception:
+        return None
+    return j if isinstance(j, dict) else None
+
+
+def _iter_ndjson(r) -> Iterator[Dict[str, Any]]:
+    """Yield decoded JSON objects from a streaming NDJSON response."""
+    for line in r.iter_lines(decode_unicode=True):
+        j = _parse_ndjson_line(line)
+        if j is not None:
+            yield j
+
+
+async def _aiter_ndjson(r) -> AsyncIterator[Dict[str, Any]]:
+    """Async twin of _iter_ndjson for an httpx streaming response."""
+    async for line in r.aiter_lines():
+        j = _parse_ndjson_line(line)
+        if j is not None:
+            yield j
+
+
+def _chunk_text(j: Dict[str, Any]) -> str:
+    """Text delta from either a /api/generate or an /api/chat stream line."""
+    chunk = j.get("response")
+    if chunk is None:
+        msg = j.get("message")
+        chunk = msg.get("content") if isinstance(msg, dict) else None
+    return chunk if isinstance(chunk, str) else ""
+
+
+class LLMStream:
+    """Text chunks of one streamed request, plus what the request cost.
+
+    ``stats`` receives the scheduler wait (llm_queue_s) and the server timings
+    from the final stream line (see _server_stats); ``host`` is the server that
+    answered. Both belong to this request only, so streams running at the same
+    time on one client never see each other's numbers. ``cut`` is True when
+    stop_when ended the stream; its token counts are then client-side.
+    """
+
+    def __init__(self, make: Callable[["LLMStream"], Iterator[str]]) -> None:
+        self.stats: Dict[str, float] = {}
+        self.host = ""
+        self.cut = False
+        self._drain: Optional[threading.Thread] = None
+        self._chunks = make(self)
+
+    def __iter__(self) -> "LLMStream":
+        return self
+
+    def __next__(self) -> str:
+        return next(self._chunks)
+
+    def close(self) -> None:
+        self._chunks.close()
+
+    def wait(self, timeout: Optional[float] = None) -> Dict[str, float]:
+        """``stats`` once the background read of a cut stream (STOP_DRAIN_S) is over."""
+        if self._drain is not None:
+            self._drain.join(timeout)
+        return self.stats
+
+
+class AsyncLLMStream:
+    """Async twin of LLMStream."""
+
+    def __init__(self, make: Callable[["AsyncLLMStream"], AsyncIterator[str]]) -> None:
+        self.stats: Dict[str, float] = {}
+        self.host = ""
+        self.cut = False
+        self._drain: Optional["asyncio.Future[None]"] = None
+        self._chunks = make(self)
+
+    def __aiter__(self) -> "AsyncLLMStream":
+        return self
+
+    async def __anext__(self) -> str:
+        return await self._chunks.__anext__()
+
+    async def aclose(self) -> None:
+        await self._chunks.aclose()
+
+    async def wait(self, timeout: Optional[float] = None) -> Dict[str, float]:
+        if self._drain is not None:
+            try:
+                await asyncio.wait_for(asyncio.shield(self._drain), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return self.stats
+
+
+def _server_stats(j: Dict[str, Any]) -> Dict[str, float]:
+    """Timings Ollama reports on the final (done) line; durations are in ns.
+
+    A stream cut by ``stop_when`` never gets this line (see STOP_DRAIN_S).
+    """
+    ns = 1e9
+    out: Dict[str, float] = {}
+    if isinstance(j.get("eval_count"), (int, float)):
+        out["llm_tokens"] = float(j["eval_count"])
+    if isinstance(j.get("eval_duration"), (int, float)) and j["eval_duration"]:
+        out["llm_eval_s"] = j["eval_duration"] / ns
+        if "llm_tokens" in out:
+            out["llm_tokens_per_sec"] = out["llm_tokens"] / out["llm_eval_s"]
+    if isinstance(j.get("prompt_eval_count"), (int, float)):
+        out["llm_prompt_tokens"] = float(j["prompt_eval_count"])
+    if isinstance(j.get("prompt_eval_duration"), (int, float)):
+        out["llm_prompt_eval_s"] = j["prompt_eval_duration"] / ns
+    if isinstance(j.get("load_duration"), (int, float)):
+        out["llm_load_s"] = j["load_duration"] / ns
+    return out
+
+
+class _StreamAttempt:
+    """One streamed request to one host, as both transports see it.
+
+    requests (_stream_from) and httpx (_astream_from) only move lines; what a
+    line means, when stop_when ends the stream, the scheduler ticket and the
+    stats on the LLMStream/AsyncLLMStream all live here.
+    """
+
+    def __init__(self, llm: "OllamaLLM", host: str, out: Any, ticket: Optional[Ticket]) -> None:
+        self.stop_when = llm.stop_when
+        self.out = out
+        self.ticket = ticket
+        self.parts: List[str] = []
+        self.t_first: Optional[float] = None
+        self.deadline = 0.0
+        out.stats, out.host, out.cut = {}, host, False
+        if ticket is not None:
+            out.stats["llm_queue_s"] = ticket.waited_s
+
+    def feed(self, j: Dict[str, Any]) -> str:
+        """Text delta of a stream line ('' if none); the final line's timings go to stats."""
+        if j.get("done"):
+            self.out.stats.update(_server_stats(j))
+        chunk = _chunk_text(j)
+        if chunk and self.t_first is None:
+            self.t_first = time.perf_counter()
+        return chunk
+
+    def should_stop(self, chunk: str) -> bool:
+        if self.stop_when is None:
+            return False
+        self.parts.append(chunk)
+        if not self.stop_when("".join(self.parts)):
+            return False
+        # No final line from the server: count what was received (one chunk per token)
+        n = len(self.parts)
+        self.out.cut = True
+        self.out.stats["llm_tokens"] = float(n)
+        gen_s = time.perf_counter() - (self.t_first or time.perf_counter())
+        if n > 1 and gen_s > 0:
+            self.out.stats["llm_tokens_per_sec"] = (n - 1) / gen_s
+        self.deadline = time.monotonic() + STOP_DRAIN_S
+        return True
+
+    def tail(self, j: Dict[str, Any]) -> bool:
+        """A line read past stop_when (see STOP_DRAIN_S); True when reading should end.
+        Only prompt and load timings are kept: the eval numbers include the discarded tail."""
+        if j.get("done"):
+            for k, v in _server_stats(j).items():
+                if k.startswith("llm_prompt") or k == "llm_load_s":
+                    self.out.stats.setdefault(k, v)
+            return True
+        return time.monotonic() > self.deadline
+
+    def release(self) -> None:
+        if self.ticket is not None:
+            get_scheduler().release(self.ticket)
+            self.ticket = None
+
+
+def _drain(call: _StreamAttempt, lines: Iterator[Dict[str, Any]], r: Any) -> None:
+    try:
+        for j in lines:
+            if call.tail(j):
+                break
+    except Exception as e:
+        debug(f"Stopped reading the rest of a cut stream from {call.out.host}: {e}")
+    finally:
+        r.close()
+
+
+async def _adrain(call: _StreamAttempt, lines: AsyncIterator[Dict[str, Any]], r: Any) -> None:
+    try:
+        async for j in lines:
+            if call.tail(j):
+                break
+    except Exception as e:
+        debug(f"Stopped reading the rest of a cut stream from {call.out.host}: {e}")
+    finally:
+        await r.aclose()
+
 
 @dataclass
 class OllamaLLM(LLM):
     model: str = "llama3"
     host: str = os.getenv("OLLAMA_HOST", "http://localhost:11434")
     req_timeout: int = int(os.getenv("OLLAMA_TIMEOUT", "600"))  # seconds
+    keep_alive: Optional[str] = DEFAULT_KEEP_ALIVE  # how long the server keeps the model resident after a call
+    options: Dict[str, Any] = field(default_factory=dict)  # extra Ollama options (temperature, num_ctx, ...)
+    stop: Optional[List[str]] = None  # server-side stop sequences
+    num_predict: Optional[int] = None  # server-side cap on generated tokens
+    # Client-side cutoff: called with the accumulated text after each chunk; when
+    # it returns True the stream ends for the caller (see STOP_DRAIN_S).
+    stop_when: Optional[Callable[[str], bool]] = None
+    # Admission through the process-wide RequestScheduler; on_queue is the
+    # default queue-position callback for calls that don't pass their own.
+    scheduled: bool = True
+    on_queue: Optional[QueueCallback] = field(default=None, repr=False, compare=False)
+
+    # Optional extra hosts; with more than one, each request is routed by the
+    # HostPool and fails over to the next host if it cannot start streaming.
+    hosts: List[str] = field(default_factory=list)
 
-    def _generate(self, payload: Dict[str, Any]) -> str:
+    def _all_hosts(self) -> List[str]:
+        return parse_hosts([self.host] + list(self.hosts or []))
+
+    def _route(self) -> List[str]:
+        hosts = self._all_hosts()
+        return get_host_pool().rank(hosts, self.model) if len(hosts) > 1 else hosts
+
+    @contextmanager
+    def _slot(self, host: str, on_queue: Optional[QueueCallback]) -> Iterator[Optional[Ticket]]:
+        if not self.scheduled:
+            yield None
+            return
+        with get_scheduler().slot(host, self.model, on_queue or self.on_queue) as t:
+            yield t
+
+    def _options(self) -> Dict[str, Any]:
+        opts: Dict[str, Any] = {"temperature": 0.7}
+        opts.update(self.options or {})
+        if self.stop:
+            opts["stop"] = list(self.stop)
+        if self.num_predict is not None:
+            opts["num_predict"] = int(self.num_predict)
+        return opts
+
+    def _generate(self, payload: Dict[str, Any], endpoint: str = "/api/generate") -> str:
         if requests is None:
             raise RuntimeError("'requests' package not installed; required for Ollama backend")
-        url = f"{self.host.rstrip('/')}/api/generate"
         # Prefer streaming to avoid long read timeouts during initial load
         if payload.get("stream", True):
-            r = requests.post(url, json=payload, stream=True, timeout=self.req_timeout)
-            r.raise_for_status()
-            parts: list[str] = []
-            for line in r.iter_lines(decode_unicode=True):
-                if not line:
-                    continue
-                try:
-                    j = json.loads(line)
-                except Exception:
-                    continue
-                if "response" in j and isinstance(j["response"], str):
-                    parts.append(j["response"])
-            return "".join(parts)
+            return "".join(self._open(payload, endpoint, None))
         else:
-            r = requests.post(url, json=payload, timeout=self.req_timeout)
+            host = self._route()[0]
+            with self._slot(host, None):
+                r = get_session(host).post(f"{host}{endpoint}", json=payload, timeout=_timeout(self.req_timeout))
             r.raise_for_status()
             data = r.json()
-            if isinstance(data, dict) and "response" in data:
-                return data.get("response", "")
+            if isinstance(data, dict):
+                return _chunk_text(data)
             if isinstance(data, list):
-                return "".join(chunk.get("response", "") for chunk in data)
+                return "".join(_chunk_text(chunk) for chunk in data if isinstance(chunk, dict))
             return ""
 
-    def generate_reply(self, system_prompt: str, user_text: str) -> str:
-        payload = {
+    def _failed(self, host: str, e: BaseException, started: bool, last: bool) -> bool:
+        """Record a failed attempt; True if the request should move to the next host."""
+        reason = _failover_reason(e)
+        pooled = len(self._all_hosts()) > 1
+        if pooled and reason == "down":
+            get_host_pool().mark_failure(host, e)
+        # Text already reached the caller: a retry elsewhere would repeat it
+        return pooled and not started and not last and reason is not None
+
+    def _open(self, payload: Dict[str, Any], endpoint: str, on_queue: Optional[QueueCallback]) -> LLMStream:
+        return LLMStream(lambda out: self._stream(payload, endpoint, out, on_queue))
+
+    def _aopen(self, payload: Dict[str, Any], endpoint: str, on_queue: Optional[QueueCallback]) -> AsyncLLMStream:
+        return AsyncLLMStream(lambda out: self._astream(payload, endpoint, out, on_queue))
+
+    def _stream(
+        self, payload: Dict[str, Any], endpoint: str, out: LLMStream, on_queue: Optional[QueueCallback]
+    ) -> Iterator[str]:
+        if requests is None:
+            raise RuntimeError("'requests' package not installed; required for Ollama backend")
+        hosts = self._route()
+        for i, host in enumerate(hosts):
+            started = False
+            try:
+                for chunk in self._stream_from(host, payload, endpoint, out, on_queue):
+                    started = True
+                    yield chunk
+            except Exception as e:
+                if self._failed(host, e, started, i == len(hosts) - 1):
+                    continue
+                raise
+            if len(hosts) > 1:
+                get_host_pool().mark_success(host, self.model)
+            return
+
+    def _stream_from(
+        self, host: str, payload: Dict[str, Any], endpoint: str, out: LLMStream, on_queue: Optional[QueueCallback]
+    ) -> Iterator[str]:
+        ticket = get_scheduler().acquire(host, self.model, on_queue or self.on_queue) if self.scheduled else None
+        call = _StreamAttempt(self, host, out, ticket)
+        r = None
+        try:
+            r = get_session(host).post(f"{host}{endpoint}", json=payload, stream=True, timeout=_timeout(self.req_timeout))
+            r.raise_for_status()
+            lines = _iter_ndjson(r)
+            for j in lines:
+                chunk = call.feed(j)
+                if not chunk:
+                    continue
+                yield chunk
+                if call.should_stop(chunk):
+                    if STOP_DRAIN_S > 0:
+                        call.release()
+                        out._drain = threading.Thread(target=_drain, args=(call, lines, r), name="ollama-drain", daemon=True)
+                        out._drain.start()
+                        r = None
+                    return
+        finally:
+            if r is not None:
+                r.close()
+            call.release()
+
+    async def _astream(
+        self, payload: Dict[str, Any], endpoint: str, out: AsyncLLMStream, on_queue: Optional[QueueCallback]
+    ) -> AsyncIterator[str]:
+        hosts = await asyncio.to_thread(self._route)
+        for i, host in enumerate(hosts):
+            started = False
+            try:
+                async for chunk in self._astream_from(host, payload, endpoint, out, on_queue):
+                    started = True
+                    yield chunk
+            except Exception as e:
+                if self._failed(host, e, started, i == len(hosts) - 1):
+                    continue
+                raise
+            if len(hosts) > 1:
+                get_host_pool().mark_success(host, self.model)
+            return
+
+    async def _astream_from(
+        self, host: str, payload: Dict[str, Any], endpoint: str, out: AsyncLLMStream, on_queue: Optional[QueueCallback]
+    ) -> AsyncIterator[str]:
+        # Closing the response (stop_when, task cancellation or the consumer
+        # closing the generator) makes Ollama abort the generation.
+        ticket = await get_scheduler().aacquire(host, self.model, on_queue or self.on_queue) if self.scheduled else None
+        call = _StreamAttempt(self, host, out, ticket)
+        r = None
+        try:
+            client = get_async_client(host)
+            req = client.build_request("POST", endpoint, json=payload, timeout=_async_timeout(self.req_timeout))
+            r = await client.send(req, stream=True)
+            r.raise_for_status()
+            lines = _aiter_ndjson(r)
+            async for j in lines:
+                chunk = call.feed(j)
+                if not chunk:
+                    continue
+                yield chunk
+                if call.should_stop(chunk):
+                    if STOP_DRAIN_S > 0:
+                        call.release()
+                        out._drain = asyncio.ensure_future(_adrain(call, lines, r))
+                        r = None
+                    return
+        finally:
+            if r is not None:
+                await r.aclose()
+            call.release()
+
+    def _generate_payload(self, system_prompt: str, user_text: str) -> Dict[str, Any]:
+        return {
             "model": self.model,
             "system": system_prompt,
             "prompt": user_text,
             "stream": True,
-            "options": {
-                "temperature": 0.7,
-            },
+            "keep_alive": keep_alive_value(self.keep_alive),
+            "options": self._options(),
         }
-        try:
-            return self._generate(payload)
-        except Exception as e:
-            return f"[LLM error: {e}]"
 
-    def stream_reply(self, system_prompt: str, user_text: str) -> Iterator[str]:
-        if requests is None:
-            raise RuntimeError("'requests' package not installed; required for Ollama backend")
-        url = f"{self.host.rstrip('/')}/api/generate"
-        payload = {
+    def _chat_payload(self, messages: List[Dict[str, str]]) -> Dict[str, Any]:
+        # Send the conversation as structured messages. The server renders the
+        # same template prefix every turn, so its KV cache for earlier turns is
+        # reused and only the newest messages need prefill.
+        return {
             "model": self.model,
-            "system": system_prompt,
-            "prompt": user_text,
+            "messages": [{"role": m.get("role", "user"), "content": m.get("content", "")} for m in messages],
             "stream": True,
-            "options": {"temperature": 0.7},
+            "keep_alive": keep_alive_value(self.keep_alive),
+            "options": self._options(),
         }
-        with requests.post(url, json=payload, stream=True, timeout=self.req_timeout) as r:
-            r.raise_for_status()
-            for line in r.iter_lines(decode_unicode=True):
-                if not line:
-                    continue
-                try:
-                    j = json.loads(line)
-                except Exception:
-                    continue
-                chunk = j.get("response")
-                if isinstance(chunk, str) and chunk:
-                    yield chunk
+
+    def generate_reply(self, system_prompt: str, user_text: str) -> str:
+        try:
+            return self._generate(self._generate_payload(system_prompt, user_text))
+        except Exception as e:
+            return f"[LLM error: {e}]"
+
+    def stream_reply(self, system_prompt: str, user_text: str, on_queue: Optional[QueueCallback] = None) -> LLMStream:
+        return self._open(self._generate_payload(system_prompt, user_text), "/api/generate", on_queue)
+
+    def chat_reply(self, messages: List[Dict[str, str]]) -> str:
+        try:
+            return self._generate(self._chat_payload(messages), endpoint="/api/chat")
+        except Exception as e:
+            return f"[LLM error: {e}]"
+
+    def stream_chat(self, messages: List[Dict[str, str]], on_queue: Optional[QueueCallback] = None) -> LLMStream:
+        return self._open(self._chat_payload(messages), "/api/chat", on_queue)
+
+    # Native async path (httpx). Without httpx the base-class thread fallback is used.
+
+    async def agenerate_reply(self, system_prompt: str, user_text: str) -> str:
+        if httpx is None:
+            return await super().agenerate_reply(system_prompt, user_text)
+        try:
+            return "".join([c async for c in self._aopen(self._generate_payload(system_prompt, user_text), "/api/generate", None)])
+        except Exception as e:
+            return f"[LLM error: {e}]"
+
+    def astream_reply(
+        self, system_prompt: str, user_text: str, on_queue: Optional[QueueCallback] = None
+    ) -> AsyncIterator[str]:
+        if httpx is None:
+            return super().astream_reply(system_prompt, user_text, on_queue)
+        return self._aopen(self._generate_payload(system_prompt, user_text), "/api/generate", on_queue)
+
+    async def achat_reply(self, messages: List[Dict[str, str]]) -> str:
+        if httpx is None:
+            return await super().achat_reply(messages)
+        try:
+            return "".join([c async for c in self._aopen(self._chat_payload(messages), "/api/chat", None)])
+        except Exception as e:
+            return f"[LLM error: {e}]"
+
+    def astream_chat(self, messages: List[Dict[str, str]], on_queue: Optional[QueueCallback] = None) -> AsyncIterator[str]:
+        if httpx is None:
+            return super().astream_chat(messages, on_queue)
+        return self._aopen(self._chat_payload(messages), "/api/chat", on_queue)
 
 
-def create_llm(backend: str, model: str, host: Optional[str] = None, timeout_s: Optional[int] = None) -> LLM:
+def create_llm(
+    backend: str,
+    model: str,
+    host: Optional[str] = None,
+    timeout_s: Optional[int] = None,
+    keep_alive: Optional[str] = None,
+    options: Optional[Dict[str, Any]] = None,
+    stop: Optional[List[str]] = None,
+    num_predict: Optional[int] = None,
+    stop_when: Optional[Callable[[str], bool]] = None,
+    on_queue: Optional[QueueCallback] = None,
+    hosts: Optional[Any] = None,
+) -> LLM:
+    """Build the LLM client. ``host`` may be a comma separated list; ``hosts``
+    (or OLLAMA_HOSTS) adds more servers to route between."""
     backend = (backend or "").lower()
     if backend not in {"ollama", ""}:
         raise ValueError(f"Unsupported LLM backend: {backend}. Only 'ollama' is supported.")
+    pool = parse_hosts(host or os.getenv("OLLAMA_HOST", "http://localhost:11434"))
+    pool += [h for h in parse_hosts(hosts or os.getenv("OLLAMA_HOSTS")) if h not in pool]
     return OllamaLLM(
         model=model,
-        host=(host or os.getenv("OLLAMA_HOST", "http://localhost:11434")),
+        host=pool[0],
+        hosts=pool[1:],
         req_timeout=int(timeout_s or os.getenv("OLLAMA_TIMEOUT", "600")),
+        keep_alive=(keep_alive or DEFAULT_KEEP_ALIVE),
+        options=dict(options or {}),
+        stop=stop,
+        num_predict=num_predict,
+        stop_when=stop_when,
+        on_queue=on_queue,
     )
 
 
+# --- Model warm-up ---
+
+# Loading weights dominates the first request after a model switch or server
+# start. Warm-up issues an empty generate (which only loads the model) in the
+# background and asks the server to keep it resident for ``keep_alive``.
+
+
+@dataclass
+class WarmupState:
+    state: str = "idle"  # idle | waiting | loading | ready | error
+    started_at: float = 0.0
+    finished_at: float = 0.0
+    load_s: Optional[float] = None
+    keep_alive: Optional[str] = None
+    message: str = ""
+
+
+_warmups: Dict[Tuple[str, str], WarmupState] = {}
+_warmups_lock = threading.Lock()
+
+
+_DURATION_RE = re.compile(r"(\d+(?:\.\d*)?|\.\d+)(ns|us|\u00b5s|ms|s|m|h)")
+_DURATION_UNITS = {"ns": 1e-9, "us": 1e-6, "\u00b5s": 1e-6, "ms": 1e-3, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def keep_alive_value(value: Any) -> Any:
+    """keep_alive as the server wants it in a JSON body.
+
+    Ollama reads a JSON number as seconds and parses a string as a Go
+    duration, so "300" or "-1" typed into a text field must be sent as a
+    number; "30m" or "1h30m" stay strings.
+    """
+    if value is None or isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    s = str(value).strip()
+    try:
+        return int(s)
+    except ValueError:
+        pass
+    try:
+        n = float(s)
+    except ValueError:
+        return s
+    # "nan"/"inf" would be serialised as NaN/Infinity, which is not JSON
+    return n if math.isfinite(n) else s
+
+
+def keep_alive_seconds(value: Any) -> Optional[float]:
+    """Parse an Ollama keep_alive value ("30m", "1h30m", "90s", "300", "-1").
+
+    Returns None for "forever" (negative values) and for unparseable input.
+    """
+    v = keep_alive_value(value)
+    if isinstance(v, (int, float)):
+        return None if v < 0 else float(v)
+    s = (v or "").strip().lower()
+    sign = -1.0 if s.startswith("-") else 1.0
+    s = s.lstrip("+-")
+    if not s or _DURATION_RE.sub("", s):
+        return None
+    n = sign * sum(float(num) * _DURATION_UNITS[unit] for num, unit in _DURATION_RE.findall(s))
+    return None if n < 0 else n
+
+
+def warm_model(
+    model: str,
+    host: Optional[str] = None,
+    keep_alive: Optional[str] = None,
+    timeout_s: int = 600,
+    options: Optional[Dict[str, Any]] = None,
+) -> Tuple[bool, str]:
+    """Load ``model`` into memory without generating. Returns (ok, message).
+
+    ``options`` should match what later requests send: load-time options such
+    as num_thread or num_ctx differing from the loaded runner force a reload.
+    """
+    h = _base_url(host)
+    if requests is None:
+        return False, "requests not installed"
+    payload: Dict[str, Any] = {"model": model, "keep_alive": keep_alive_value(keep_alive or DEFAULT_KEEP_ALIVE)}
+    if options:
+        payload["options"] = dict(options)
+    try:
+        # Loading competes with interview requests for the server; queue like them
+        with get_scheduler().slot(h, model):
+            r = get_session(h).post(f"{h}/api/generate", json=payload, timeout=_timeout(timeout_s))
+        r.raise_for_status()
+        return True, f"{model} loaded"
+    except Exception as e:
+        return False, str(e)
+
+
+def warmup_status(model: str, host: Optional[str] = None) -> WarmupState:
+    with _warmups_lock:
+        st = _warmups.get((_base_url(host), model))
+        return WarmupState(**st.__dict__) if st else WarmupState()
+
+
+def _warmup_due_locked(cur: Optional[WarmupState], ka: str, now: float) -> bool:
+    if cur and cur.state in ("waiting", "loading"):
+        return False
+    if cur and cur.state == "ready" and cur.keep_alive == ka:
+        ka_s = keep_alive_seconds(ka)
+        return ka_s is not None and now - cur.finished_at >= max(60.0, ka_s / 2)
+    return True
+
+
+def warmup_due(model: str, host: Optional[str] = None, keep_alive: Optional[str] = None) -> bool:
+    """Whether start_warmup would issue a request now (no warm-up yet, a failed
+    one, or half of the keep_alive window has passed)."""
+    with _warmups_lock:
+        return _warmup_due_locked(_warmups.get((_base_url(host), model)), keep_alive or DEFAULT_KEEP_ALIVE, time.time())
+
+
+def start_warmup(
+    model: str,
+    host: Optional[str] = None,
+    keep_alive: Optional[str] = None,
+    wait_for_server_s: float = 0.0,
+    options: Optional[Dict[str, Any]] = None,
+) -> WarmupState:
+    """Warm ``model`` on a background thread; safe to call on every rerun.
+
+    A warm-up is skipped while one is in flight, and re-issued once half of the
+    keep_alive window has passed so the model stays resident.
+    """
+    if not model:
+        return WarmupState()
+    h = _base_url(host)
+    ka = keep_alive or DEFAULT_KEEP_ALIVE
+    key = (h, model)
+    now = time.time()
+    with _warmups_lock:
+        cur = _warmups.get(key)
+        if not _warmup_due_locked(cur, ka, now):
+            return WarmupState(**cur.__dict__)
+        st = WarmupState(state="waiting" if wait_for_server_s > 0 else "loading", started_at=now, keep_alive=ka)
+        _warmups[key] = st
+
+    def _update(**kw: Any) -> None:
+        with _warmups_lock:
+            for k, v in kw.items():
+                setattr(st, k, v)
+
+    def _run() -> None:
+        deadline = time.time() + wait_for_server_s
+        while wait_for_server_s > 0:
+            ok, _ = ollama_is_running(h)
+            if ok:
+                break
+            if time.time() > deadline:
+                _update(state="error", finished_at=time.time(), message="Ollama did not come up in time")
+                return
+            time.sleep(0.5)
+        _update(state="loading", message=f"Loading {model}...")
+        t0 = time.time()
+        ok, msg = warm_model(model, h, ka, options=options)
+        t1 = time.time()
+        if ok:
+            _update(state="ready", finished_at=t1, load_s=t1 - t0, message=msg)
+        else:
+            _update(state="error", finished_at=t1, message=msg)
+
+    threading.Thread(target=_run, name=f"ollama-warmup-{model}", daemon=True).start()
+    return WarmupState(**st.__dict__)
+
+
+def ollama_loaded_models(host: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Models currently resident on the server (GET /api/ps)."""
+    h = _base_url(host)
+    if requests is None:
+        return []
+    try:
+        r = get_session(h).get(f"{h}/api/ps", timeout=_timeout(3))
+        r.raise_for_status()
+        return [m for m in r.json().get("models", []) if isinstance(m, dict)]
+    except Exception:
+        return []
+
+
 # --- Ollama utilities ---
 
+def _invalidates_status(gen_fn):
+    """Invalidate cached server status once a pull/delete generator finishes."""
+
+    @functools.wraps(gen_fn)
+    def wrapper(*args, **kwargs):
+        try:
+            yield from gen_fn(*args, **kwargs)
+        finally:
+            invalidate_ollama_status()
+            clear_show_cache()
+
+    return wrapper
+
+
 def ollama_is_running(host: Optional[str] = None) -> Tuple[bool, str]:
     """Check if Ollama server is reachable.
     Returns (ok, message).
     """
-    h = (host or os.getenv("OLLAMA_HOST", "http://localhost:11434")).rstrip("/")
+    h = _base_url(host)
     if requests is None:
         return False, "requests not installed"
     try:
-        r = requests.get(f"{h}/api/tags", timeout=3)
+        r = get_session(h).get(f"{h}/api/tags", timeout=_timeout(3))
         r.raise_for_status()
         return True, "Ollama is running"
     except Exception as e:
@@ -140,11 +1355,11 @@ def ollama_is_running(host: Optional[str] = None) -> Tuple[bool, str]:
 
 def ollama_list_models(host: Optional[str] = None) -> List[str]:
     """List installed Ollama models by name (e.g., 'llama3', 'llama3:8b')."""
-    h = (host or os.getenv("OLLAMA_HOST", "http://localhost:11434")).rstrip("/")
+    h = _base_url(host)
     if requests is None:
         return []
     try:
-        r = requests.get(f"{h}/api/tags", timeout=10)
+        r = get_session(h).get(f"{h}/api/tags", timeout=_timeout(10))
         r.raise_for_status()
         data = r.json()
         models = []
@@ -157,9 +1372,201 @@ def ollama_list_models(host: Optional[str] = None) -> List[str]:
         return []
 
 
+# --- Cached server status ---
+
+# Every Streamlit rerun used to probe /api/tags twice (health + model list), each
+# with a multi-second timeout when the server is down. The status service does
+# one probe per host, caches it for OLLAMA_STATUS_TTL seconds, serves stale
+# values while a background thread refreshes hosts that were asked about
+# recently, and is invalidated explicitly after start/stop/pull/delete.
+STATUS_TTL_S = float(os.getenv("OLLAMA_STATUS_TTL", "5"))
+STATUS_IDLE_S = 120.0  # stop refreshing hosts nobody asked about for this long
+
+
+@dataclass
+class OllamaStatus:
+    ok: bool
+    message: str
+    models: List[str] = field(default_factory=list)
+    entries: List[Dict[str, Any]] = field(default_factory=list)  # raw /api/tags models (size, details, ...)
+    checked_at: float = 0.0
+
+
+def probe_ollama(host: Optional[str] = None, timeout_s: float = 3) -> OllamaStatus:
+    """Single GET /api/tags answering both "is it up?" and "what is installed?"."""
+    h = _base_url(host)
+    now = time.time()
+    if requests is None:
+        return OllamaStatus(False, "requests not installed", checked_at=now)
+    try:
+        r = get_session(h).get(f"{h}/api/tags", timeout=_timeout(timeout_s))
+        r.raise_for_status()
+        entries = [m for m in r.json().get("models", []) if isinstance(m, dict) and m.get("name")]
+        models = sorted(m["name"] for m in entries)
+        return OllamaStatus(True, "Ollama is running", models, entries, time.time())
+    except Exception as e:
+        return OllamaStatus(False, str(e), checked_at=time.time())
+
+
+class _StatusService:
+    def __init__(self, ttl_s: float = STATUS_TTL_S) -> None:
+        self.ttl_s = ttl_s
+        self._cache: Dict[str, OllamaStatus] = {}
+        self._last_asked: Dict[str, float] = {}
+        self._refreshing: set = set()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def get(self, host: Optional[str] = None, max_age: Optional[float] = None) -> OllamaStatus:
+        h = _base_url(host)
+        ttl = self.ttl_s if max_age is None else max_age
+        now = time.time()
+        with self._lock:
+            self._last_asked[h] = now
+            cur = self._cache.get(h)
+            self._ensure_refresher()
+        if cur is not None:
+            if now - cur.checked_at > ttl:
+                # Serve the stale value; refresh off the UI thread
+                self._refresh_async(h)
+            return cur
+        return self.refresh(h)
+
+    def refresh(self, host: Optional[str] = None) -> OllamaStatus:
+        h = _base_url(host)
+        st = probe_ollama(h)
+        with self._lock:
+            self._cache[h] = st
+        return st
+
+    def invalidate(self, host: Optional[str] = None) -> None:
+        with self._lock:
+            if host is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(_base_url(host), None)
+
+    def _refresh_async(self, h: str) -> None:
+        with self._lock:
+            if h in self._refreshing:
+                return
+            self._refreshing.add(h)
+
+        def _run() -> None:
+            try:
+                self.refresh(h)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(h)
+
+        threading.Thread(target=_run, name="ollama-status-refresh", daemon=True).start()
+
+    def _ensure_refresher(self) -> None:
+        # Called with self._lock held
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._loop, name="ollama-status", daemon=True)
+            self._thread.start()
+
+    def _loop(self) -> None:
+        while True:
+            time.sleep(max(0.5, self.ttl_s / 2))
+            now = time.time()
+            with self._lock:
+                hosts = [h for h, t in self._last_asked.items() if now - t < STATUS_IDLE_S]
+                due = [h for h in hosts if h not in self._cache or now - self._cache[h].checked_at > self.ttl_s / 2]
+            for h in due:
+                self._refresh_async(h)
+
+
+_status_service = _StatusService()
+
+
+def ollama_status(host: Optional[str] = None, max_age: Optional[float] = None) -> OllamaStatus:
+    """Cached health + installed models for ``host`` (see _StatusService)."""
+    return _status_service.get(host, max_age)
+
+
+def invalidate_ollama_status(host: Optional[str] = None) -> None:
+    """Drop cached status for ``host`` (all hosts if None); the next call probes."""
+    _status_service.invalidate(host)
+
+
+# --- Model info and context limits ---
+
+# POST /api/show is immutable per installed model, so answers are cached per
+# (host, model) until the model is pulled or deleted again.
+_show_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
+_show_lock = threading.Lock()
+
+# Context window Ollama uses when neither the request nor the Modelfile sets num_ctx
+SERVER_DEFAULT_NUM_CTX = int(os.getenv("OLLAMA_NUM_CTX", "2048"))
+
+
+def ollama_show(model: str, host: Optional[str] = None, timeout_s: float = 10) -> Dict[str, Any]:
+    """Model metadata from POST /api/show (cached); {} if unavailable."""
+    h = _base_url(host)
+    key = (h, model)
+    with _show_lock:
+        if key in _show_cache:
+            return _show_cache[key]
+    if requests is None or not model:
+        return {}
+    try:
+        r = get_session(h).post(f"{h}/api/show", json={"model": model}, timeout=_timeout(timeout_s))
+        r.raise_for_status()
+        data = r.json()
+    except Exception:
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    with _show_lock:
+        _show_cache[key] = data
+    return data
+
+
+def clear_show_cache(host: Optional[str] = None) -> None:
+    with _show_lock:
+        for key in [k for k in _show_cache if host is None or k[0] == _base_url(host)]:
+            _show_cache.pop(key, None)
+
+
+@dataclass
+class ModelLimits:
+    trained_ctx: Optional[int]  # what the weights support (model_info.*.context_length)
+    num_ctx: int  # what the server will actually allocate for a request
+
+    @property
+    def context_tokens(self) -> int:
+        return min(self.num_ctx, self.trained_ctx) if self.trained_ctx else self.num_ctx
+
+
+def _modelfile_num_ctx(show: Dict[str, Any]) -> Optional[int]:
+    for line in str(show.get("parameters") or "").splitlines():
+        parts = line.split()
+        if len(parts) == 2 and parts[0] == "num_ctx":
+            try:
+                return int(parts[1])
+            except ValueError:
+                return None
+    return None
+
+
+def model_limits(model: str, host: Optional[str] = None, options: Optional[Dict[str, Any]] = None) -> ModelLimits:
+    """Effective context window: request options.num_ctx, else the Modelfile's
+    num_ctx, else the server default, capped at the trained context length."""
+    show = ollama_show(model, host)
+    trained = None
+    for k, v in (show.get("model_info") or {}).items():
+        if k.endswith(".context_length") and isinstance(v, (int, float)):
+            trained = int(v)
+            break
+    num_ctx = (options or {}).get("num_ctx") or _modelfile_num_ctx(show) or SERVER_DEFAULT_NUM_CTX
+    return ModelLimits(trained, int(num_ctx))
+
+
 def ollama_quick_test(model: str, host: Optional[str] = None) -> Tuple[bool, str]:
     """Do a quick non-stream generate to verify model usability."""
-    h = (host or os.getenv("OLLAMA_HOST", "http://localhost:11434")).rstrip("/")
+    h = _base_url(host)
     if requests is None:
         return False, "requests not installed"
     try:
@@ -168,7 +1575,8 @@ def ollama_quick_test(model: str, host: Optional[str] = None) -> Tuple[bool, str
             "prompt": "Say 'ready'.",
             "stream": False,
         }
-        r = requests.post(f"{h}/api/generate", json=payload, timeout=30)
+        with get_scheduler().slot(h, model):
+            r = get_session(h).post(f"{h}/api/generate", json=payload, timeout=_timeout(30))
         r.raise_for_status()
         j = r.json()
         ok = isinstance(j, dict) and bool(j.get("response"))
@@ -185,8 +1593,19 @@ def has_ollama_cli(cmd: Optional[str] = None) -> bool:
     return shutil.which(candidate) is not None
 
 
-def start_ollama_server(cmd: Optional[str] = None) -> Tuple[bool, str, Optional[subprocess.Popen]]:
-    """Start 'ollama serve' in the background. Returns (ok, message, process)."""
+def start_ollama_server(
+    cmd: Optional[str] = None,
+    warm: Optional[str] = None,
+    host: Optional[str] = None,
+    keep_alive: Optional[str] = None,
+    options: Optional[Dict[str, Any]] = None,
+) -> Tuple[bool, str, Optional[subprocess.Popen]]:
+    """Start 'ollama serve' in the background. Returns (ok, message, process).
+
+    If ``warm`` names a model, it is preloaded once the server answers. With
+    AI_PIN_CPUS the server (and the runners it spawns) is pinned to the LLM
+    CPUs of the resource plan.
+    """
     ollama_cmd = (cmd or "ollama").strip()
     if not has_ollama_cli(ollama_cmd):
         return False, f"'{ollama_cmd}' CLI not found or not executable", None
@@ -203,8 +1622,14 @@ def start_ollama_server(cmd: Optional[str] = None) -> Tuple[bool, str, Optional[
                 _write_pidfile(proc.pid)
         except Exception:
             pass
+        from ai_interviewer.resources import get_resource_plan, pin_process
+
+        pin_process(proc.pid, get_resource_plan().llm_cpus)
         # Give it a moment to boot
         time.sleep(0.5)
+        invalidate_ollama_status()
+        if warm:
+            start_warmup(warm, host, keep_alive, wait_for_server_s=30.0, options=options)
         return True, "Ollama server starting", proc
     except Exception as e:
         return False, f"Failed to start ollama serve: {e}", None
@@ -213,9 +1638,7 @@ def start_ollama_server(cmd: Optional[str] = None) -> Tuple[bool, str, Optional[
 # --- Managed stop helpers ---
 
 def _state_dir() -> Path:
-    p = Path(os.path.expanduser("~/.cache/ai-interviewer"))
-    p.mkdir(parents=True, exist_ok=True)
-    return p
+    return state_dir()
 
 
 def _pidfile_path() -> Path:
@@ -248,6 +1671,13 @@ def stop_ollama_server(host: Optional[str] = None) -> Tuple[bool, str]:
     """Stop a managed Ollama server previously started by start_ollama_server().
     Returns (ok, message).
     """
+    try:
+        return _stop_ollama_server(host)
+    finally:
+        invalidate_ollama_status()
+
+
+def _stop_ollama_server(host: Optional[str] = None) -> Tuple[bool, str]:
     pid = _read_pidfile()
     if pid is None:
         # Fallback: try to stop any running Ollama instance (may require permissions)
@@ -379,6 +1809,7 @@ def stop_ollama_server(host: Optional[str] = None) -> Tuple[bool, str]:
         return False, f"Stop error: {e}"
 
 
+@_invalidates_status
 def pull_ollama_model(model: str, cmd: Optional[str] = None):
     """Generator that yields output lines while pulling a model."""
     ollama_cmd = (cmd or "ollama").strip()
@@ -408,18 +1839,19 @@ def pull_ollama_model(model: str, cmd: Optional[str] = None):
         yield f"Error pulling model: {e}"
 
 
+@_invalidates_status
 def pull_ollama_model_http(model: str, host: Optional[str] = None):
     """Generator that yields output lines while pulling a model via Ollama HTTP API.
     Useful when CLI isn't available but server is running.
     """
-    h = (host or os.getenv("OLLAMA_HOST", "http://localhost:11434")).rstrip("/")
+    h = _base_url(host)
     if requests is None:
         yield "'requests' not installed; cannot pull via HTTP"
         return
     url = f"{h}/api/pull"
     try:
         yield f"Running: POST {url} {{'name': '{model}', 'stream': True}}"
-        with requests.post(url, json={"name": model, "stream": True}, stream=True, timeout=600) as r:
+        with get_session(h).post(url, json={"name": model, "stream": True}, stream=True, timeout=_timeout(600)) as r:
             r.raise_for_status()
             for line in r.iter_lines(decode_unicode=True):
                 if not line:
@@ -431,6 +1863,7 @@ def pull_ollama_model_http(model: str, host: Optional[str] = None):
         yield f"HTTP pull error: {e}"
 
 
+@_invalidates_status
 def delete_ollama_model(model: str, cmd: Optional[str] = None):
     """Generator yielding output while deleting a model via CLI."""
     ollama_cmd = (cmd or "ollama").strip()
@@ -460,16 +1893,17 @@ def delete_ollama_model(model: str, cmd: Optional[str] = None):
         yield f"Error deleting model: {e}"
 
 
+@_invalidates_status
 def delete_ollama_model_http(model: str, host: Optional[str] = None):
     """Generator yielding output while deleting a model via HTTP API."""
-    h = (host or os.getenv("OLLAMA_HOST", "http://localhost:11434")).rstrip("/")
+    h = _base_url(host)
     if requests is None:
         yield "'requests' not installed; cannot delete via HTTP"
         return
     url = f"{h}/api/delete"
     try:
         yield f"Running: POST {url} {{'name': '{model}'}}"
-        r = requests.post(url, json={"name": model}, timeout=30)
+        r = get_session(h).post(url, json={"name": model}, timeout=_timeout(30))
         yield f"Response: {r.status_code} {r.text}"
         if r.status_code == 200:
             yield f"Model '{model}' deleted (HTTP)."
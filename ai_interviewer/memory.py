@@ -0,0 +1,148 @@
+"""Rolling conversation memory.
+
+Sending every turn verbatim eventually overflows the small models recommended
+for LOW profiles, and prefill grows with every turn. ``ConversationMemory``
+keeps the most recent messages verbatim and folds older ones into a short
+running summary carried in the system prompt:
+
+    build(system_prompt, history)   chat messages for the next turn, within budget
+    update_async(history)           fold old turns in the background after a turn
+
+Messages are folded ``fold_messages`` at a time, so between folds the prompt
+prefix (system + summary) stays identical and the server's KV cache is reused.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from typing import Dict, List, Optional
+
+from ai_interviewer.llm import LLM, SERVER_DEFAULT_NUM_CTX
+from ai_interviewer.prompts import (
+    INTERVIEWER_NUM_PREDICT,
+    build_chat_messages,
+    build_summary_messages,
+    with_summary,
+)
+from ai_interviewer.utils.log import debug, warn
+from ai_interviewer.utils.tokens import count_messages, count_tokens
+
+
+MEMORY_KEEP_MESSAGES = int(os.getenv("MEMORY_KEEP_MESSAGES", "6"))
+MEMORY_FOLD_MESSAGES = int(os.getenv("MEMORY_FOLD_MESSAGES", "4"))
+# Share of the prompt budget the verbatim tail may use before it is folded early
+_TAIL_SHARE = 0.6
+_MARGIN_TOKENS = 64
+
+
+class ConversationMemory:
+    def __init__(
+        self,
+        llm: Optional[LLM] = None,
+        context_tokens: int = SERVER_DEFAULT_NUM_CTX,
+        model: str = "",
+        keep_messages: int = MEMORY_KEEP_MESSAGES,
+        fold_messages: int = MEMORY_FOLD_MESSAGES,
+        reply_tokens: int = INTERVIEWER_NUM_PREDICT,
+    ) -> None:
+        self.llm = llm  # summarizer; without one, old turns are only dropped
+        self.context_tokens = int(context_tokens)  # see llm.model_limits
+        self.model = model  # selects the tokenizer approximation
+        self.keep_messages = max(2, int(keep_messages))
+        self.fold_messages = max(2, int(fold_messages))
+        self.reply_tokens = int(reply_tokens)
+        self.summary = ""
+        self.covered = 0  # history[:covered] is represented by ``summary``
+        # Accounting for the most recent build(): prompt tokens, budget, dropped messages
+        self.last_build: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def budget(self) -> int:
+        """Tokens available to the prompt after reserving room for the reply."""
+        return max(256, self.context_tokens - self.reply_tokens - _MARGIN_TOKENS)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.summary = ""
+            self.covered = 0
+
+    def _sync(self, history: List[dict]) -> None:
+        # The transcript was cleared or replaced; the summary no longer applies
+        if len(history) < self.covered:
+            self.summary, self.covered = "", 0
+
+    def build(self, system_prompt: str, history: List[dict]) -> List[Dict[str, str]]:
+        with self._lock:
+            self._sync(history)
+            summary, covered = self.summary, self.covered
+        tail = list(history[covered:])
+        msgs = build_chat_messages(with_summary(system_prompt, summary), tail)
+        # Hard guard while a fold is still pending: drop the oldest verbatim
+        # messages rather than let the server silently truncate the prompt.
+        dropped = 0
+        tokens = count_messages(msgs, self.model)
+        while len(tail) > 1 and tokens > self.budget:
+            tail = tail[1:]
+            dropped += 1
+            msgs = build_chat_messages(with_summary(system_prompt, summary), tail)
+            tokens = count_messages(msgs, self.model)
+        if dropped:
+            warn(f"Prompt over budget ({self.budget} tokens); dropped {dropped} old messages")
+        self.last_build = {"tokens": tokens, "budget": self.budget, "dropped": dropped}
+        return msgs
+
+    def _fold_count(self, history: List[dict]) -> int:
+        """How many uncovered messages to fold now (0 = nothing to do)."""
+        pending = history[self.covered:]
+        if len(pending) >= self.keep_messages + self.fold_messages:
+            return len(pending) - self.keep_messages
+        tail_tokens = count_messages(pending, self.model)
+        if len(pending) > 2 and tail_tokens > self.budget * _TAIL_SHARE:
+            # Long answers: fold early, keep at least the last exchange verbatim
+            return len(pending) - 2
+        return 0
+
+    def update(self, history: List[dict]) -> bool:
+        """Fold old messages into the summary. Returns True if it changed."""
+        if self.llm is None:
+            return False
+        with self._lock:
+            self._sync(history)
+            n = self._fold_count(history)
+            summary, covered = self.summary, self.covered
+        if n <= 0:
+            return False
+        chunk = history[covered:covered + n]
+        reply = (self.llm.chat_reply(build_summary_messages(summary, chunk)) or "").strip()
+        if not reply or reply.startswith("[LLM error"):
+            warn(f"Conversation summary not updated: {reply or 'empty reply'}")
+            return False
+        with self._lock:
+            if self.covered != covered:  # reset or folded concurrently
+                return False
+            self.summary, self.covered = reply, covered + n
+        debug(f"Memory: folded {n} messages; {self.covered} summarized, summary ~{count_tokens(reply, self.model)} tokens")
+        return True
+
+    def update_async(self, history: List[dict]) -> None:
+        """Run ``update`` on a background thread unless one is already running."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        snapshot = list(history)
+        self._thread = threading.Thread(target=self.update, args=(snapshot,), name="memory-fold", daemon=True)
+        self._thread.start()
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "summarized_messages": self.covered,
+                "summary_tokens": count_tokens(self.summary, self.model),
+                "budget_tokens": self.budget,
+            }
@@ -0,0 +1,131 @@
+"""Per-turn latency metrics.
+
+A ``TurnMetrics`` collects named values for one interview turn. Names ending
+in ``_s`` are seconds. Everything else is a count or rate (``llm_tokens``,
+``llm_tokens_per_sec``, ...). Spans are recorded with ``span(name)``, or with
+``mark(name)`` for "seconds since the turn started" milestones such as
+``first_audio_s``.
+
+Finished turns are plain dicts (``to_dict``), so they can live in Streamlit
+session state, be summarized with ``summarize`` and exported as JSONL.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+
+METRICS_JSONL = os.getenv("METRICS_JSONL", ".cache/metrics.jsonl")
+
+
+class TurnMetrics:
+    def __init__(self, kind: str = "answer", model: str = "", **meta: Any) -> None:
+        self.turn_id = uuid.uuid4().hex[:12]
+        self.kind = kind
+        self.model = model
+        self.meta: Dict[str, Any] = dict(meta)
+        self.started_at = time.time()
+        self._t0 = time.perf_counter()
+        self.values: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def add(self, name: str, value: float) -> None:
+        """Accumulate ``value`` into ``name`` (repeated spans sum up)."""
+        with self._lock:
+            self.values[name] = self.values.get(name, 0.0) + float(value)
+
+    def set(self, name: str, value: float) -> None:
+        with self._lock:
+            self.values[name] = float(value)
+
+    def update(self, values: Dict[str, float]) -> None:
+        with self._lock:
+            for k, v in values.items():
+                self.values[k] = float(v)
+
+    def get(self, name: str, default: float = 0.0) -> float:
+        with self._lock:
+            return self.values.get(name, default)
+
+    def mark(self, name: str) -> None:
+        """Record seconds since the turn started, once."""
+        with self._lock:
+            self.values.setdefault(name, time.perf_counter() - self._t0)
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self._t0
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - t0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            values = dict(self.values)
+        return {
+            "turn_id": self.turn_id,
+            "kind": self.kind,
+            "model": self.model,
+            "started_at": self.started_at,
+            **self.meta,
+            "metrics": values,
+        }
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Linear-interpolated percentile (q in 0..100) of a non-empty list."""
+    xs = sorted(values)
+    if not xs:
+        return float("nan")
+    k = (len(xs) - 1) * q / 100.0
+    lo = int(k)
+    hi = min(lo + 1, len(xs) - 1)
+    return xs[lo] + (xs[hi] - xs[lo]) * (k - lo)
+
+
+def summarize(turns: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """p50/p95 per metric name across turns, sorted by name."""
+    series: Dict[str, List[float]] = {}
+    for t in turns:
+        for k, v in (t.get("metrics") or {}).items():
+            if isinstance(v, (int, float)):
+                series.setdefault(k, []).append(float(v))
+    rows = []
+    for name in sorted(series):
+        vals = series[name]
+        scale, unit = (1000.0, "ms") if name.endswith("_s") else (1.0, "")
+        rows.append(
+            {
+                "metric": name,
+                "unit": unit,
+                "n": len(vals),
+                "p50": round(percentile(vals, 50) * scale, 1),
+                "p95": round(percentile(vals, 95) * scale, 1),
+            }
+        )
+    return rows
+
+
+def to_jsonl(turns: Iterable[Dict[str, Any]]) -> str:
+    return "".join(json.dumps(t, ensure_ascii=False) + "\n" for t in turns)
+
+
+def append_jsonl(turn: Dict[str, Any], path: Optional[str] = None) -> None:
+    p = Path(path or METRICS_JSONL)
+    try:
+        p.parent.mkdir(parents=True, exist_ok=True)
+        with open(p, "a", encoding="utf-8") as f:
+            f.write(json.dumps(turn, ensure_ascii=False) + "\n")
+    except OSError:
+        pass
@@ -0,0 +1,248 @@
+"""Pipelined interview turn: STT -> LLM -> TTS with overlapping stages.
+
+Each stage runs on its own worker thread and hands work to the next through a
+bounded queue, so speech synthesis starts on the first stable clause of the
+question while the LLM is still generating the rest. The UI does not call the
+stages itself; it iterates ``TurnPipeline.run(...)`` and renders events:
+
+    transcript  data=str           final candidate transcript (answer turns only)
+    token       data=str           accumulated raw LLM text so far
+    queued      data=int           position in the LLM request queue (0 = running)
+    prompt      data=dict          prompt accounting: tokens, budget, dropped (estimated)
+    question    data=str           extracted interviewer question
+    audio       data=str           path of the next playable speech segment
+    timings     data=dict          TurnMetrics.to_dict() for the finished turn
+    error       data=str           a stage failed; the turn ends after this
+    idle        data=None          nothing happened within the poll interval
+    done        data=None          last event of the turn
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Iterator, List, Optional
+
+from ai_interviewer.llm import LLM
+from ai_interviewer.memory import ConversationMemory
+from ai_interviewer.metrics import TurnMetrics
+from ai_interviewer.prompts import build_chat_messages
+from ai_interviewer.stt import STTConfig, decode_audio_bytes, save_audio_bytes, transcribe_audio
+from ai_interviewer.tts import IncrementalSplitter, TTSCache, get_tts_cache
+from ai_interviewer.utils.log import debug, error, info
+from ai_interviewer.utils.text import extract_first_question
+from ai_interviewer.utils.tokens import count_messages
+
+
+_DONE = object()
+
+
+@dataclass
+class TurnEvent:
+    kind: str
+    data: Any = None
+    t: float = field(default_factory=time.perf_counter)
+
+
+class TurnPipeline:
+    """Runs one interview turn across STT, LLM and TTS workers.
+
+    ``run`` starts the workers and yields ``TurnEvent``s until ``done``.
+    Closing the iterator early cancels the turn (the LLM stream is closed).
+    """
+
+    def __init__(
+        self,
+        llm: LLM,
+        stt_cfg: Optional[STTConfig] = None,
+        speak: bool = False,
+        voice: Optional[str] = None,
+        tts_cache: Optional[TTSCache] = None,
+        queue_size: int = 4,
+        memory: Optional[ConversationMemory] = None,
+    ) -> None:
+        self.llm = llm
+        self.stt_cfg = stt_cfg or STTConfig()
+        self.speak = speak
+        self.voice = voice
+        self.tts_cache = tts_cache
+        self.queue_size = max(1, int(queue_size))
+        self.memory = memory
+
+    def run(
+        self,
+        system_prompt: str,
+        history: List[dict],
+        audio: Optional[bytes] = None,
+        save_audio_to: Optional[str] = None,
+        poll_s: float = 0.05,
+        metrics: Optional[TurnMetrics] = None,
+    ) -> Iterator[TurnEvent]:
+        events: "queue.Queue[TurnEvent]" = queue.Queue()
+        to_llm: "queue.Queue" = queue.Queue(maxsize=1)
+        # Unbounded when not speaking: nothing drains it, and the LLM must not block
+        to_tts: "queue.Queue" = queue.Queue(maxsize=self.queue_size if self.speak else 0)
+        cancel = threading.Event()
+        m = metrics or TurnMetrics(kind="answer" if audio is not None else "opening")
+
+        def emit(kind: str, data: Any = None) -> None:
+            events.put(TurnEvent(kind, data))
+
+        def put(q: "queue.Queue", item: Any) -> bool:
+            # Bounded hand-off that still notices cancellation
+            while not cancel.is_set():
+                try:
+                    q.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def stt_stage() -> None:
+            try:
+                if audio is None:
+                    put(to_llm, None)
+                    return
+                if save_audio_to:
+                    save_audio_bytes(audio, save_audio_to)
+                with m.span("stt_decode_s"):
+                    samples = decode_audio_bytes(audio)
+                with m.span("stt_transcribe_s"):
+                    transcript = (transcribe_audio(samples, self.stt_cfg) or "").strip()
+                if not transcript:
+                    emit("error", "No speech detected.")
+                    put(to_llm, _DONE)
+                    return
+                emit("transcript", transcript)
+                put(to_llm, transcript)
+            except Exception as e:
+                error(f"STT failed: {e}")
+                emit("error", f"STT failed: {e}")
+                put(to_llm, _DONE)
+
+        def llm_stage() -> None:
+            splitter = IncrementalSplitter()
+            try:
+                item = _DONE
+                while not cancel.is_set():
+                    try:
+                        item = to_llm.get(timeout=0.1)
+                        break
+                    except queue.Empty:
+                        continue
+                if item is _DONE or cancel.is_set():
+                    return
+                with m.span("prompt_build_s"):
+                    turns = list(history) + ([{"role": "user", "content": item}] if item else [])
+                    if self.memory is not None:
+                        chat = self.memory.build(system_prompt, turns)
+                        budget = dict(self.memory.last_build)
+                    else:
+                        chat = build_chat_messages(system_prompt, turns)
+                        budget = {"tokens": count_messages(chat, getattr(self.llm, "model", ""))}
+                m.set("prompt_tokens_est", budget["tokens"])
+                emit("prompt", budget)
+                info(f"=== LLM CALL === messages={len(chat)}")
+                l0 = time.perf_counter()
+                parts: List[str] = []
+                # on_queue runs on this thread while the scheduler holds the request back
+                stream = self.llm.stream_chat(chat, on_queue=lambda pos: emit("queued", pos))
+                try:
+                    for chunk in stream:
+                        if cancel.is_set():
+                            return
+                        if not parts:
+                            m.set("llm_ttft_s", time.perf_counter() - l0)
+                        parts.append(chunk)
+                        text = "".join(parts)
+                        emit("token", text)
+                        if self.speak:
+                            for clause in splitter.update(extract_first_question(text)):
+                                put(to_tts, clause)
+                finally:
+                    close = getattr(stream, "close", None)
+                    if close:
+                        close()
+                l1 = time.perf_counter()
+                m.set("llm_total_s", l1 - l0)
+                # Server timings, or client-side counts when stop_when cut the stream
+                stats = dict(getattr(stream, "stats", None) or {})
+                if "llm_tokens" not in stats and parts:
+                    # Backend without stats: count chunks instead
+                    stats["llm_tokens"] = float(len(parts))
+                    gen_s = (l1 - l0) - m.get("llm_ttft_s")
+                    if gen_s > 0:
+                        stats["llm_tokens_per_sec"] = len(parts) / gen_s
+                m.update(stats)
+                reply = "".join(parts)
+                info("=== RAW LLM OUTPUT ===")
+                info(reply)
+                question = extract_first_question(reply) or reply.strip()
+                if not question:
+                    emit("error", "The model returned an empty reply.")
+                    return
+                emit("question", question)
+                if self.memory is not None:
+                    # Fold older turns while the candidate is answering
+                    self.memory.update_async(turns + [{"role": "assistant", "content": question}])
+                if self.speak:
+                    if splitter.diverged:
+                        debug("Question text changed after speech started; speaking the full question again")
+                    for clause in splitter.finish(question):
+                        put(to_tts, clause)
+            except Exception as e:
+                error(f"LLM error: {e}")
+                emit("error", f"LLM error: {e}")
+            finally:
+                put(to_tts, _DONE)
+
+        def tts_stage() -> None:
+            cache = self.tts_cache or get_tts_cache()
+            try:
+                while not cancel.is_set():
+                    try:
+                        clause = to_tts.get(timeout=0.1)
+                    except queue.Empty:
+                        continue
+                    if clause is _DONE:
+                        break
+                    with m.span("tts_synth_s"):
+                        path = cache.submit(clause, self.voice).result()
+                    m.mark("first_audio_s")
+                    emit("audio", path)
+            except Exception as e:
+                error(f"TTS failed: {e}")
+                emit("error", f"TTS failed: {e}")
+
+        workers = [
+            threading.Thread(target=stt_stage, name="turn-stt", daemon=True),
+            threading.Thread(target=llm_stage, name="turn-llm", daemon=True),
+        ]
+        if self.speak:
+            workers.append(threading.Thread(target=tts_stage, name="turn-tts", daemon=True))
+        for w in workers:
+            w.start()
+
+        def _watch() -> None:
+            for w in workers:
+                w.join()
+            m.mark("total_s")
+            emit("timings", m.to_dict())
+            emit("done")
+
+        threading.Thread(target=_watch, name="turn-watch", daemon=True).start()
+
+        try:
+            while True:
+                try:
+                    ev = events.get(timeout=poll_s)
+                except queue.Empty:
+                    yield TurnEvent("idle")
+                    continue
+                yield ev
+                if ev.kind == "done":
+                    return
+        finally:
+            cancel.set()
@@ -5,6 +5,7 @@ from typing import Any, List
 
 
 class PCProfile(Enum):
+    AUTO = "Auto (detect hardware)"
     LOW = "Low-end PC"
     HIGH = "High-end PC"
 
@@ -14,12 +15,12 @@ PROFILE_LABELS: List[str] = [p.value for p in PCProfile]
 
 
 def normalize_profile(value: Any) -> PCProfile:
-    """Normalize to one of the two supported profiles without aliases.
+    """Normalize to one of the supported profiles without aliases.
 
     Accepts:
       - PCProfile enum values
-      - Enum names: "LOW", "HIGH" (case-insensitive)
-      - Labels: "Low-end PC", "High-end PC" (case-insensitive)
+      - Enum names: "AUTO", "LOW", "HIGH" (case-insensitive)
+      - Labels: "Auto (detect hardware)", "Low-end PC", "High-end PC" (case-insensitive)
 
     Falls back to PCProfile.LOW if not recognized.
     """
@@ -31,11 +32,11 @@ def normalize_profile(value: Any) -> PCProfile:
         return PCProfile.LOW
 
     s_lower = s.lower()
-    # Match by enum name (LOW/HIGH)
+    # Match by enum name (AUTO/LOW/HIGH)
     for p in PCProfile:
         if s_lower == p.name.lower():
             return p
-    # Match by label value (Low-end PC / High-end PC)
+    # Match by label value
     for p in PCProfile:
         if s_lower == p.value.lower():
             return p
@@ -0,0 +1,78 @@
+"""Prompt builders for the interviewer.
+
+Kept free of Streamlit so benchmarks and background workers can reuse them.
+"""
+
+from __future__ import annotations
+
+import os
+
+
+def build_system_prompt(job_role: str) -> str:
+    role = job_role.strip() or "General Software Engineer"
+    return (
+        f"Role: {role}.\n"
+        "You are the interviewer. Keep the interview in English only.\n"
+        "Ask exactly one question per turn. Be concise (<=25 words). No preface, no quotes, no lists."
+    )
+
+
+# Generation limits for a single interviewer question. A <=25-word question is
+# ~40 tokens; the cap leaves room for a short preface that extraction strips.
+# The stop sequences end generation if the model starts writing the candidate's part.
+INTERVIEWER_NUM_PREDICT = int(os.getenv("OLLAMA_NUM_PREDICT", "80"))
+INTERVIEWER_STOP = ["\nCandidate:", "\nInterviewer:", "\n\n\n"]
+
+OPENING_PROMPT = "Start the interview now. Ask the first question only."
+
+
+def build_chat_messages(system_prompt: str, history: list[dict]) -> list[dict]:
+    """Structured chat messages for the next interviewer turn.
+
+    The opening instruction is always the first user message so each turn's
+    message list extends the previous one and the server can reuse its cache.
+    """
+    msgs = [{"role": "system", "content": system_prompt}, {"role": "user", "content": OPENING_PROMPT}]
+    for m in history:
+        r = m.get("role")
+        c = (m.get("content") or "").strip()
+        if not c:
+            continue
+        msgs.append({"role": "assistant" if r == "assistant" else "user", "content": c})
+    return msgs
+
+
+# Rolling memory (see ai_interviewer.memory): older turns are folded into short notes.
+SUMMARY_NUM_PREDICT = int(os.getenv("MEMORY_SUMMARY_NUM_PREDICT", "200"))
+SUMMARY_SYSTEM_PROMPT = (
+    "You keep concise notes on a job interview for the interviewer. "
+    "Merge the new exchanges into the existing notes. Keep the topics already asked about "
+    "and what the candidate said about their skills and experience. "
+    "At most 120 words, plain text, no preface."
+)
+
+
+def _transcript_lines(history: list[dict]) -> str:
+    lines = []
+    for m in history:
+        c = (m.get("content") or "").strip()
+        if c:
+            lines.append(f"{'Interviewer' if m.get('role') == 'assistant' else 'Candidate'}: {c}")
+    return "\n".join(lines)
+
+
+def build_summary_messages(previous_summary: str, history: list[dict]) -> list[dict]:
+    """Chat messages asking the model to fold ``history`` into the running notes."""
+    user = (
+        f"Notes so far:\n{previous_summary.strip() or '(none)'}\n\n"
+        f"New exchanges:\n{_transcript_lines(history)}\n\n"
+        "Updated notes:"
+    )
+    return [{"role": "system", "content": SUMMARY_SYSTEM_PROMPT}, {"role": "user", "content": user}]
+
+
+def with_summary(system_prompt: str, summary: str) -> str:
+    """System prompt carrying the notes for turns no longer sent verbatim."""
+    if not summary.strip():
+        return system_prompt
+    return f"{system_prompt}\nNotes on the interview so far (earlier turns, do not repeat these topics):\n{summary.strip()}"
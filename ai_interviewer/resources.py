@@ -0,0 +1,220 @@
+"""CPU budgets for STT, the LLM and TTS on one machine.
+
+Left alone, faster-whisper (CTranslate2) and a local Ollama each start one
+thread per core, so when their work overlaps in a turn they compete for every
+core and both slow down. A ``ResourcePlan`` assigns each component a thread
+count and, optionally, a disjoint set of CPUs:
+
+    sequential  components take turns (record -> transcribe -> generate -> speak);
+                each may use every physical core, nothing is pinned
+    overlapped  streaming STT, LLM generation and TTS of the previous sentence
+                run at the same time; cores are split (LLM gets the most, STT
+                a quarter, TTS one) and can be pinned with AI_PIN_CPUS=1
+
+The LLM budget reaches Ollama as ``options.num_thread``, and only for hosts on
+this machine, because a remote server's cores are not ours to split. STT uses
+``cpu_threads``/``num_workers`` on the WhisperModel. Pinning relies on
+os.sched_setaffinity (Linux). Elsewhere the thread budgets still apply and
+pinning is skipped.
+
+    AI_RESOURCE_MODE=overlapped|sequential
+    LLM_THREADS / STT_THREADS / STT_WORKERS / TTS_THREADS   override the split
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+from urllib.parse import urlparse
+
+from ai_interviewer.utils.log import debug, warn
+
+
+RESOURCE_MODES = ("sequential", "overlapped")
+RESOURCE_MODE = os.getenv("AI_RESOURCE_MODE", "overlapped").strip().lower()
+PIN_CPUS = os.getenv("AI_PIN_CPUS", "0").strip().lower() in ("1", "true", "yes", "on")
+
+_LOCAL_HOSTS = ("localhost", "127.0.0.1", "::1", "0.0.0.0", "")
+
+
+@dataclass
+class ResourcePlan:
+    mode: str
+    llm_threads: int
+    stt_threads: int
+    stt_workers: int
+    tts_threads: int
+    # CPU ids per component; empty = not pinned
+    llm_cpus: List[int] = field(default_factory=list)
+    stt_cpus: List[int] = field(default_factory=list)
+    tts_cpus: List[int] = field(default_factory=list)
+
+    @property
+    def pinned(self) -> bool:
+        return bool(self.llm_cpus or self.stt_cpus or self.tts_cpus)
+
+
+def available_cpus() -> List[int]:
+    """CPU ids this process may run on (respects cgroup/taskset limits)."""
+    try:
+        return sorted(os.sched_getaffinity(0))  # type: ignore[attr-defined]
+    except (AttributeError, OSError):
+        return list(range(os.cpu_count() or 1))
+
+
+def _env_int(name: str) -> Optional[int]:
+    v = os.getenv(name, "").strip()
+    try:
+        return max(0, int(v)) if v else None
+    except ValueError:
+        warn(f"Ignoring {name}={v!r}: not an integer")
+        return None
+
+
+def _split_cpus(cpus: List[int], counts: Sequence[int]) -> List[List[int]]:
+    """Contiguous CPU blocks proportional to ``counts`` (each at least one CPU)."""
+    total = max(1, sum(counts))
+    out: List[List[int]] = []
+    start = 0
+    for i, n in enumerate(counts):
+        if i == len(counts) - 1:
+            block = cpus[start:]
+        else:
+            size = max(1, round(len(cpus) * n / total))
+            block = cpus[start:start + size]
+        out.append(block or cpus[-1:])
+        start += len(block)
+    return out
+
+
+def plan_resources(mode: Optional[str] = None, physical_cores: Optional[int] = None, pin: Optional[bool] = None) -> ResourcePlan:
+    """Thread budgets (and CPU sets when pinning) for the given pipeline mode."""
+    mode = (mode or RESOURCE_MODE).lower()
+    if mode not in RESOURCE_MODES:
+        warn(f"Unknown resource mode {mode!r}; using overlapped")
+        mode = "overlapped"
+    pin = PIN_CPUS if pin is None else pin
+    cpus = available_cpus()
+    if physical_cores is None:
+        from ai_interviewer.hardware import get_hardware
+
+        physical_cores = get_hardware().physical_cores
+    # Hyperthreads don't add decode throughput; a taskset/cgroup limit can cap below the core count
+    cores = max(1, min(physical_cores, len(cpus)))
+
+    if mode == "sequential":
+        llm, stt, tts = cores, cores, 1
+    else:
+        tts = 1 if cores >= 4 else 0  # pyttsx3 is single-threaded; below 4 cores it just shares
+        stt = max(1, cores // 4)
+        llm = max(1, cores - stt - tts)
+
+    llm = _env_int("LLM_THREADS") or llm
+    stt = _env_int("STT_THREADS") or stt
+    tts_env = _env_int("TTS_THREADS")
+    tts = tts if tts_env is None else tts_env
+    workers = _env_int("STT_WORKERS") or 1
+
+    plan = ResourcePlan(mode=mode, llm_threads=llm, stt_threads=stt, stt_workers=workers, tts_threads=tts)
+    if pin and mode == "overlapped" and len(cpus) >= 2:
+        parts = _split_cpus(cpus, [llm, stt] + ([tts] if tts else []))
+        plan.llm_cpus, plan.stt_cpus = parts[0], parts[1]
+        plan.tts_cpus = parts[2] if tts else []
+    elif pin and mode == "sequential":
+        debug("CPU pinning is only used in overlapped mode")
+    return plan
+
+
+_plan: Optional[ResourcePlan] = None
+_plan_lock = threading.Lock()
+
+
+def get_resource_plan(refresh: bool = False) -> ResourcePlan:
+    """Process-wide plan from AI_RESOURCE_MODE / AI_PIN_CPUS (computed once)."""
+    global _plan
+    with _plan_lock:
+        if _plan is None or refresh:
+            _plan = plan_resources()
+            debug(f"Resource plan: {_plan}")
+        return _plan
+
+
+def set_resource_plan(plan: ResourcePlan) -> None:
+    global _plan
+    with _plan_lock:
+        _plan = plan
+
+
+def is_local_host(host: Optional[str]) -> bool:
+    h = host or os.getenv("OLLAMA_HOST", "http://localhost:11434")
+    if "://" not in h:
+        h = f"http://{h}"
+    return (urlparse(h).hostname or "") in _LOCAL_HOSTS
+
+
+def llm_options(hosts: Sequence[Optional[str]], plan: Optional[ResourcePlan] = None) -> Dict[str, Any]:
+    """Ollama request options for the LLM budget; {} unless every host is local.
+
+    num_thread is a load-time option: requests with a different value make
+    Ollama reload the model, so warm-up, interview and summary calls must all
+    pass the same options.
+    """
+    if not hosts or not all(is_local_host(h) for h in hosts):
+        return {}
+    plan = plan or get_resource_plan()
+    return {"num_thread": plan.llm_threads}
+
+
+# --- CPU affinity ---
+
+def pin_thread(cpus: Sequence[int]) -> bool:
+    """Pin the calling thread (Linux: affinity is per thread) and threads it starts later."""
+    if not cpus:
+        return False
+    try:
+        os.sched_setaffinity(0, set(cpus))  # type: ignore[attr-defined]
+        return True
+    except (AttributeError, OSError) as e:
+        debug(f"CPU pinning unavailable: {e}")
+        return False
+
+
+def pin_process(pid: int, cpus: Sequence[int]) -> bool:
+    """Pin another process, e.g. the ``ollama serve`` started from the app."""
+    if not cpus or not pid:
+        return False
+    try:
+        os.sched_setaffinity(pid, set(cpus))  # type: ignore[attr-defined]
+        return True
+    except (AttributeError, OSError) as e:
+        debug(f"Could not pin pid {pid}: {e}")
+        return False
+
+
+@contextmanager
+def pinned(cpus: Optional[Sequence[int]]) -> Iterator[None]:
+    """Run the block on ``cpus`` and restore the previous affinity afterwards.
+
+    Worker threads a library creates inside the block (CTranslate2's OpenMP
+    team, for example) inherit the affinity and keep it.
+    """
+    if not cpus:
+        yield
+        return
+    try:
+        before = os.sched_getaffinity(0)  # type: ignore[attr-defined]
+    except (AttributeError, OSError):
+        yield
+        return
+    changed = pin_thread(cpus)
+    try:
+        yield
+    finally:
+        if changed:
+            try:
+                os.sched_setaffinity(0, before)  # type: ignore[attr-defined]
+            except OSError:
+                pass
@@ -5,15 +5,28 @@ from __future__ import annotations
 Contract:
 - STTConfig: configuration for transcribe functions
 - transcribe_file(path: str, cfg: STTConfig | None) -> str
-- transcribe_bytes(data: bytes, cfg: STTConfig | None) -> str
+- transcribe_bytes(data: bytes, cfg: STTConfig | None, save_to: str | None) -> str
+- transcribe_audio(audio: float32 ndarray @ 16 kHz, cfg: STTConfig | None) -> str
+- transcribe_segments(source, cfg) -> ([{start, end, text}], {language, duration})
+- StreamingTranscriber: feed() audio while the candidate speaks, finish() -> str
+
+Run as ``python -m ai_interviewer.stt DIR`` to batch-transcribe recordings
+(see ai_interviewer.stt_batch).
 
 Also exposes simple model selection helpers keyed to the existing PC profiles.
 """
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+from collections import OrderedDict
 from pathlib import Path
-import tempfile
+import gc
+import io
+import json
+import os
+import queue
+import threading
+import time
 
 from ai_interviewer.profiles import PCProfile, normalize_profile
 
@@ -26,7 +39,8 @@ STT_MODEL_CATALOG: Dict[str, float] = {
     "medium.en": 1.5,
 }
 
-_loaded_models: Dict[str, object] = {}
+# faster-whisper models expect mono float32 at 16 kHz
+SAMPLE_RATE = 16000
 
 
 def stt_model_candidates(profile: PCProfile | str) -> List[str]:
@@ -35,10 +49,77 @@ def stt_model_candidates(profile: PCProfile | str) -> List[str]:
     ordered = [n for n, _ in names]
     if p == PCProfile.HIGH:
         ordered = list(reversed(ordered))
+    elif p == PCProfile.AUTO:
+        from ai_interviewer.hardware import auto_plan
+
+        pick = auto_plan().stt_model
+        ordered = [pick] + [n for n in ordered if n != pick]
     return ordered
 
 
+# Measured results from ``python -m benchmarks.stt_matrix``. When present, the
+# profile picks the fastest combination whose word error rate meets its target
+# instead of going by catalog size alone.
+STT_BENCHMARK_RESULTS = os.getenv("STT_BENCHMARK_RESULTS", ".cache/stt_benchmark.json")
+STT_MAX_WER = {
+    PCProfile.AUTO: float(os.getenv("STT_MAX_WER_AUTO", "0.15")),
+    PCProfile.LOW: float(os.getenv("STT_MAX_WER_LOW", "0.20")),
+    PCProfile.HIGH: float(os.getenv("STT_MAX_WER_HIGH", "0.10")),
+}
+
+
+def load_stt_benchmark(path: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Successful rows of the benchmark results file ([] if missing or unreadable)."""
+    try:
+        with open(path or STT_BENCHMARK_RESULTS, "r", encoding="utf-8") as f:
+            rows = json.load(f).get("results", [])
+    except Exception:
+        return []
+    return [
+        r for r in rows
+        if isinstance(r, dict) and "error" not in r
+        and isinstance(r.get("rtf"), (int, float)) and isinstance(r.get("wer"), (int, float))
+    ]
+
+
+def best_stt_benchmark_row(profile: PCProfile | str, rows: Optional[List[Dict[str, Any]]] = None) -> Optional[Dict[str, Any]]:
+    """Fastest measured combination meeting the profile's WER target.
+
+    Falls back to the most accurate one if none meets it; None without data.
+    """
+    rows = [r for r in (load_stt_benchmark() if rows is None else rows) if r.get("model") in STT_MODEL_CATALOG]
+    if not rows:
+        return None
+    target = STT_MAX_WER[normalize_profile(profile)]
+    ok = [r for r in rows if r["wer"] <= target]
+    if ok:
+        return min(ok, key=lambda r: (r["rtf"], r["wer"]))
+    return min(rows, key=lambda r: (r["wer"], r["rtf"]))
+
+
+def stt_settings_for_profile(profile: PCProfile | str, model: str) -> Dict[str, Any]:
+    """compute_type and vad_filter the benchmark measured ``model`` best with
+    under the profile's WER target. Without data the AUTO profile uses the
+    hardware plan's compute type; other profiles get {} (STTConfig defaults)."""
+    best = best_stt_benchmark_row(profile, [r for r in load_stt_benchmark() if r.get("model") == model])
+    if best is None:
+        if normalize_profile(profile) == PCProfile.AUTO:
+            from ai_interviewer.hardware import auto_plan
+
+            return {"compute_type": auto_plan().stt_compute_type}
+        return {}
+    out: Dict[str, Any] = {}
+    if best.get("compute_type"):
+        out["compute_type"] = str(best["compute_type"])
+    if "vad_filter" in best:
+        out["vad_filter"] = bool(best["vad_filter"])
+    return out
+
+
 def choose_stt_model_for_profile(profile: PCProfile | str) -> str:
+    best = best_stt_benchmark_row(profile)
+    if best is not None:
+        return best["model"]
     cands = stt_model_candidates(profile)
     return cands[0] if cands else "tiny.en"
 
@@ -49,55 +130,467 @@ class STTConfig:
     language: str = "en"
     vad_filter: bool = True
     compute_type: str = "int8"  # light default; override via env if needed
+    device: str = "auto"  # "auto" tries GPU first and falls back to CPU
+    cpu_threads: int = 0  # CTranslate2 intra-op threads; 0 = one per core
+    num_workers: int = 1  # concurrent transcribe() calls the model can serve
+    cpus: Optional[Tuple[int, ...]] = None  # pin transcription to these CPUs (see resources.pinned)
+
+
+# --- Model cache ---
+
+# Bounded by model count and (optionally) resident bytes; least recently used
+# models are dropped first. Keyed by (name, device, compute_type, cpu_threads,
+# num_workers) so an int8 and a float32 load of the same model, or two thread
+# budgets, are distinct entries.
+STT_CACHE_MAX_MODELS = int(os.getenv("STT_CACHE_MAX_MODELS", "2"))
+STT_CACHE_MAX_MB = int(os.getenv("STT_CACHE_MAX_MB", "0"))  # 0 = no byte budget
 
+# Rough resident size relative to the catalog (fp16) size, used when RSS can't be measured
+_COMPUTE_TYPE_FACTOR = {"int8": 0.6, "int8_float16": 0.6, "int8_float32": 0.6, "float16": 1.0, "float32": 2.0}
 
-def _get_model(name: str, compute_type: str = "int8"):
+ModelKey = Tuple[str, str, str, int, int]
+
+
+def _rss_bytes() -> Optional[int]:
+    try:
+        import psutil  # type: ignore
+
+        return int(psutil.Process().memory_info().rss)
+    except Exception:
+        pass
+    try:
+        with open("/proc/self/statm", "r", encoding="ascii") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        return None
+
+
+def _estimate_bytes(name: str, compute_type: str) -> int:
+    gb = STT_MODEL_CATALOG.get(name, 0.5)
+    return int(gb * _COMPUTE_TYPE_FACTOR.get(compute_type, 1.0) * 1024**3)
+
+
+@dataclass
+class CachedModel:
+    model: Any
+    key: ModelKey
+    device: str  # device actually used (after CUDA fallback)
+    bytes: int
+    measured: bool  # True if ``bytes`` is an RSS delta rather than an estimate
+    load_s: float
+    last_used: float
+
+
+def _load_whisper(name: str, device: str, compute_type: str, cpu_threads: int = 0, num_workers: int = 1) -> Tuple[Any, str]:
     try:
         from faster_whisper import WhisperModel  # type: ignore
     except Exception as e:  # pragma: no cover
         raise RuntimeError("faster-whisper is required for STT but not installed") from e
 
-    if name in _loaded_models:
-        return _loaded_models[name]
     # Try auto (GPU if available); gracefully fallback to CPU if CUDA/cuBLAS missing
     try:
-        m = WhisperModel(name, device="auto", compute_type=compute_type)
+        m = WhisperModel(name, device=device, compute_type=compute_type, cpu_threads=cpu_threads, num_workers=num_workers)
+        # CTranslate2 exposes the device "auto" resolved to
+        return m, str(getattr(getattr(m, "model", None), "device", device))
     except Exception as e:  # pragma: no cover - environment specific
         msg = str(e).lower()
-        if ("cublas" in msg) or ("cuda" in msg):
+        if device != "cpu" and (("cublas" in msg) or ("cuda" in msg)):
             try:
                 from ai_interviewer.utils.log import warn
                 warn("CUDA/cuBLAS not available; falling back to CPU for STT.")
             except Exception:
                 pass
-            m = WhisperModel(name, device="cpu", compute_type=compute_type)
-        else:
-            raise
-    _loaded_models[name] = m
-    return m
+            return WhisperModel(name, device="cpu", compute_type=compute_type, cpu_threads=cpu_threads, num_workers=num_workers), "cpu"
+        raise
+
+
+class WhisperModelCache:
+    def __init__(self, max_models: int = STT_CACHE_MAX_MODELS, max_bytes: int = STT_CACHE_MAX_MB * 1024**2):
+        self.max_models = max(1, int(max_models))
+        self.max_bytes = max(0, int(max_bytes))
+        self._entries: "OrderedDict[ModelKey, CachedModel]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._loading: Dict[ModelKey, threading.Event] = {}
+
+    def get(self, name: str, device: str = "auto", compute_type: str = "int8", cpu_threads: int = 0, num_workers: int = 1) -> Any:
+        key: ModelKey = (name, device, compute_type, int(cpu_threads), max(1, int(num_workers)))
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry.last_used = time.time()
+                    self._entries.move_to_end(key)
+                    return entry.model
+                pending = self._loading.get(key)
+                if pending is None:
+                    pending = self._loading[key] = threading.Event()
+                    break
+            # Another thread is loading the same model; wait and re-check
+            pending.wait()
+
+        try:
+            rss0 = _rss_bytes()
+            t0 = time.time()
+            model, actual = _load_whisper(*key)
+            t1 = time.time()
+            rss1 = _rss_bytes()
+            measured = rss0 is not None and rss1 is not None and rss1 > rss0 and actual == "cpu"
+            size = (rss1 - rss0) if measured else _estimate_bytes(name, compute_type)
+            entry = CachedModel(model, key, actual, int(size), measured, t1 - t0, t1)
+            with self._lock:
+                self._entries[key] = entry
+                evicted = self._evict_locked(keep=key)
+        finally:
+            with self._lock:
+                self._loading.pop(key, None)
+            pending.set()
+        if evicted:
+            gc.collect()
+        return model
+
+    def _evict_locked(self, keep: ModelKey) -> List[CachedModel]:
+        evicted: List[CachedModel] = []
+        while len(self._entries) > 1:
+            total = sum(e.bytes for e in self._entries.values())
+            if len(self._entries) <= self.max_models and (not self.max_bytes or total <= self.max_bytes):
+                break
+            victim = next(k for k in self._entries if k != keep)
+            evicted.append(self._entries.pop(victim))
+        return evicted
+
+    def preload(self, name: str, device: str = "auto", compute_type: str = "int8", cpu_threads: int = 0, num_workers: int = 1) -> threading.Thread:
+        """Load a model on a background thread so the next transcription is warm."""
+
+        def _run() -> None:
+            try:
+                self.get(name, device, compute_type, cpu_threads, num_workers)
+            except Exception as e:
+                try:
+                    from ai_interviewer.utils.log import warn
+                    warn(f"STT preload failed for {name}: {e}")
+                except Exception:
+                    pass
+
+        t = threading.Thread(target=_run, name=f"stt-preload-{name}", daemon=True)
+        t.start()
+        return t
+
+    def unload(self, name: str, device: Optional[str] = None, compute_type: Optional[str] = None) -> int:
+        """Drop matching models; ``None`` matches any device/compute type."""
+        with self._lock:
+            keys = [
+                k for k in self._entries
+                if k[0] == name and (device is None or k[1] == device) and (compute_type is None or k[2] == compute_type)
+            ]
+            for k in keys:
+                self._entries.pop(k, None)
+        if keys:
+            gc.collect()
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        gc.collect()
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Resident models, most recently used first."""
+        with self._lock:
+            entries = list(self._entries.values())
+        return [
+            {
+                "model": e.key[0],
+                "device": e.device,
+                "compute_type": e.key[2],
+                "cpu_threads": e.key[3],
+                "num_workers": e.key[4],
+                "mb": round(e.bytes / 1024**2),
+                "measured": e.measured,
+                "load_s": round(e.load_s, 2),
+                "last_used": e.last_used,
+            }
+            for e in reversed(entries)
+        ]
+
+
+_model_cache = WhisperModelCache()
+
+
+def _get_model(name: str, compute_type: str = "int8", device: str = "auto", cpu_threads: int = 0, num_workers: int = 1):
+    return _model_cache.get(name, device=device, compute_type=compute_type, cpu_threads=cpu_threads, num_workers=num_workers)
+
+
+def preload_stt_model(
+    name: str, compute_type: str = "int8", device: str = "auto", cpu_threads: int = 0, num_workers: int = 1
+) -> threading.Thread:
+    return _model_cache.preload(name, device=device, compute_type=compute_type, cpu_threads=cpu_threads, num_workers=num_workers)
+
+
+def stt_config_for_plan(
+    model: str, plan: Optional[Any] = None, profile: Optional[PCProfile | str] = None, **kw: Any
+) -> STTConfig:
+    """STTConfig with the thread budget (and CPU set) of a resources.ResourcePlan.
+
+    With a ``profile``, compute_type and vad_filter come from the benchmark
+    row the profile's pick is based on (see stt_settings_for_profile).
+    """
+    from ai_interviewer.resources import get_resource_plan
+
+    plan = plan or get_resource_plan()
+    settings = stt_settings_for_profile(profile, model) if profile is not None else {}
+    settings.update(kw)
+    return STTConfig(
+        model=model,
+        cpu_threads=plan.stt_threads,
+        num_workers=plan.stt_workers,
+        cpus=tuple(plan.stt_cpus) or None,
+        **settings,
+    )
+
+
+def unload_stt_model(name: str, compute_type: Optional[str] = None, device: Optional[str] = None) -> int:
+    return _model_cache.unload(name, device=device, compute_type=compute_type)
+
+
+def stt_cache_stats() -> List[Dict[str, Any]]:
+    return _model_cache.stats()
+
+
+def transcribe_segments(source: Any, cfg: Optional[STTConfig] = None) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """Transcribe keeping timestamps: ``([{start, end, text}], {language, duration})``."""
+    from ai_interviewer.resources import pinned
+
+    c = cfg or STTConfig()
+    out: List[Dict[str, Any]] = []
+    # Segments are decoded lazily, so iterate inside the pinned block too
+    with pinned(c.cpus):
+        model = _get_model(c.model, compute_type=c.compute_type, device=c.device, cpu_threads=c.cpu_threads, num_workers=c.num_workers)
+        segments, info = model.transcribe(
+            source,
+            language=c.language,
+            vad_filter=c.vad_filter,
+        )
+        for seg in segments:
+            try:
+                text = (seg.text or "").strip()
+            except Exception:
+                continue
+            if text:
+                out.append({"start": round(float(seg.start), 2), "end": round(float(seg.end), 2), "text": text})
+    meta = {
+        "language": getattr(info, "language", c.language),
+        "duration": round(float(getattr(info, "duration", 0.0) or 0.0), 2),
+    }
+    return out, meta
+
+
+def _transcribe(source: Any, cfg: Optional[STTConfig]) -> str:
+    segments, _meta = transcribe_segments(source, cfg)
+    return " ".join(s["text"] for s in segments)
 
 
 def transcribe_file(path: str, cfg: Optional[STTConfig] = None) -> str:
     """Transcribe a WAV/MP3/etc file to text (English)."""
-    c = cfg or STTConfig()
-    model = _get_model(c.model, compute_type=c.compute_type)
-    segments, _info = model.transcribe(
-        path,
-        language=c.language,
-        vad_filter=c.vad_filter,
-    )
-    text_parts: list[str] = []
-    for seg in segments:
+    return _transcribe(path, cfg)
+
+
+def transcribe_audio(audio: Any, cfg: Optional[STTConfig] = None) -> str:
+    """Transcribe a mono float32 NumPy array sampled at ``SAMPLE_RATE``."""
+    return _transcribe(audio, cfg)
+
+
+def _decode_wav(data: bytes, sampling_rate: int = SAMPLE_RATE):
+    """Stdlib/NumPy decoder for PCM WAV; used when PyAV is unavailable."""
+    import wave
+    import numpy as np
+
+    with wave.open(io.BytesIO(data), "rb") as w:
+        channels, width, rate = w.getnchannels(), w.getsampwidth(), w.getframerate()
+        raw = w.readframes(w.getnframes())
+    if width == 1:
+        audio = (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+    elif width == 2:
+        audio = np.frombuffer(raw, dtype="<i2").astype(np.float32) / 32768.0
+    elif width == 4:
+        audio = np.frombuffer(raw, dtype="<i4").astype(np.float32) / 2147483648.0
+    else:
+        raise ValueError(f"Unsupported WAV sample width: {width} bytes")
+    if channels > 1:
+        audio = audio.reshape(-1, channels).mean(axis=1)
+    if rate != sampling_rate and audio.size:
+        n_out = int(round(audio.size * sampling_rate / rate))
+        x_out = np.linspace(0.0, audio.size - 1, num=n_out, dtype=np.float64)
+        audio = np.interp(x_out, np.arange(audio.size), audio)
+    return np.ascontiguousarray(audio, dtype=np.float32)
+
+
+def decode_audio_bytes(data: bytes, sampling_rate: int = SAMPLE_RATE):
+    """Decode recorder bytes (WAV/WebM/MP3/...) into mono float32 in memory."""
+    try:
+        from faster_whisper.audio import decode_audio  # type: ignore
+
+        return decode_audio(io.BytesIO(data), sampling_rate=sampling_rate)
+    except Exception:
+        if data[:4] == b"RIFF":
+            return _decode_wav(data, sampling_rate)
+        raise
+
+
+def save_audio_bytes(data: bytes, path: str) -> str:
+    """Atomically write raw recorder bytes to ``path`` (explicit opt-in only)."""
+    out = Path(path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out.with_name(f".{out.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, out)
+    return str(out)
+
+
+def transcribe_bytes(data: bytes, cfg: Optional[STTConfig] = None, save_to: Optional[str] = None) -> str:
+    """Decode bytes in memory and transcribe; nothing touches disk unless ``save_to`` is set."""
+    if save_to:
+        save_audio_bytes(data, save_to)
+    return transcribe_audio(decode_audio_bytes(data), cfg)
+
+
+class StreamingTranscriber:
+    """Transcribe an answer incrementally while it is still being recorded.
+
+    ``feed()`` takes 16 kHz mono audio as it arrives. A frame-energy VAD closes a
+    segment after ``silence_ms`` of quiet (or at ``max_segment_s``) and a worker
+    thread transcribes closed segments in order, so by the time the candidate
+    stops only the last segment is left. ``finish()`` flushes that tail and
+    returns the stable transcript.
+    """
+
+    def __init__(
+        self,
+        cfg: Optional[STTConfig] = None,
+        frame_ms: int = 30,
+        silence_ms: int = 500,
+        preroll_ms: int = 200,
+        energy_threshold: float = 0.01,
+        max_segment_s: float = 15.0,
+    ):
+        import numpy as np
+
+        self._np = np
+        self.cfg = cfg or STTConfig()
+        self.frame = int(SAMPLE_RATE * frame_ms / 1000)
+        self.silence_frames = max(1, silence_ms // frame_ms)
+        self.preroll_frames = max(0, preroll_ms // frame_ms)
+        self.threshold = float(energy_threshold)
+        self.max_segment_frames = max(1, int(max_segment_s * 1000 / frame_ms))
+
+        self._pending = np.zeros(0, dtype=np.float32)
+        self._preroll: list = []
+        self._segment: list = []
+        self._silent = 0
+        self._in_speech = False
+
+        self._texts: list[str] = []
+        self._texts_lock = threading.Lock()
+        self._error: Optional[BaseException] = None
+        self._queue: "queue.Queue" = queue.Queue()
+        self._finished = False
+        self._worker = threading.Thread(target=self._run, name="stt-stream", daemon=True)
+        self._worker.start()
+
+    # --- producer side ---
+
+    def feed(self, samples: Any) -> None:
+        """Append mono float32 samples at ``SAMPLE_RATE``."""
+        if self._finished:
+            raise RuntimeError("StreamingTranscriber already finished")
+        np = self._np
+        data = np.asarray(samples, dtype=np.float32).reshape(-1)
+        self._pending = np.concatenate([self._pending, data]) if self._pending.size else data
+        n = self._pending.size // self.frame
+        for i in range(n):
+            self._on_frame(self._pending[i * self.frame:(i + 1) * self.frame])
+        self._pending = self._pending[n * self.frame:]
+
+    def feed_pcm16(self, data: bytes) -> None:
+        """Append raw little-endian 16-bit mono PCM at ``SAMPLE_RATE``."""
+        np = self._np
+        self.feed(np.frombuffer(data, dtype="<i2").astype(np.float32) / 32768.0)
+
+    def _on_frame(self, frame: Any) -> None:
+        rms = float(self._np.sqrt(self._np.mean(frame * frame))) if frame.size else 0.0
+        voiced = rms >= self.threshold
+        if not self._in_speech:
+            if voiced:
+                self._in_speech = True
+                self._segment = self._preroll + [frame]
+                self._preroll = []
+                self._silent = 0
+            elif self.preroll_frames:
+                self._preroll.append(frame)
+                del self._preroll[:-self.preroll_frames]
+            return
+        self._segment.append(frame)
+        self._silent = 0 if voiced else self._silent + 1
+        if self._silent >= self.silence_frames or len(self._segment) >= self.max_segment_frames:
+            self._close_segment()
+
+    def _close_segment(self) -> None:
+        if self._segment:
+            self._queue.put(self._np.concatenate(self._segment))
+        self._segment = []
+        self._silent = 0
+        self._in_speech = False
+
+    # --- worker side ---
+
+    def _run(self) -> None:
+        from ai_interviewer.resources import pin_thread
+
+        # This thread only transcribes; keep it (and CTranslate2's threads) on the STT CPUs
+        pin_thread(self.cfg.cpus or ())
         try:
-            text_parts.append(seg.text)
-        except Exception:
-            pass
-    return " ".join(t.strip() for t in text_parts if t and t.strip())
-
-
-def transcribe_bytes(data: bytes, cfg: Optional[STTConfig] = None) -> str:
-    """Write bytes to a temp wav and transcribe."""
-    tmpdir = tempfile.mkdtemp(prefix="ai-intvw-")
-    wav_path = str(Path(tmpdir) / "audio.wav")
-    Path(wav_path).write_bytes(data)
-    return transcribe_file(wav_path, cfg)
+            # Load up front so the first segment doesn't pay the model load
+            c = self.cfg
+            _get_model(c.model, compute_type=c.compute_type, device=c.device, cpu_threads=c.cpu_threads, num_workers=c.num_workers)
+        except BaseException as e:  # surfaced from finish()
+            self._error = e
+        while True:
+            seg = self._queue.get()
+            if seg is None:
+                return
+            if self._error is not None:
+                continue
+            try:
+                text = transcribe_audio(seg, self.cfg).strip()
+            except BaseException as e:
+                self._error = e
+                continue
+            if text:
+                with self._texts_lock:
+                    self._texts.append(text)
+
+    @property
+    def partial_text(self) -> str:
+        """Transcript of the segments completed so far."""
+        with self._texts_lock:
+            return " ".join(self._texts)
+
+    def finish(self, timeout: Optional[float] = None) -> str:
+        """Flush buffered audio, wait for the worker and return the transcript."""
+        if not self._finished:
+            self._finished = True
+            if self._pending.size:
+                self._on_frame(self._pending)
+                self._pending = self._pending[:0]
+            if self._in_speech:
+                self._close_segment()
+            self._queue.put(None)
+        self._worker.join(timeout)
+        if self._error is not None:
+            raise RuntimeError(f"Streaming STT failed: {self._error}") from self._error
+        return self.partial_text
+
+
+if __name__ == "__main__":
+    from ai_interviewer.stt_batch import main
+
+    main()
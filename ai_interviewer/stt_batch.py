@@ -0,0 +1,252 @@
+"""Batch transcription of recorded interviews (headless, no Streamlit).
+
+    python -m ai_interviewer.stt recordings/ -o transcripts.jsonl --model base.en
+
+Files are spread over a process pool sized to the physical cores. Each worker
+loads the Whisper model once (pool initializer) and keeps it for every file it
+gets. Results are appended to the JSONL output as each file finishes, one
+object per file:
+
+    {"file": "day1/cand03.wav", "model": "base.en", "language": "en",
+     "duration": 312.4, "elapsed_s": 41.2, "rtf": 0.132,
+     "segments": [{"start": 0.0, "end": 4.2, "text": "..."}], "text": "..."}
+
+A failed file is written as ``{"file": ..., "error": ...}``. The run is
+resumable: files that already have a successful line in the output are
+skipped, so after a crash or Ctrl+C the same command picks up where it
+stopped and retries only failures and unfinished files.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, TextIO
+
+from ai_interviewer.stt import STTConfig, _get_model, transcribe_segments
+
+
+AUDIO_EXTS = {".wav", ".mp3", ".m4a", ".flac", ".ogg", ".webm", ".mp4", ".aac", ".opus"}
+
+
+def find_audio(paths: Iterable[str], recursive: bool = True) -> List[Path]:
+    """Audio files under ``paths`` (files are taken as given), sorted."""
+    out: Set[Path] = set()
+    for p in map(Path, paths):
+        if p.is_dir():
+            it = p.rglob("*") if recursive else p.glob("*")
+            out.update(f for f in it if f.is_file() and f.suffix.lower() in AUDIO_EXTS)
+        elif p.is_file():
+            out.add(p)
+    return sorted(out)
+
+
+def _key(path: Path, roots: List[Path]) -> str:
+    """Stable id for resume: path relative to the input directories' common
+    parent, so d1/a.wav and d2/a.wav stay apart (a single directory is its own
+    parent). Files outside every input directory keep their absolute path."""
+    ap = path.resolve()
+    if roots and any(ap.is_relative_to(r) for r in roots):
+        base = Path(os.path.commonpath(roots)) if len(roots) > 1 else roots[0]
+        return ap.relative_to(base).as_posix()
+    return ap.as_posix()
+
+
+def completed(out_path: str) -> Set[str]:
+    """Files with a successful line in an existing output (a torn last line is ignored)."""
+    done: Set[str] = set()
+    try:
+        # A crash can also tear a multi-byte character; that line fails to parse and is skipped
+        with open(out_path, "r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                try:
+                    row = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(row, dict) and row.get("file") and "error" not in row:
+                    done.add(row["file"])
+    except FileNotFoundError:
+        pass
+    return done
+
+
+def _open_output(out_path: str) -> TextIO:
+    if out_path == "-":
+        return sys.stdout
+    Path(out_path).parent.mkdir(parents=True, exist_ok=True)
+    # A crash can leave a partial last line; start the next record on a fresh one.
+    # Checked in binary: the torn line may end inside a multi-byte character.
+    torn = False
+    try:
+        with open(out_path, "rb") as raw:
+            raw.seek(0, os.SEEK_END)
+            if raw.tell() > 0:
+                raw.seek(-1, os.SEEK_END)
+                torn = raw.read(1) != b"\n"
+    except FileNotFoundError:
+        pass
+    f = open(out_path, "a", encoding="utf-8")
+    if torn:
+        f.write("\n")
+    return f
+
+
+# --- worker side ---
+
+_cfg: Optional[STTConfig] = None
+
+
+def _init_worker(cfg: Dict[str, Any]) -> None:
+    global _cfg
+    _cfg = STTConfig(**cfg)
+    # Load once per process; every file this worker gets reuses the cached model
+    _get_model(_cfg.model, compute_type=_cfg.compute_type, device=_cfg.device, cpu_threads=_cfg.cpu_threads, num_workers=_cfg.num_workers)
+
+
+def _transcribe_one(path: str, key: str) -> Dict[str, Any]:
+    assert _cfg is not None, "worker not initialized"
+    t0 = time.perf_counter()
+    try:
+        segments, meta = transcribe_segments(path, _cfg)
+    except Exception as e:
+        return {"file": key, "error": f"{type(e).__name__}: {e}"}
+    elapsed = time.perf_counter() - t0
+    return {
+        "file": key,
+        "model": _cfg.model,
+        **meta,
+        "elapsed_s": round(elapsed, 2),
+        "rtf": round(elapsed / meta["duration"], 4) if meta.get("duration") else None,
+        "segments": segments,
+        "text": " ".join(s["text"] for s in segments),
+    }
+
+
+# --- driver ---
+
+def default_workers(threads_per_worker: int) -> int:
+    from ai_interviewer.hardware import get_hardware
+    from ai_interviewer.resources import available_cpus
+
+    cores = min(get_hardware().physical_cores, len(available_cpus()))
+    return max(1, cores // max(1, threads_per_worker))
+
+
+def run_batch(
+    files: List[Path],
+    roots: List[Path],
+    out_path: str,
+    cfg: STTConfig,
+    workers: int,
+    progress: Optional[TextIO] = sys.stderr,
+) -> Dict[str, Any]:
+    done = completed(out_path) if out_path != "-" else set()
+    todo = [(f, _key(f, roots)) for f in files]
+    todo = [(f, k) for f, k in todo if k not in done]
+    stats = {"total": len(files), "skipped": len(files) - len(todo), "ok": 0, "failed": 0, "audio_s": 0.0}
+    if not todo:
+        return stats
+
+    def note(msg: str) -> None:
+        if progress is not None:
+            print(msg, file=progress, flush=True)
+
+    note(f"{len(todo)} to transcribe ({stats['skipped']} already done) with {workers} workers x {cfg.cpu_threads or 'auto'} threads")
+    t0 = time.perf_counter()
+    out = _open_output(out_path)
+    cfg_dict = {k: v for k, v in cfg.__dict__.items() if k != "cpus"}  # affinity doesn't carry across processes
+    pending: Dict[Future, str] = {}
+    queue = list(reversed(todo))
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(cfg_dict,)) as pool:
+            # Keep a bounded number in flight so Ctrl+C doesn't leave a long queue behind
+            while queue or pending:
+                while queue and len(pending) < workers * 2:
+                    f, k = queue.pop()
+                    try:
+                        pending[pool.submit(_transcribe_one, str(f), k)] = k
+                    except BrokenProcessPool:
+                        # Workers died (usually the model failed to load); the rest would fail the same way
+                        queue.clear()
+                        break
+                if not pending:
+                    break
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in finished:
+                    key = pending.pop(fut)
+                    try:
+                        row = fut.result()
+                    except Exception as e:  # worker crashed (e.g. killed by the OOM killer)
+                        row = {"file": key, "error": f"{type(e).__name__}: {e}"}
+                    out.write(json.dumps(row, ensure_ascii=False) + "\n")
+                    out.flush()
+                    if "error" in row:
+                        stats["failed"] += 1
+                        note(f"[{stats['ok'] + stats['failed']}/{len(todo)}] {key}: {row['error']}")
+                    else:
+                        stats["ok"] += 1
+                        stats["audio_s"] += row.get("duration") or 0.0
+                        note(f"[{stats['ok'] + stats['failed']}/{len(todo)}] {key} ({row.get('duration', 0):.0f}s audio, {row['elapsed_s']:.1f}s)")
+    except KeyboardInterrupt:
+        note("Interrupted; finished files are saved, rerun the same command to resume.")
+        raise
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    stats["wall_s"] = round(time.perf_counter() - t0, 2)
+    return stats
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    ap = argparse.ArgumentParser(prog="python -m ai_interviewer.stt", description="Batch-transcribe audio files to JSONL.")
+    ap.add_argument("inputs", nargs="+", help="audio files or directories")
+    ap.add_argument("-o", "--out", default="transcripts.jsonl", help="JSONL output, appended to ('-' for stdout)")
+    ap.add_argument("--model", default=os.getenv("STT_MODEL", "base.en"))
+    ap.add_argument("--compute-type", default="int8")
+    ap.add_argument("--device", default="cpu", help="cpu, cuda or auto")
+    ap.add_argument("--language", default="en")
+    ap.add_argument("--no-vad", action="store_true", help="disable the VAD filter")
+    ap.add_argument("--threads", type=int, default=2, help="CTranslate2 threads per worker")
+    ap.add_argument("--workers", type=int, default=0, help="worker processes (default: physical cores / threads)")
+    ap.add_argument("--no-recursive", action="store_true")
+    args = ap.parse_args(argv)
+
+    if args.out == "-":
+        from ai_interviewer.utils.log import set_level
+
+        set_level("WARN")  # keep stdout clean for the JSONL
+    roots = [Path(p).resolve() for p in args.inputs if Path(p).is_dir()]
+    files = find_audio(args.inputs, recursive=not args.no_recursive)
+    if not files:
+        sys.exit("No audio files found.")
+    cfg = STTConfig(
+        model=args.model,
+        language=args.language,
+        vad_filter=not args.no_vad,
+        compute_type=args.compute_type,
+        device=args.device,
+        cpu_threads=max(1, args.threads),
+    )
+    workers = args.workers or default_workers(cfg.cpu_threads)
+    if args.device != "cpu" and not args.workers:
+        workers = 1  # one GPU context unless asked otherwise
+    stats = run_batch(files, roots, args.out, cfg, workers)
+    audio_h = stats["audio_s"] / 3600
+    summary = f"{stats['ok']} transcribed, {stats['failed']} failed, {stats['skipped']} skipped"
+    if stats.get("wall_s"):
+        summary += f" · {audio_h:.2f} h of audio in {stats['wall_s']:.0f}s"
+        if stats["wall_s"]:
+            summary += f" ({stats['audio_s'] / stats['wall_s']:.1f}x real time)"
+    print(summary, file=sys.stderr)
+    if stats["failed"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
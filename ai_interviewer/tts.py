@@ -1,14 +1,32 @@
 """Minimal TTS using pyttsx3 (offline, cross-platform).
 
 Contract:
-    synthesize(text: str, voice: str | None, out_path: str) -> str
+    synthesize(text: str, voice: str | None, out_path: str, rate: int | None = None) -> str
 Returns the path to the audio file if successful; raises or returns empty string on failure.
+
+A single long-lived engine runs on a dedicated worker thread (TTSService);
+``get_tts_service().submit(...)`` returns a Future so callers can keep working
+while audio is synthesized. ``synthesize`` is the blocking wrapper.
+
+``TTSCache`` stores synthesized audio under a hash of (text, voice, rate) so
+repeated lines are served from disk instead of being re-synthesized.
 """
 
 from __future__ import annotations
 
+import hashlib
+import io
+import json
+import os
+import queue
+import re
+import threading
+import time
+import uuid
+import wave
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 
 def _init_engine():
@@ -20,26 +38,419 @@ def _init_engine():
     return engine
 
 
-def synthesize(text: str, voice: Optional[str], out_path: str) -> str:
-    engine = _init_engine()
-    try:
-        if voice and isinstance(voice, str) and voice != "default":
-            # best-effort: set by name id substring
+class TTSService:
+    """Owns one pyttsx3 engine on a worker thread and serializes jobs through a queue.
+
+    pyttsx3 engines are not thread-safe and are expensive to create, so all
+    calls into the engine happen on the worker thread.
+    """
+
+    def __init__(self) -> None:
+        self._jobs: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._voice_ids: Dict[str, Optional[str]] = {}
+        self._default_voice: Optional[str] = None
+        self._current_voice: Optional[str] = None
+        self._default_rate: Optional[int] = None
+        self._current_rate: Optional[int] = None
+
+    def submit(self, text: str, voice: Optional[str], out_path: str, rate: Optional[int] = None) -> "Future[str]":
+        fut: "Future[str]" = Future()
+        self._ensure_worker()
+        self._jobs.put((text, voice, out_path, rate, fut))
+        return fut
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            t = self._thread
+            self._thread = None
+        if t is not None:
+            self._jobs.put(None)
+            if wait:
+                t.join()
+
+    def _ensure_worker(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="tts-worker", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        from ai_interviewer.resources import get_resource_plan, pin_thread
+
+        # espeak/SAPI synthesize on this thread; keep it off the LLM and STT CPUs
+        pin_thread(get_resource_plan().tts_cpus)
+        engine = None
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            text, voice, out_path, rate, fut = job
+            if not fut.set_running_or_notify_cancel():
+                continue
+            try:
+                if engine is None:
+                    engine = _init_engine()
+                    self._default_voice = self._current_voice = engine.getProperty("voice")
+                    self._default_rate = self._current_rate = engine.getProperty("rate")
+                fut.set_result(self._synthesize(engine, text, voice, out_path, rate))
+            except BaseException as e:
+                fut.set_exception(e)
+                # Recreate the engine on the next job in case it is wedged
+                engine = self._stop_engine(engine)
+        self._stop_engine(engine)
+
+    @staticmethod
+    def _stop_engine(engine) -> None:
+        if engine is not None:
+            try:
+                engine.stop()
+            except Exception:
+                pass
+        return None
+
+    def _voice_id(self, engine, voice: Optional[str]) -> Optional[str]:
+        """Resolve a voice name/id substring once; later calls hit the cache."""
+        if not voice or not isinstance(voice, str) or voice == "default":
+            return self._default_voice
+        key = voice.lower()
+        if key not in self._voice_ids:
+            found: Optional[str] = None
             try:
                 for v in engine.getProperty("voices"):
-                    if voice.lower() in (v.id or "").lower() or voice.lower() in (v.name or "").lower():
-                        engine.setProperty("voice", v.id)
+                    if key in (v.id or "").lower() or key in (v.name or "").lower():
+                        found = v.id
                         break
             except Exception:
                 pass
+            self._voice_ids[key] = found
+        return self._voice_ids[key] or self._default_voice
+
+    def _synthesize(self, engine, text: str, voice: Optional[str], out_path: str, rate: Optional[int] = None) -> str:
+        vid = self._voice_id(engine, voice)
+        if vid and vid != self._current_voice:
+            engine.setProperty("voice", vid)
+            self._current_voice = vid
+        wpm = rate or self._default_rate
+        if wpm and wpm != self._current_rate:
+            engine.setProperty("rate", wpm)
+            self._current_rate = wpm
 
         out = Path(out_path)
         out.parent.mkdir(parents=True, exist_ok=True)
         engine.save_to_file(text, str(out))
         engine.runAndWait()
         return str(out)
-    finally:
+
+
+_service: Optional[TTSService] = None
+_service_lock = threading.Lock()
+
+
+def get_tts_service() -> TTSService:
+    """Process-wide TTS service (survives Streamlit reruns)."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = TTSService()
+        return _service
+
+
+def synthesize(text: str, voice: Optional[str], out_path: str, rate: Optional[int] = None) -> str:
+    return get_tts_service().submit(text, voice, out_path, rate).result()
+
+
+# --- Audio cache ---
+
+TTS_CACHE_DIR = os.getenv("TTS_CACHE_DIR", ".cache/tts")
+TTS_CACHE_MAX_MB = int(os.getenv("TTS_CACHE_MAX_MB", "200"))
+TTS_CACHE_MAX_AGE_DAYS = float(os.getenv("TTS_CACHE_MAX_AGE_DAYS", "30"))
+
+
+class TTSCache:
+    """Content-addressed store of synthesized audio.
+
+    Entries live at ``<root>/<key[:2]>/<key>.wav`` where key = sha256 of
+    (text, voice, rate). Audio is synthesized to a temp file and moved into
+    place with ``os.replace``, so readers never see a partial file. Hits
+    refresh the file's mtime; eviction drops entries older than ``max_age_s``
+    and then least recently used ones until the store fits ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        root: str = TTS_CACHE_DIR,
+        max_bytes: int = TTS_CACHE_MAX_MB * 1024**2,
+        max_age_s: float = TTS_CACHE_MAX_AGE_DAYS * 86400,
+        service: Optional[TTSService] = None,
+    ) -> None:
+        self.root = Path(root)
+        self.max_bytes = int(max_bytes)
+        self.max_age_s = float(max_age_s)
+        self._service = service
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(text: str, voice: Optional[str] = None, rate: Optional[int] = None) -> str:
+        norm = " ".join((text or "").split())
+        raw = json.dumps([norm, voice or "default", rate], ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def path_for(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.wav"
+
+    def get(self, text: str, voice: Optional[str] = None, rate: Optional[int] = None) -> Optional[str]:
+        p = self.path_for(self.key(text, voice, rate))
         try:
-            engine.stop()
-        except Exception:
-            pass
+            os.utime(p)  # mark as recently used
+        except OSError:
+            return None
+        return str(p)
+
+    def submit(self, text: str, voice: Optional[str] = None, rate: Optional[int] = None) -> "Future[str]":
+        """Future resolving to a cached audio path; already done on a hit."""
+        hit = self.get(text, voice, rate)
+        if hit:
+            with self._lock:
+                self.hits += 1
+            fut: "Future[str]" = Future()
+            fut.set_result(hit)
+            return fut
+        with self._lock:
+            self.misses += 1
+        final = self.path_for(self.key(text, voice, rate))
+        final.parent.mkdir(parents=True, exist_ok=True)
+        tmp = final.with_name(f".{final.stem}.{uuid.uuid4().hex[:8]}.tmp.wav")
+        svc = self._service or get_tts_service()
+        inner = svc.submit(text, voice, str(tmp), rate)
+        outer: "Future[str]" = Future()
+
+        def _commit(f: "Future[str]") -> None:
+            try:
+                f.result()
+                os.replace(tmp, final)
+                outer.set_result(str(final))
+            except BaseException as e:
+                try:
+                    tmp.unlink(missing_ok=True)
+                except OSError:
+                    pass
+                outer.set_exception(e)
+                return
+            self.evict()
+
+        inner.add_done_callback(_commit)
+        return outer
+
+    def synthesize(self, text: str, voice: Optional[str] = None, rate: Optional[int] = None) -> str:
+        return self.submit(text, voice, rate).result()
+
+    def evict(self) -> int:
+        """Apply the age and size limits; returns the number of files removed."""
+        now = time.time()
+        entries = []
+        for p in self.root.glob("*/*.wav"):
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            if p.name.startswith("."):
+                # Leftover temp file from a crashed synthesis
+                if now - st.st_mtime > 3600:
+                    p.unlink(missing_ok=True)
+                continue
+            entries.append((st.st_mtime, st.st_size, p))
+        removed = 0
+        total = sum(size for _, size, _ in entries)
+        for mtime, size, p in sorted(entries):
+            too_old = self.max_age_s > 0 and now - mtime > self.max_age_s
+            # Recently returned files may not have been played yet
+            too_big = self.max_bytes > 0 and total > self.max_bytes and now - mtime > 60
+            if not (too_old or too_big):
+                continue
+            try:
+                p.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        if removed:
+            with self._lock:
+                self.evictions += removed
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        files = [p for p in self.root.glob("*/*.wav") if not p.name.startswith(".")]
+        size = 0
+        for p in files:
+            try:
+                size += p.stat().st_size
+            except OSError:
+                pass
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(files),
+                "mb": round(size / 1024**2, 1),
+            }
+
+
+_cache: Optional[TTSCache] = None
+
+
+def get_tts_cache() -> TTSCache:
+    global _cache
+    with _service_lock:
+        if _cache is None:
+            _cache = TTSCache()
+        return _cache
+
+
+# --- Chunked synthesis ---
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+_CLAUSE_END = re.compile(r"(?<=[,;:\u2014])\s+")
+
+
+def _split_long(piece: str, max_chars: int) -> List[str]:
+    """Break a sentence at clause punctuation, then at spaces, to fit ``max_chars``."""
+    if len(piece) <= max_chars:
+        return [piece]
+    out: List[str] = []
+    cur = ""
+    for clause in _CLAUSE_END.split(piece):
+        while len(clause) > max_chars:
+            cut = clause.rfind(" ", 0, max_chars)
+            cut = cut if cut > 0 else max_chars
+            if cur:
+                out.append(cur)
+                cur = ""
+            out.append(clause[:cut].strip())
+            clause = clause[cut:].strip()
+        if cur and len(cur) + 1 + len(clause) > max_chars:
+            out.append(cur)
+            cur = clause
+        else:
+            cur = f"{cur} {clause}".strip()
+    if cur:
+        out.append(cur)
+    return [c for c in out if c]
+
+
+def split_for_tts(text: str, max_chars: int = 140, first_max_chars: int = 60, min_chars: int = 12) -> List[str]:
+    """Split text into clause-sized chunks for incremental synthesis.
+
+    The first chunk is kept short (``first_max_chars``) because it alone
+    determines time-to-first-audio; fragments under ``min_chars`` are merged
+    into their neighbour to avoid choppy playback.
+    """
+    t = " ".join((text or "").split())
+    if not t:
+        return []
+    chunks: List[str] = []
+    for sentence in _SENTENCE_END.split(t):
+        limit = first_max_chars if not chunks else max_chars
+        parts = _split_long(sentence, limit)
+        if not chunks and len(parts) > 1:
+            # Only the very first piece needs to be short
+            head = parts[0]
+            rest = " ".join(parts[1:])
+            parts = [head] + _split_long(rest, max_chars)
+        chunks.extend(parts)
+    merged: List[str] = []
+    for c in chunks:
+        if merged and (len(c) < min_chars or len(merged[-1]) < min_chars) and len(merged[-1]) + 1 + len(c) <= max_chars:
+            merged[-1] = f"{merged[-1]} {c}"
+        else:
+            merged.append(c)
+    return merged
+
+
+class IncrementalSplitter:
+    """Emit stable clause-sized chunks from text that is still being generated.
+
+    ``update(text)`` takes the full text so far and returns chunks that ended
+    since the last call; ``finish(text)`` returns the remainder. A chunk is only
+    emitted once it is followed by clause punctuation and whitespace, so it
+    cannot change as more tokens arrive. If the text stops extending what was
+    already emitted (e.g. cleanup rewrote it), incremental output stops and the
+    rest is left to ``finish``.
+    """
+
+    _BOUNDARY = re.compile(r"[.!?,;:\u2014](?=\s)")
+
+    def __init__(self, first_min_chars: int = 12, min_chars: int = 24):
+        self.first_min_chars = first_min_chars
+        self.min_chars = min_chars
+        self.emitted = ""
+        self.diverged = False
+
+    def update(self, text: str) -> List[str]:
+        t = " ".join((text or "").split())
+        if self.diverged:
+            return []
+        if not t.startswith(self.emitted):
+            self.diverged = True
+            return []
+        out: List[str] = []
+        pos = len(self.emitted)
+        for m in self._BOUNDARY.finditer(t, pos):
+            chunk = t[pos:m.end()].strip()
+            need = self.first_min_chars if not self.emitted and not out else self.min_chars
+            if len(chunk) < need:
+                continue
+            out.append(chunk)
+            pos = m.end()
+        if out:
+            self.emitted = t[:pos]
+        return out
+
+    def finish(self, text: str) -> List[str]:
+        t = " ".join((text or "").split())
+        if self.diverged or not t.startswith(self.emitted):
+            self.diverged = True
+            return split_for_tts(t)
+        rest = t[len(self.emitted):].strip()
+        self.emitted = t
+        return split_for_tts(rest) if rest else []
+
+
+def wav_duration_s(path: str) -> float:
+    try:
+        with wave.open(str(path), "rb") as w:
+            rate = w.getframerate()
+            return w.getnframes() / float(rate) if rate else 0.0
+    except Exception:
+        return 0.0
+
+
+def concat_wav(paths: List[str]) -> bytes:
+    """Join WAV files with identical formats into one WAV buffer."""
+    out = io.BytesIO()
+    params = None
+    with wave.open(out, "wb") as dst:
+        for p in paths:
+            try:
+                with wave.open(str(p), "rb") as src:
+                    fmt = (src.getnchannels(), src.getsampwidth(), src.getframerate())
+                    if params is None:
+                        params = fmt
+                        dst.setnchannels(fmt[0])
+                        dst.setsampwidth(fmt[1])
+                        dst.setframerate(fmt[2])
+                    elif fmt != params:
+                        continue
+                    dst.writeframes(src.readframes(src.getnframes()))
+            except (wave.Error, OSError, EOFError):
+                continue
+        if params is None:
+            dst.setnchannels(1)
+            dst.setsampwidth(2)
+            dst.setframerate(16000)
+    return out.getvalue()
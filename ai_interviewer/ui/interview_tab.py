@@ -1,41 +1,22 @@
 from __future__ import annotations
 
 import time
+import uuid
 from pathlib import Path
 import streamlit as st
 
-from ai_interviewer.llm import create_llm, ollama_is_running, ollama_list_models
+from ai_interviewer.llm import LLM, create_llm, model_limits, ollama_status, parse_hosts
 from ai_interviewer.utils.model_catalog import choose_model_for_profile
-from ai_interviewer.utils.text import extract_first_question
+from ai_interviewer.resources import llm_options
+from ai_interviewer.utils.text import has_complete_question
+from ai_interviewer.utils.stream import ThrottledText
 from ai_interviewer import tts
-from ai_interviewer.stt import STTConfig, transcribe_bytes
-from ai_interviewer.utils.log import info, warn, error, success, debug
-
-
-def build_system_prompt(job_role: str) -> str:
-    role = job_role.strip() or "General Software Engineer"
-    return (
-        f"Role: {role}.\n"
-        "You are the interviewer. Keep the interview in English only.\n"
-        "Ask exactly one question per turn. Be concise (<=25 words). No preface, no quotes, no lists."
-    )
-
-
-def _build_conversation_user_prompt(history: list[dict], latest_user: str | None) -> str:
-    parts: list[str] = []
-    for m in history:
-        r = m.get("role")
-        c = (m.get("content") or "").strip()
-        if not c:
-            continue
-        if r == "assistant":
-            parts.append(f"Interviewer: {c}")
-        else:
-            parts.append(f"Candidate: {c}")
-    if latest_user:
-        parts.append(f"Candidate: {latest_user.strip()}")
-    parts.append("Respond as the Interviewer with the next single question only.")
-    return "\n".join(parts)
+from ai_interviewer.stt import stt_config_for_plan
+from ai_interviewer.pipeline import TurnPipeline
+from ai_interviewer.metrics import TurnMetrics, append_jsonl
+from ai_interviewer.memory import ConversationMemory
+from ai_interviewer.utils.log import info, success, debug
+from ai_interviewer.prompts import INTERVIEWER_NUM_PREDICT, INTERVIEWER_STOP, SUMMARY_NUM_PREDICT, build_system_prompt
 
 
 def _mic_widget() -> bytes | None:
@@ -70,92 +51,29 @@ def render_interview_tab():
     speak = st.checkbox("Speak interviewer replies (TTS)", value=False)
 
     if st.button("Generate opening question"):
-        ollama_ok, _ = ollama_is_running(st.session_state["ollama_host"])
-        if not ollama_ok:
-            st.error("Ollama is not running. Start it in the LLM Setup tab.")
+        metrics = TurnMetrics(kind="opening")
+        llm = _make_llm(metrics)
+        if llm is None:
             st.stop()
-
-        model = st.session_state.get("model") or choose_model_for_profile(
-            st.session_state["pc_profile"],
-            ollama_list_models(st.session_state["ollama_host"]),
-        )
-        llm = create_llm("ollama", model, host=st.session_state["ollama_host"], timeout_s=int(st.session_state["timeout_s"]))
-
-        system_prompt = build_system_prompt(job_role)
-        user_text = "Start the interview now. Ask the first question only."
-
-        try:
-            info("=== LLM CALL (opening) ===")
-            info(f"Model: {model} | Host: {st.session_state['ollama_host']}")
-            info(system_prompt)
-            info(user_text)
-        except Exception:
-            pass
-
-        out_container = st.empty()
-        pb = st.progress(0, text="Generating...")
-        accum = []
-        progress_val = 0
-
-        try:
-            for chunk in llm.stream_reply(system_prompt, user_text):
-                accum.append(chunk)
-                progress_val = min(99, progress_val + 1)
-                pb.progress(progress_val, text="Generating...")
-                time.sleep(0.01)
-            pb.progress(100, text="Done.")
-        except Exception as e:
-            out_container.markdown(f"**Interviewer:** [LLM error: {e}]")
-            error(f"LLM error: {e}")
-
-        reply = "".join(accum)
-        try:
-            info("=== RAW LLM OUTPUT ===")
-            info(reply)
-        except Exception:
-            pass
-
-        reply_clean = extract_first_question(reply)
-        try:
-            success("=== EXTRACTED QUESTION ===")
-            success(reply_clean)
-        except Exception:
-            pass
-
-        if reply_clean:
-            st.session_state.setdefault("messages", []).append({"role": "assistant", "content": reply_clean})
-            out_container.markdown(f"**Interviewer:** {reply_clean}")
-            if speak:
-                _speak(reply_clean)
+        _run_turn(llm, job_role, speak, audio=None, metrics=metrics)
 
     st.divider()
     st.subheader("Answer")
     st.caption("Record your answer. When you stop, it will be transcribed and sent to the interviewer.")
 
+    keep_recordings = st.checkbox("Keep answer recordings in .cache/audio", value=False)
     audio_bytes = _mic_widget()
     if audio_bytes:
-        # Save and play back
-        Path(".cache/audio").mkdir(parents=True, exist_ok=True)
-        ts = int(time.time())
-        ans_path = Path(".cache/audio") / f"answer_{ts}.wav"
-        ans_path.write_bytes(audio_bytes)
-        with open(ans_path, "rb") as f:
-            st.audio(f.read())
-
-        # Transcribe
-        try:
-            cfg = STTConfig(model=st.session_state.get("stt_model", "tiny.en"))
-            transcript = transcribe_bytes(audio_bytes, cfg)
-            transcript = (transcript or "").strip()
-        except Exception as e:
-            transcript = ""
-            st.error(f"STT failed: {e}")
-            error(f"STT failed: {e}")
-
-        if transcript:
-            st.markdown(f"**Candidate (you):** {transcript}")
-            st.session_state.setdefault("messages", []).append({"role": "user", "content": transcript})
-            _continue_interview(job_role, speak)
+        # Play back straight from memory; only write to disk when asked to
+        st.audio(audio_bytes)
+        save_to = None
+        if keep_recordings:
+            save_to = str(Path(".cache/audio") / f"answer_{time.strftime('%Y%m%d-%H%M%S')}_{uuid.uuid4().hex[:6]}.wav")
+
+        metrics = TurnMetrics(kind="answer")
+        llm = _make_llm(metrics)
+        if llm is not None:
+            _run_turn(llm, job_role, speak, audio=audio_bytes, save_to=save_to, metrics=metrics)
 
     # Show last interviewer turn if any
     if st.session_state.get("messages"):
@@ -164,67 +82,156 @@ def render_interview_tab():
             st.markdown(f"**Interviewer:** {last['content']}")
 
 
-def _continue_interview(job_role: str, speak: bool) -> None:
-    ollama_ok, _ = ollama_is_running(st.session_state["ollama_host"])
-    if not ollama_ok:
+def _make_llm(metrics: TurnMetrics) -> LLM | None:
+    hosts = parse_hosts([st.session_state["ollama_host"]] + parse_hosts(st.session_state.get("ollama_hosts")))
+    # One cached probe per host answers both health and installed models
+    with metrics.span("ollama_health_s"):
+        up = [s for s in (ollama_status(h) for h in hosts) if s.ok]
+    if not up:
         st.error("Ollama is not running. Start it in the LLM Setup tab.")
-        return
-
-    model = st.session_state.get("model") or choose_model_for_profile(
-        st.session_state["pc_profile"],
-        ollama_list_models(st.session_state["ollama_host"]),
+        return None
+
+    model = st.session_state.get("model")
+    if not model:
+        installed = sorted({m for s in up for m in s.models})
+        model = choose_model_for_profile(st.session_state["pc_profile"], installed)
+    metrics.model = model
+    info(f"Model: {model} | Hosts: {', '.join(hosts)}")
+    return create_llm(
+        "ollama",
+        model,
+        host=hosts[0],
+        hosts=hosts[1:],
+        timeout_s=int(st.session_state["timeout_s"]),
+        keep_alive=st.session_state.get("keep_alive"),
+        # num_thread for local servers, so streaming STT/TTS keep their cores
+        options=llm_options(hosts),
+        stop=INTERVIEWER_STOP,
+        num_predict=INTERVIEWER_NUM_PREDICT,
+        stop_when=has_complete_question,
     )
-    llm = create_llm("ollama", model, host=st.session_state["ollama_host"], timeout_s=int(st.session_state["timeout_s"]))
-
-    system_prompt = build_system_prompt(job_role)
-    user_text = _build_conversation_user_prompt(st.session_state.get("messages", []), latest_user=None)
-
-    try:
-        info("=== LLM CALL (follow-up) ===")
-        info(f"Model: {model} | Host: {st.session_state['ollama_host']}")
-        info(system_prompt)
-        info(user_text)
-    except Exception:
-        pass
-
-    pb = st.progress(0, text="Generating follow-up...")
-    accum = []
-    progress_val = 0
 
-    try:
-        for chunk in llm.stream_reply(system_prompt, user_text):
-            accum.append(chunk)
-            progress_val = min(99, progress_val + 1)
-            pb.progress(progress_val, text="Generating follow-up...")
-            time.sleep(0.01)
-        pb.progress(100, text="Done.")
-    except Exception as e:
-        st.error(f"LLM error: {e}")
-        error(f"LLM error: {e}")
-        return
-
-    reply = "".join(accum)
-    try:
-        info("=== RAW LLM OUTPUT (follow-up) ===")
-        info(reply)
-    except Exception:
-        pass
 
-    reply_clean = extract_first_question(reply) or reply.strip()
-    if reply_clean:
-        st.session_state.setdefault("messages", []).append({"role": "assistant", "content": reply_clean})
-        st.markdown(f"**Interviewer:** {reply_clean}")
-        if speak:
-            _speak(reply_clean)
-
-
-def _speak(text: str) -> None:
-    try:
-        Path(".cache/audio").mkdir(parents=True, exist_ok=True)
-        out_path = str(Path(".cache/audio").joinpath(f"reply_{int(time.time())}.wav"))
-        audio_path = tts.synthesize(text, voice=None, out_path=out_path)
-        if audio_path and Path(audio_path).exists():
-            with open(audio_path, "rb") as f:
-                st.audio(f.read(), format="audio/wav")
-    except Exception as e:
-        st.warning(f"TTS failed: {e}")
+def _run_turn(
+    llm: LLM,
+    job_role: str,
+    speak: bool,
+    audio: bytes | None,
+    save_to: str | None = None,
+    metrics: TurnMetrics | None = None,
+) -> None:
+    """Run one pipelined turn and render its events as they arrive."""
+    pipeline = TurnPipeline(
+        llm,
+        stt_cfg=stt_config_for_plan(st.session_state.get("stt_model", "tiny.en"), profile=st.session_state.get("pc_profile")),
+        speak=speak,
+        tts_cache=tts.get_tts_cache(),
+        memory=_memory(llm),
+    )
+    messages = st.session_state.setdefault("messages", [])
+    candidate = st.empty()
+    queue_note = st.empty()
+    prompt_note = st.empty()
+    out_container = st.empty()
+    view = ThrottledText(lambda text: out_container.markdown(f"**Interviewer:** {text}▌"), fps=30.0)
+    player = _SpeechPlayer()
+
+    history = list(messages)
+    for ev in pipeline.run(build_system_prompt(job_role), history, audio=audio, save_audio_to=save_to, metrics=metrics):
+        if ev.kind == "transcript":
+            candidate.markdown(f"**Candidate (you):** {ev.data}")
+            messages.append({"role": "user", "content": ev.data})
+        elif ev.kind == "queued":
+            if ev.data:
+                queue_note.info(f"Other interviews are using the model - you are #{ev.data} in the queue.")
+            else:
+                queue_note.empty()
+        elif ev.kind == "prompt":
+            tokens, budget = ev.data.get("tokens", 0), ev.data.get("budget")
+            if ev.data.get("dropped"):
+                prompt_note.warning(
+                    f"Prompt is over the model's context budget; {ev.data['dropped']} oldest messages were left out "
+                    "until the conversation summary catches up."
+                )
+            elif budget and tokens > 0.9 * budget:
+                prompt_note.warning(f"Prompt ~{tokens} tokens is close to the {budget}-token context budget.")
+            else:
+                prompt_note.caption(f"Prompt ~{tokens} tokens" + (f" of {budget}" if budget else ""))
+        elif ev.kind == "token":
+            view.feed(ev.data[len(view.text):])
+        elif ev.kind == "question":
+            success(f"=== EXTRACTED QUESTION === {ev.data}")
+            messages.append({"role": "assistant", "content": ev.data})
+            out_container.markdown(f"**Interviewer:** {ev.data}")
+        elif ev.kind == "audio":
+            player.enqueue(ev.data)
+        elif ev.kind == "error":
+            st.error(ev.data)
+        elif ev.kind == "timings":
+            ev.data["turn"] = len(messages)
+            st.session_state.setdefault("metrics", []).append(ev.data)
+            append_jsonl(ev.data)
+            debug(f"Turn metrics: {ev.data['metrics']}")
+        player.tick()
+    player.finish()
+
+
+def _memory(llm: LLM) -> ConversationMemory:
+    """Session-wide rolling memory; its summarizer follows the current model."""
+    mem = st.session_state.get("memory")
+    if not isinstance(mem, ConversationMemory):
+        mem = st.session_state["memory"] = ConversationMemory()
+    model = getattr(llm, "model", "")
+    if mem.model != model:
+        # Budget the prompt for the window the server will actually allocate
+        mem.model = model
+        mem.context_tokens = model_limits(model, getattr(llm, "host", None), getattr(llm, "options", None)).context_tokens
+    if getattr(mem.llm, "model", None) != model:
+        mem.llm = create_llm(
+            "ollama",
+            model,
+            host=getattr(llm, "host", None),
+            hosts=getattr(llm, "hosts", None),
+            timeout_s=int(st.session_state["timeout_s"]),
+            keep_alive=st.session_state.get("keep_alive"),
+            # Same load-time options as the interviewer, or Ollama reloads the model
+            options=getattr(llm, "options", None),
+            num_predict=SUMMARY_NUM_PREDICT,
+        )
+    return mem
+
+
+class _SpeechPlayer:
+    """Play speech segments back to back in one slot while the turn keeps running."""
+
+    def __init__(self) -> None:
+        self.slot = st.empty()
+        self.queue: list[str] = []
+        self.played: list[str] = []
+        self.busy_until = 0.0
+
+    def enqueue(self, path: str) -> None:
+        if path and Path(path).exists():
+            self.queue.append(path)
+
+    def tick(self) -> None:
+        if self.queue and time.monotonic() >= self.busy_until:
+            path = self.queue.pop(0)
+            try:
+                self.slot.audio(Path(path).read_bytes(), format="audio/wav", autoplay=True)
+            except Exception as e:
+                st.warning(f"TTS failed: {e}")
+                return
+            self.played.append(path)
+            self.busy_until = time.monotonic() + tts.wav_duration_s(path)
+
+    def finish(self) -> None:
+        """Play what is left, then leave the whole reply in the slot for replay."""
+        while self.queue:
+            time.sleep(max(0.0, self.busy_until - time.monotonic()))
+            self.tick()
+        if len(self.played) > 1:
+            time.sleep(max(0.0, self.busy_until - time.monotonic()))
+            self.slot.audio(tts.concat_wav(self.played), format="audio/wav")
+        if self.played:
+            debug(f"TTS cache: {tts.get_tts_cache().stats()}")
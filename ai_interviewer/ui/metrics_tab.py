@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import streamlit as st
+
+from ai_interviewer.metrics import METRICS_JSONL, summarize, to_jsonl
+
+
+def render_metrics_tab():
+    st.header("Metrics")
+    turns = st.session_state.get("metrics", [])
+    if not turns:
+        st.info("No turns measured yet.")
+        return
+
+    st.caption(f"Latency across {len(turns)} turn(s). Durations in ms. Also appended to {METRICS_JSONL}.")
+    st.dataframe(summarize(turns), use_container_width=True, hide_index=True)
+
+    last = turns[-1]
+    st.subheader("Last turn")
+    st.caption(f"{last.get('kind', '')} · {last.get('model', '')}")
+    rows = []
+    for name, value in sorted((last.get("metrics") or {}).items()):
+        if name.endswith("_s"):
+            rows.append({"metric": name, "value": f"{value * 1000:.0f} ms"})
+        else:
+            rows.append({"metric": name, "value": f"{value:.1f}"})
+    st.dataframe(rows, use_container_width=True, hide_index=True)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button(
+            "Download JSONL",
+            data=to_jsonl(turns),
+            file_name="interview_metrics.jsonl",
+            mime="application/x-ndjson",
+        )
+    with col2:
+        if st.button("Clear metrics"):
+            st.session_state["metrics"] = []
+            st.rerun()
@@ -5,8 +5,8 @@ import streamlit as st
 
 from ai_interviewer.llm import (
     has_ollama_cli,
-    ollama_is_running,
-    ollama_list_models,
+    ollama_status,
+    invalidate_ollama_status,
     ollama_quick_test,
     start_ollama_server,
     stop_ollama_server,
@@ -15,14 +15,24 @@ from ai_interviewer.llm import (
     install_ollama_user_local,
     delete_ollama_model,
     delete_ollama_model_http,
+    http_pool_stats,
+    scheduler_stats,
+    host_pool_stats,
+    parse_hosts,
+    start_warmup,
+    warmup_due,
+    warmup_status,
+    resident_models,
 )
 from ai_interviewer.utils.model_catalog import (
     pc_profile_model_candidates,
     choose_model_for_profile,
-    get_model_size_label,
 )
 from ai_interviewer.utils.progress import parse_percent
 from ai_interviewer.profiles import PCProfile, PROFILE_LABELS, normalize_profile
+from ai_interviewer.hardware import auto_plan, get_hardware
+from ai_interviewer.catalog import describe_model, model_index
+from ai_interviewer.resources import get_resource_plan, llm_options
 from ai_interviewer.utils.log import info, warn, error, success, debug
 
 
@@ -78,19 +88,49 @@ def render_setup_tab():
         selected_profile = next(p for p in PCProfile if p.value == selected_label)
         if selected_profile != normalize_profile(st.session_state.get("pc_profile")):
             st.session_state["pc_profile"] = selected_profile
-            installed_now = ollama_list_models(st.session_state.get("ollama_host", "http://localhost:11434"))
+            installed_now = ollama_status(st.session_state.get("ollama_host", "http://localhost:11434")).models
             st.session_state["model"] = choose_model_for_profile(selected_profile, installed_now)
+        if selected_profile == PCProfile.AUTO:
+            try:
+                hw = get_hardware()
+                plan = auto_plan(hw)
+                st.caption(
+                    f"Detected: {hw.physical_cores} cores, {hw.ram_gb:g} GB RAM ({hw.free_gb:g} GB free at startup), "
+                    f"AVX2 {'yes' if hw.avx2 else 'no' if hw.avx2 is False else '?'}, {hw.mem_bandwidth_gbs:g} GB/s"
+                    + (f", GPU {hw.gpu_name}" if hw.gpu_name else "")
+                )
+                st.caption(
+                    f"Plan: {plan.llm_model} (~{plan.est_tokens_per_sec:g} tok/s, {plan.llm_threads} threads) · "
+                    f"STT {plan.stt_model} ({plan.stt_compute_type}, {plan.stt_threads} threads) · " + "; ".join(plan.reasons)
+                )
+            except Exception as e:
+                warn(f"Hardware probe failed: {e}")
 
     with colB:
         default_host = os.getenv("OLLAMA_HOST", "http://localhost:11434")
         ollama_host = st.text_input("Ollama host", value=st.session_state.get("ollama_host", default_host))
         st.session_state["ollama_host"] = ollama_host
+        st.session_state["ollama_hosts"] = st.text_input(
+            "Additional Ollama hosts",
+            value=st.session_state.get("ollama_hosts", ""),
+            placeholder="http://box2:11434, http://box3:11434",
+            help="Interview requests are spread across all healthy hosts and fail over when one goes down.",
+        )
+        keep_alive = st.text_input(
+            "Keep model loaded for",
+            value=st.session_state.get("keep_alive", "30m"),
+            help="Ollama keep_alive, e.g. 10m, 1h, or -1 to keep it loaded until the server stops.",
+        )
+        st.session_state["keep_alive"] = keep_alive.strip() or "30m"
 
     # Availability and management
     cli_ok = has_ollama_cli("ollama")
     if st.button("Check Ollama availability"):
         info(f"GET {st.session_state['ollama_host'].rstrip('/')}/api/tags")
-    ollama_ok, ollama_msg = ollama_is_running(st.session_state["ollama_host"])
+        invalidate_ollama_status(st.session_state["ollama_host"])
+    # Cached across reruns; refreshed in the background and after start/stop/pull/delete
+    status = ollama_status(st.session_state["ollama_host"])
+    ollama_ok, ollama_msg = status.ok, status.message
     if ollama_ok:
         st.success("Ollama is running")
         success("Ollama check: OK")
@@ -98,6 +138,31 @@ def render_setup_tab():
         st.warning("Ollama not reachable")
         warn(f"Ollama check: {ollama_msg}")
 
+    pool = http_pool_stats().get(st.session_state["ollama_host"].rstrip("/"))
+    if pool and pool["requests"]:
+        st.caption(f"HTTP pool: {pool['requests']} requests over {pool['connections']} connections ({pool['reused']} reused)")
+        debug(f"HTTP pool stats: {pool}")
+    sched = scheduler_stats().get(st.session_state["ollama_host"].rstrip("/"))
+    if sched and (sched["running"] or sched["waiting"]):
+        st.caption(f"Requests: {sched['running']} running, {sched['waiting']} waiting ({', '.join(sched['models']) or '-'})")
+
+    extra_hosts = [h for h in parse_hosts(st.session_state.get("ollama_hosts")) if h != ollama_host.rstrip("/")]
+    if extra_hosts:
+        health = host_pool_stats()
+        for h in extra_hosts:
+            hs = ollama_status(h)
+            backoff = health.get(h, {}).get("backoff_s", 0)
+            state = "backing off" if backoff else ("up" if hs.ok else "unreachable")
+            st.caption(f"{h}: {state} · {len(hs.models)} models installed")
+
+    # Same options the interview sends; a different num_thread would reload the model
+    plan = get_resource_plan()
+    warm_options = llm_options(parse_hosts([ollama_host] + parse_hosts(st.session_state.get("ollama_hosts"))), plan)
+    st.caption(
+        f"CPU budget ({plan.mode}): LLM {warm_options.get('num_thread', 'server default')} threads · "
+        f"STT {plan.stt_threads} · TTS {plan.tts_threads or 'shared'}" + (" · pinned" if plan.pinned else "")
+    )
+
     cols = st.columns(3)
     with cols[0]:
         # Platform-aware install guidance
@@ -126,7 +191,13 @@ def render_setup_tab():
     with cols[1]:
         if st.button("Start Ollama", key="btn_start_ollama"):
             info("Running: ollama serve")
-            ok, msg, _ = start_ollama_server("ollama")
+            ok, msg, _ = start_ollama_server(
+                "ollama",
+                warm=st.session_state.get("model") or None,
+                host=st.session_state["ollama_host"],
+                keep_alive=st.session_state["keep_alive"],
+                options=warm_options,
+            )
             info(msg)
             if ok:
                 st.success("Starting Ollama server...")
@@ -161,10 +232,34 @@ def render_setup_tab():
     st.divider()
 
     # Models and cards
-    installed = ollama_list_models(st.session_state["ollama_host"]) if ollama_ok else []
+    installed = status.models if ollama_ok else []
     if not st.session_state.get("model"):
         st.session_state["model"] = choose_model_for_profile(st.session_state["pc_profile"], installed)
 
+    # Keep the selected model resident so the first question isn't a cold load
+    current = st.session_state.get("model")
+    if ollama_ok and current in installed:
+        host, keep_alive = st.session_state["ollama_host"], st.session_state["keep_alive"]
+        warm_key = (host, current, keep_alive, tuple(sorted(warm_options.items())))
+        if st.session_state.get("warmed") != warm_key or warmup_due(current, host, keep_alive):
+            st.session_state["warmed"] = warm_key
+            warm = start_warmup(current, host, keep_alive, options=warm_options)
+        else:
+            warm = warmup_status(current, host)
+        resident = resident_models(host)
+        if current in resident:
+            until = str(resident[current].get("expires_at") or "")[11:16]
+            st.caption(f"{current}: loaded" + (f" (kept until {until})" if until else ""))
+        elif warm.state in ("waiting", "loading"):
+            st.caption(f"{current}: loading in the background...")
+        elif warm.state == "error":
+            st.caption(f"{current}: warm-up failed ({warm.message})")
+            warn(f"Warm-up failed for {current}: {warm.message}")
+        if warm.state == "ready" and warm.load_s is not None:
+            debug(f"Warm-up {current}: {warm.load_s:.1f}s")
+
+    # Sizes/parameters/context come from the on-disk index; refreshed in the background
+    index = model_index(st.session_state["ollama_host"], status)
     suggestions = pc_profile_model_candidates(st.session_state["pc_profile"])
     all_models: list[str] = []
     for m in suggestions + installed:
@@ -183,11 +278,11 @@ def render_setup_tab():
 
             border_class = "border-green" if selected else ("border-yellow" if is_installed else "border-red")
             status = "selected" if selected else ("installed" if is_installed else "not installed")
-            size_label = get_model_size_label(model)
+            facts = describe_model(index[model]) if model in index else []
 
             st.markdown(
                 f"""
-                <div class=\"model-card {border_class}\">\n                  <div class=\"model-title\">{model}<span class=\"badge\">{status}</span></div>\n                  <div>Local model managed by Ollama.{(' Size: ' + size_label) if size_label else ''}</div>\n                </div>
+                <div class=\"model-card {border_class}\">\n                  <div class=\"model-title\">{model}<span class=\"badge\">{status}</span></div>\n                  <div>Local model managed by Ollama.{(' ' + ' · '.join(facts)) if facts else ''}</div>\n                </div>
                 """,
                 unsafe_allow_html=True,
             )
@@ -197,6 +292,8 @@ def render_setup_tab():
                 if not selected and st.button("Select", key=f"sel_{model}"):
                     st.session_state["model"] = model
                     st.success(f"Selected {model}")
+                    if is_installed:
+                        start_warmup(model, st.session_state["ollama_host"], st.session_state["keep_alive"], options=warm_options)
             with btn_cols[1]:
                 if not is_installed and st.button("Download", key=f"dl_{model}"):
                     cmd_log = (
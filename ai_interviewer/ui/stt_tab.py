@@ -3,8 +3,17 @@ from __future__ import annotations
 import streamlit as st
 
 from ai_interviewer.profiles import PCProfile, PROFILE_LABELS, normalize_profile
-from ai_interviewer.stt import stt_model_candidates, choose_stt_model_for_profile, STTConfig, transcribe_bytes
-from ai_interviewer.utils.log import info, warn, error, success
+from ai_interviewer.stt import (
+    stt_model_candidates,
+    choose_stt_model_for_profile,
+    transcribe_bytes,
+    preload_stt_model,
+    unload_stt_model,
+    stt_cache_stats,
+    best_stt_benchmark_row,
+    stt_config_for_plan,
+)
+from ai_interviewer.utils.log import info, error, success
 
 
 def _mic_input_widget() -> bytes | None:
@@ -64,7 +73,37 @@ def render_stt_tab():
         except Exception:
             index = 0
         sel = st.selectbox("STT Model", options=cands, index=index)
+        best = best_stt_benchmark_row(st.session_state.get("pc_profile", PCProfile.LOW))
+        if best:
+            st.caption(
+                f"Measured pick: `{best['model']}` ({best['compute_type']}, VAD {'on' if best.get('vad_filter') else 'off'}) · "
+                f"RTF {best['rtf']:.2f} · WER {best['wer'] * 100:.0f}%"
+            )
         st.session_state["stt_model"] = sel
+        # Load the newly selected model in the background so the first answer is warm
+        if st.session_state.get("stt_preloaded") != sel:
+            st.session_state["stt_preloaded"] = sel
+            cfg = stt_config_for_plan(sel, profile=st.session_state.get("pc_profile"))
+            preload_stt_model(sel, cfg.compute_type, cfg.device, cpu_threads=cfg.cpu_threads, num_workers=cfg.num_workers)
+            info(f"Preloading STT model {sel}")
+
+    resident = stt_cache_stats()
+    if resident:
+        st.caption("Loaded Whisper models")
+        for m in resident:
+            c1, c2 = st.columns([4, 1])
+            with c1:
+                approx = "" if m["measured"] else "≈ "
+                st.markdown(
+                    f"`{m['model']}` · {m['device']} · {m['compute_type']} · {m['cpu_threads'] or 'all'} threads · "
+                    f"{approx}{m['mb']} MB · loaded in {m['load_s']}s"
+                )
+            with c2:
+                if st.button("Unload", key=f"stt_unload_{m['model']}_{m['compute_type']}_{m['device']}"):
+                    unload_stt_model(m["model"], compute_type=m["compute_type"])
+                    if st.session_state.get("stt_preloaded") == m["model"]:
+                        st.session_state["stt_preloaded"] = None
+                    st.rerun()
 
     st.divider()
     st.subheader("Quick test")
@@ -73,7 +112,7 @@ def render_stt_tab():
     audio_bytes = _mic_input_widget()
     if audio_bytes:
         try:
-            cfg = STTConfig(model=st.session_state.get("stt_model", "tiny.en"))
+            cfg = stt_config_for_plan(st.session_state.get("stt_model", "tiny.en"), profile=st.session_state.get("pc_profile"))
             text = transcribe_bytes(audio_bytes, cfg)
             if text:
                 st.success(f"Transcribed: {text}")
@@ -22,6 +22,7 @@ def render_transcript_tab():
     with col1:
         if st.button("Clear transcript"):
             st.session_state["messages"] = []
+            st.session_state.pop("memory", None)
             st.success("Cleared.")
             st.rerun()
     with col2:
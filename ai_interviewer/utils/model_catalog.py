@@ -31,9 +31,17 @@ def pc_profile_model_candidates(profile: PCProfile | str) -> List[str]:
 
     - LOW: ascending by approximate size (smallest first)
     - HIGH: descending by approximate size (largest first)
+    - AUTO: models that fit this machine (see ai_interviewer.hardware), largest
+      first, then the rest ascending
     Unknown sizes (not in catalog) are appended at the end in arbitrary order.
     """
     p = normalize_profile(profile)
+    if p == PCProfile.AUTO:
+        from ai_interviewer.hardware import fitting_llm_models
+
+        fits = fitting_llm_models()
+        rest = [n for n, _ in sorted(MODEL_CATALOG.items(), key=lambda kv: kv[1]) if n not in fits]
+        return fits + rest
     known = sorted(MODEL_CATALOG.items(), key=lambda kv: kv[1])  # ascending by GB
     known_names = [name for name, _ in known]
     # In case there are models outside the catalog, list them last (none at the moment)
@@ -56,12 +64,13 @@ def get_model_size_gb(name: str) -> Optional[float]:
     return MODEL_CATALOG.get(name)
 
 
-def format_size_gb(gb: float) -> str:
+def format_size_gb(gb: float, estimate: bool = True) -> str:
+    prefix = "≈ " if estimate else ""
     if gb < 1.0:
         # Show in MB for tiny models
-        return f"≈ {int(gb * 1024)} MB"
+        return f"{prefix}{int(gb * 1024)} MB"
     # One decimal is enough for readability
-    return f"≈ {gb:.1f} GB"
+    return f"{prefix}{gb:.1f} GB"
 
 
 def get_model_size_label(name: str) -> Optional[str]:
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+
+def state_dir() -> Path:
+    """Per-user state directory (~/.cache/ai-interviewer), created on first use."""
+    p = Path(os.path.expanduser(os.getenv("AI_INTERVIEWER_STATE_DIR", "~/.cache/ai-interviewer")))
+    p.mkdir(parents=True, exist_ok=True)
+    return p
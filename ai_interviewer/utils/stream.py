@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import time
+from typing import Callable
+
+
+class ThrottledText:
+    """Accumulate streamed text and push it to ``sink`` at most ``fps`` times per second.
+
+    Every widget update in Streamlit is a websocket message, so pushing once per
+    token costs more than generating the token. ``min_chars`` skips updates whose
+    delta is too small to be worth a frame.
+    """
+
+    def __init__(self, sink: Callable[[str], None], fps: float = 30.0, min_chars: int = 1):
+        self.sink = sink
+        self.interval = 1.0 / fps if fps > 0 else 0.0
+        self.min_chars = max(1, int(min_chars))
+        self.parts: list[str] = []
+        self.updates = 0
+        self._chars = 0
+        self._shown = 0
+        self._last = 0.0
+
+    @property
+    def text(self) -> str:
+        return "".join(self.parts)
+
+    def feed(self, chunk: str) -> None:
+        if not chunk:
+            return
+        self.parts.append(chunk)
+        self._chars += len(chunk)
+        now = time.perf_counter()
+        if self._chars - self._shown >= self.min_chars and now - self._last >= self.interval:
+            self._push(now)
+
+    def flush(self) -> str:
+        if self._chars != self._shown:
+            self._push(time.perf_counter())
+        return self.text
+
+    def _push(self, now: float) -> None:
+        self.sink(self.text)
+        self.updates += 1
+        self._shown = self._chars
+        self._last = now
+
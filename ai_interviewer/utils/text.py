@@ -38,3 +38,10 @@ def extract_first_question(text: str) -> str:
     if qpos != -1:
         return t[: qpos + 1].strip().strip('"“”')
     return t
+
+
+def has_complete_question(text: str) -> bool:
+    """True once ``extract_first_question`` would return a finished question."""
+    if "?" not in (text or ""):
+        return False
+    return extract_first_question(text).endswith("?")
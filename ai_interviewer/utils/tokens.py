@@ -0,0 +1,59 @@
+"""Fast local token-count approximation per model family.
+
+Exact counts need the model's own tokenizer, which only the server has. For
+budgeting a prompt before sending it an estimate within ~10% is enough: text
+is split into words and punctuation. A word up to the family's "whole word"
+length is one token; longer words cost one more token per chars_per_token.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from typing import Dict, List, Tuple
+
+# (whole-word length, chars per extra token, tokens per chat message for role markers)
+# Larger vocabularies (llama3, qwen2, gemma) keep longer words whole; the 32k
+# SentencePiece vocabularies (llama2, tinyllama, mistral, phi) split more often.
+_FAMILIES: List[Tuple[str, int, float, int]] = [
+    ("llama3", 8, 4.4, 5),
+    ("llama2", 6, 3.4, 4),
+    ("tinyllama", 6, 3.4, 5),
+    ("codellama", 6, 3.4, 4),
+    ("mistral", 6, 3.5, 4),
+    ("mixtral", 6, 3.5, 4),
+    ("qwen", 8, 4.2, 5),
+    ("gemma", 8, 4.3, 5),
+    ("phi", 6, 3.6, 4),
+    ("deepseek", 7, 4.0, 5),
+]
+_DEFAULT = (7, 4.0, 4)
+
+_PIECE = re.compile(r"[A-Za-z]+|\d|[^\sA-Za-z\d]|\n")
+
+
+def family_params(model: str = "") -> Tuple[int, float, int]:
+    name = (model or "").lower()
+    for prefix, whole, cpt, overhead in _FAMILIES:
+        if name.startswith(prefix):
+            return whole, cpt, overhead
+    return _DEFAULT
+
+
+def count_tokens(text: str, model: str = "") -> int:
+    if not text:
+        return 0
+    whole, cpt, _ = family_params(model)
+    n = 0
+    for piece in _PIECE.findall(text):
+        # Digits and symbols are (nearly) always one token each
+        n += 1
+        if len(piece) > whole:
+            n += math.ceil((len(piece) - whole) / cpt)
+    return n
+
+
+def count_messages(messages: List[Dict[str, str]], model: str = "") -> int:
+    """Prompt tokens for chat messages, including the template's role markers."""
+    _, _, overhead = family_params(model)
+    return sum(count_tokens(m.get("content", ""), model) + overhead for m in messages) + overhead
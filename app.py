@@ -2,11 +2,13 @@ import os
 import streamlit as st
 
 from ai_interviewer.config import load_config
+from ai_interviewer.hardware import start_hardware_probe
 from ai_interviewer.profiles import normalize_profile
 from ai_interviewer.ui.setup_tab import render_setup_tab
 from ai_interviewer.ui.interview_tab import render_interview_tab
 from ai_interviewer.ui.stt_tab import render_stt_tab
 from ai_interviewer.ui.transcript_tab import render_transcript_tab
+from ai_interviewer.ui.metrics_tab import render_metrics_tab
 
 
 st.set_page_config(page_title="AI Interviewer", page_icon="🎙️", layout="wide")
@@ -14,16 +16,24 @@ st.set_page_config(page_title="AI Interviewer", page_icon="🎙️", layout="wid
 
 def main():
 	cfg = load_config()
+	if "hardware_probe" not in st.session_state:
+		# Measure once in the background; the Auto profile reads the cached result
+		st.session_state["hardware_probe"] = start_hardware_probe()
 
 	# Session defaults
 	st.session_state.setdefault("pc_profile", normalize_profile(cfg.pc_profile))
 	st.session_state.setdefault("ollama_host", os.getenv("OLLAMA_HOST", "http://localhost:11434"))
+	st.session_state.setdefault("ollama_hosts", os.getenv("OLLAMA_HOSTS", ""))
 	st.session_state.setdefault("timeout_s", int(os.getenv("OLLAMA_TIMEOUT", "600")))
+	st.session_state.setdefault("keep_alive", os.getenv("OLLAMA_KEEP_ALIVE", "30m"))
 	st.session_state.setdefault("model", cfg.llm_model)
 	st.session_state.setdefault("stt_model", os.getenv("STT_MODEL", "tiny.en"))
 	st.session_state.setdefault("messages", [])
+	st.session_state.setdefault("metrics", [])
 
-	tab_interview, tab_llm, tab_stt, tab_transcript = st.tabs(["Interview", "LLM Setup", "STT Setup", "Transcript"])
+	tab_interview, tab_llm, tab_stt, tab_transcript, tab_metrics = st.tabs(
+		["Interview", "LLM Setup", "STT Setup", "Transcript", "Metrics"]
+	)
 
 	with tab_llm:
 		render_setup_tab()
@@ -33,6 +43,8 @@ def main():
 		render_interview_tab()
 	with tab_transcript:
 		render_transcript_tab()
+	with tab_metrics:
+		render_metrics_tab()
 
 	st.caption("Tip: Set your PC profile in the LLM/STT Setup tabs; model selections will update automatically.")
 
@@ -0,0 +1,4 @@
+"""Headless benchmarks for the interview loop.
+
+Run from the repository root, e.g. ``python -m benchmarks.chat_ttft --help``.
+"""
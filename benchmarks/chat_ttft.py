@@ -0,0 +1,98 @@
+"""Time-to-first-token vs. interview length: flattened /api/generate vs. /api/chat.
+
+Replays a scripted interview against a running Ollama server. At every turn the
+full history is sent (as the app does) and the stream is closed after the first
+token, so only prefill + scheduling cost is measured.
+
+    python -m benchmarks.chat_ttft --model tinyllama:1.1b --turns 1,10,30
+    python -m benchmarks.chat_ttft --mock      # against benchmarks.mock_ollama
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from typing import Iterator, List
+
+from ai_interviewer.llm import OllamaLLM, flatten_messages
+from ai_interviewer.prompts import build_chat_messages, build_system_prompt
+
+
+QUESTIONS = [
+    "Tell me about a project where you improved the performance of a Python service?",
+    "How did you measure where the time was going?",
+    "What trade-offs did you make between latency and throughput?",
+    "How do you decide between threads, processes and asyncio?",
+    "Describe how you would cache results that depend on user input?",
+]
+ANSWERS = [
+    "I profiled a Flask API that was slow under load and moved the heavy parsing into a worker pool.",
+    "I used py-spy and request-level timing logs, then compared percentiles before and after.",
+    "We batched database writes, which raised tail latency a bit but doubled throughput.",
+    "Threads for blocking IO, processes for CPU bound work, asyncio when there are many sockets.",
+    "I would hash the normalized inputs and store results with a TTL and an LRU bound.",
+]
+
+
+def scripted_history(turns: int) -> List[dict]:
+    history: List[dict] = []
+    for i in range(turns):
+        history.append({"role": "assistant", "content": QUESTIONS[i % len(QUESTIONS)]})
+        history.append({"role": "user", "content": ANSWERS[i % len(ANSWERS)]})
+    return history
+
+
+def first_token_s(stream: Iterator[str]) -> float:
+    t0 = time.perf_counter()
+    try:
+        for _chunk in stream:
+            return time.perf_counter() - t0
+    finally:
+        close = getattr(stream, "close", None)
+        if close:
+            close()
+    return float("nan")
+
+
+def main(argv: List[str] | None = None) -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--host", default=os.getenv("OLLAMA_HOST", "http://localhost:11434"))
+    ap.add_argument("--model", default=os.getenv("LLM_MODEL", "tinyllama:1.1b"))
+    ap.add_argument("--turns", default="1,10,30", help="comma-separated turn numbers to report")
+    ap.add_argument("--mock", action="store_true", help="start a local mock Ollama instead of using --host")
+    args = ap.parse_args(argv)
+
+    if args.mock:
+        from benchmarks.mock_ollama import MockConfig, MockOllama
+
+        with MockOllama(MockConfig(models=[args.model])) as mock:
+            args.host = mock.url
+            run(args)
+    else:
+        run(args)
+
+
+def run(args: argparse.Namespace) -> None:
+
+    report = sorted({int(t) for t in args.turns.split(",") if t.strip()})
+    system_prompt = build_system_prompt("Backend Engineer (Python)")
+
+    for mode in ("generate", "chat"):
+        # Prime with an unrelated prompt so neither mode starts from the other's cache
+        llm = OllamaLLM(model=args.model, host=args.host)
+        llm.generate_reply("", "Say ok.")
+        print(f"\n[{mode}]")
+        print(f"{'turn':>6} {'ttft_ms':>10} {'messages':>9}")
+        for turn in range(1, max(report) + 1):
+            chat = build_chat_messages(system_prompt, scripted_history(turn - 1))
+            if mode == "chat":
+                ttft = first_token_s(llm.stream_chat(chat))
+            else:
+                ttft = first_token_s(llm.stream_reply(*flatten_messages(chat)))
+            if turn in report:
+                print(f"{turn:>6} {ttft * 1000:>10.1f} {len(chat):>9}")
+
+
+if __name__ == "__main__":
+    main()
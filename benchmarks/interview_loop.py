@@ -0,0 +1,210 @@
+"""Interview-loop benchmark against the mock Ollama server (no model, no Streamlit).
+
+Measures each layer separately so a regression points at its layer:
+
+    generate   OllamaLLM.generate_reply and chat_reply end-to-end latency and
+               client overhead
+    stream     OllamaLLM.stream_reply and stream_chat TTFT, delivered tokens/s,
+               client overhead
+    extract    extract_first_question cost per call
+    interview  scripted multi-turn interview through TurnPipeline (+ memory)
+
+Client overhead is measured latency minus the latency the mock was told to
+model, so it is what this code adds on top of the server.
+
+    python -m benchmarks.interview_loop --turns 20 --tokens-per-sec 80
+    python -m benchmarks.interview_loop --json results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from typing import Any, Dict, List, Optional
+
+from ai_interviewer.llm import OllamaLLM, _server_stats, flatten_messages
+from ai_interviewer.memory import ConversationMemory
+from ai_interviewer.metrics import percentile, summarize
+from ai_interviewer.pipeline import TurnPipeline
+from ai_interviewer.prompts import INTERVIEWER_NUM_PREDICT, INTERVIEWER_STOP, build_chat_messages, build_system_prompt
+from ai_interviewer.utils.log import set_level
+from ai_interviewer.utils.text import extract_first_question, has_complete_question
+from benchmarks.chat_ttft import ANSWERS, scripted_history
+from benchmarks.mock_ollama import MockConfig, MockOllama, _split_tokens
+
+
+MODEL = "tinyllama:1.1b"
+
+
+def _row(name: str, values_s: List[float], unit_scale: float = 1000.0, unit: str = "ms") -> Dict[str, Any]:
+    return {
+        "metric": name,
+        "unit": unit,
+        "n": len(values_s),
+        "p50": round(percentile(values_s, 50) * unit_scale, 3),
+        "p95": round(percentile(values_s, 95) * unit_scale, 3),
+    }
+
+
+def _modelled_ttft(cfg: MockConfig) -> float:
+    # Lower bound: latency only (prefill varies with the prompt cache)
+    return cfg.latency_s
+
+
+def bench_generate(mock: MockOllama, n: int) -> List[Dict[str, Any]]:
+    cfg = mock.config
+    llm = OllamaLLM(model=MODEL, host=mock.url, num_predict=INTERVIEWER_NUM_PREDICT)
+    chat = build_chat_messages(build_system_prompt("Backend Engineer (Python)"), scripted_history(3))
+    system_prompt, user_text = flatten_messages(chat)
+    calls = {
+        "generate": lambda: llm.generate_reply(system_prompt, user_text),
+        "chat": lambda: llm.chat_reply(chat),
+    }
+    rows = []
+    for name, call in calls.items():
+        total, overhead = [], []
+        for _ in range(n):
+            t0 = time.perf_counter()
+            call()
+            dt = time.perf_counter() - t0
+            stats = _server_stats(mock.last_done)
+            server_s = stats.get("llm_prompt_eval_s", 0.0) + stats.get("llm_eval_s", 0.0) + cfg.latency_s
+            total.append(dt)
+            overhead.append(max(0.0, dt - server_s))
+        rows += [_row(f"{name}_total_s", total), _row(f"{name}_overhead_s", overhead)]
+    return rows
+
+
+def bench_stream(mock: MockOllama, n: int) -> List[Dict[str, Any]]:
+    cfg = mock.config
+    llm = OllamaLLM(model=MODEL, host=mock.url, num_predict=INTERVIEWER_NUM_PREDICT)
+    chat = build_chat_messages(build_system_prompt("Backend Engineer (Python)"), scripted_history(3))
+    system_prompt, user_text = flatten_messages(chat)
+    calls = {
+        "stream": lambda: llm.stream_reply(system_prompt, user_text),
+        "stream_chat": lambda: llm.stream_chat(chat),
+    }
+    per_token = 1.0 / cfg.tokens_per_sec
+    rows = []
+    for name, call in calls.items():
+        ttft, ttft_over, rate, chunk_over = [], [], [], []
+        for _ in range(n):
+            t0 = time.perf_counter()
+            first = None
+            chunks = 0
+            stream = call()
+            for _chunk in stream:
+                if first is None:
+                    first = time.perf_counter() - t0
+                chunks += 1
+            dt = time.perf_counter() - t0
+            if first is None:
+                continue
+            ttft.append(first)
+            ttft_over.append(max(0.0, first - _modelled_ttft(cfg) - stream.stats.get("llm_prompt_eval_s", 0.0)))
+            gen = dt - first
+            if chunks > 1 and gen > 0:
+                rate.append(chunks / gen)
+                chunk_over.append(max(0.0, gen / chunks - per_token))
+        rows += [
+            _row(f"{name}_ttft_s", ttft),
+            _row(f"{name}_ttft_overhead_s", ttft_over),
+            _row(f"{name}_chunk_overhead_s", chunk_over, 1e6, "us"),
+            _row(f"{name}_tokens_per_sec", rate, 1.0, "tok/s"),
+        ]
+    return rows
+
+
+def bench_extract(n: int) -> List[Dict[str, Any]]:
+    reply = MockConfig().reply
+    partials = ["".join(_split_tokens(reply)[:k]) for k in range(1, len(_split_tokens(reply)) + 1)]
+    full, per_stream = [], []
+    for _ in range(n):
+        t0 = time.perf_counter()
+        extract_first_question(reply)
+        full.append(time.perf_counter() - t0)
+        # What the pipeline does on every chunk of one reply
+        t0 = time.perf_counter()
+        for p in partials:
+            extract_first_question(p)
+            has_complete_question(p)
+        per_stream.append(time.perf_counter() - t0)
+    return [_row("extract_full_reply_s", full, 1e6, "us"), _row("extract_per_stream_s", per_stream, 1e6, "us")]
+
+
+def bench_interview(mock: MockOllama, turns: int, use_memory: bool) -> List[Dict[str, Any]]:
+    llm = OllamaLLM(
+        model=MODEL,
+        host=mock.url,
+        stop=INTERVIEWER_STOP,
+        num_predict=INTERVIEWER_NUM_PREDICT,
+        stop_when=has_complete_question,
+    )
+    memory = ConversationMemory(OllamaLLM(model=MODEL, host=mock.url), model=MODEL) if use_memory else None
+    pipeline = TurnPipeline(llm, speak=False, memory=memory)
+    system_prompt = build_system_prompt("Backend Engineer (Python)")
+    history: List[dict] = []
+    results = []
+    for i in range(turns):
+        timings: Dict[str, Any] = {}
+        question = ""
+        for ev in pipeline.run(system_prompt, history):
+            if ev.kind == "question":
+                question = ev.data
+            elif ev.kind == "timings":
+                timings = ev.data
+            elif ev.kind == "error":
+                raise RuntimeError(ev.data)
+        vals = timings.get("metrics", {})
+        # What the pipeline adds around the LLM call (threads, queues, prompt build)
+        vals["pipeline_overhead_s"] = max(0.0, vals.get("total_s", 0.0) - vals.get("llm_total_s", 0.0))
+        results.append(timings)
+        history += [{"role": "assistant", "content": question}, {"role": "user", "content": ANSWERS[i % len(ANSWERS)]}]
+        if memory is not None:
+            memory.wait()
+    return summarize(results)
+
+
+def _print(title: str, rows: List[Dict[str, Any]]) -> None:
+    print(f"\n[{title}]")
+    print(f"{'metric':<28} {'unit':>6} {'n':>5} {'p50':>10} {'p95':>10}")
+    for r in rows:
+        print(f"{r['metric']:<28} {r['unit']:>6} {r['n']:>5} {r['p50']:>10} {r['p95']:>10}")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--tokens-per-sec", type=float, default=200.0)
+    ap.add_argument("--latency-ms", type=float, default=10.0)
+    ap.add_argument("--prefill-us", type=float, default=200.0, help="modelled prefill cost per uncached prompt token")
+    ap.add_argument("-n", type=int, default=20, help="repetitions for the single-call benchmarks")
+    ap.add_argument("--turns", type=int, default=15)
+    ap.add_argument("--no-memory", action="store_true", help="send the full history every turn")
+    ap.add_argument("--json", help="also write results to this file")
+    ap.add_argument("--verbose", action="store_true", help="keep the app's per-turn INFO logs")
+    args = ap.parse_args(argv)
+    if not args.verbose:
+        set_level("WARN")
+
+    cfg = MockConfig(
+        tokens_per_sec=args.tokens_per_sec,
+        latency_s=args.latency_ms / 1000.0,
+        prefill_s_per_token=args.prefill_us / 1e6,
+    )
+    results: Dict[str, List[Dict[str, Any]]] = {}
+    with MockOllama(cfg) as mock:
+        results["generate"] = bench_generate(mock, args.n)
+        results["stream"] = bench_stream(mock, args.n)
+        results["extract"] = bench_extract(args.n * 10)
+        results["interview"] = bench_interview(mock, args.turns, not args.no_memory)
+    for title, rows in results.items():
+        _print(title, rows)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"config": vars(args), "results": results}, f, indent=2)
+        print(f"\nWrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,336 @@
+"""Local stand-in for an Ollama server, for benchmarks without a real model.
+
+Speaks the parts of the HTTP API the app uses: /api/generate and /api/chat
+(streaming NDJSON or a single JSON object), /api/tags, /api/ps, /api/show,
+/api/pull (NDJSON progress) and /api/delete. options.num_predict and
+options.stop cut the canned reply as they would a real one. Latency is
+modelled, not real:
+
+    first token  = load_s (first request per model) + latency_s
+                   + uncached prompt tokens * prefill_s_per_token
+    each token   = 1 / tokens_per_sec
+
+The prompt cache mimics Ollama's KV reuse: the longest common prefix with the
+previous prompt for the same model costs no prefill.
+
+    python -m benchmarks.mock_ollama --port 11435 --tokens-per-sec 40
+    OLLAMA_HOST=http://127.0.0.1:11435 streamlit run app.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+from ai_interviewer.utils.tokens import count_tokens
+
+
+DEFAULT_REPLY = (
+    "Great, let's begin. Can you walk me through a recent project where you had to "
+    "improve the performance of a Python service? After that I would like to hear about "
+    "how you measured the improvement and what you would do differently next time."
+)
+
+
+@dataclass
+class MockConfig:
+    tokens_per_sec: float = 50.0
+    latency_s: float = 0.02
+    prefill_s_per_token: float = 0.0005
+    load_s: float = 0.0
+    models: List[str] = field(default_factory=lambda: ["tinyllama:1.1b", "llama3.2:3b"])
+    reply: str = DEFAULT_REPLY
+    context_length: int = 4096
+    pull_steps: int = 20
+
+
+def _split_tokens(text: str) -> List[str]:
+    # Word-ish chunks with their trailing space, like a tokenizer's output stream
+    out, cur = [], ""
+    for ch in text:
+        cur += ch
+        if ch == " ":
+            out.append(cur)
+            cur = ""
+    if cur:
+        out.append(cur)
+    return out
+
+
+def _common_prefix(a: str, b: str) -> int:
+    n = min(len(a), len(b))
+    i = 0
+    while i < n and a[i] == b[i]:
+        i += 1
+    return i
+
+
+class MockOllama:
+    """Threaded mock server; use as a context manager or call start()/stop()."""
+
+    def __init__(self, config: Optional[MockConfig] = None, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.config = config or MockConfig()
+        self._bind = (host, port)
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._lock = threading.Lock()
+        self._loaded: Dict[str, float] = {}
+        self._last_prompt: Dict[str, str] = {}
+        self.requests = 0
+        # Final (done) line of the most recent generation, for comparing client timings against
+        self.last_done: Dict[str, Any] = {}
+
+    @property
+    def url(self) -> str:
+        assert self._server is not None, "server not started"
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockOllama":
+        mock = self
+
+        class Handler(_Handler):
+            server_mock = mock
+
+        self._server = ThreadingHTTPServer(self._bind, Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="mock-ollama", daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "MockOllama":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    def _first_token_delay(self, model: str, prompt: str) -> Dict[str, float]:
+        cfg = self.config
+        with self._lock:
+            self.requests += 1
+            load = 0.0 if model in self._loaded else cfg.load_s
+            self._loaded[model] = time.time()
+            cached = _common_prefix(self._last_prompt.get(model, ""), prompt)
+            self._last_prompt[model] = prompt
+        prompt_tokens = count_tokens(prompt, model)
+        fresh = count_tokens(prompt[cached:], model)
+        prefill = fresh * cfg.prefill_s_per_token
+        return {"load": load, "prefill": prefill, "prompt_tokens": prompt_tokens, "delay": load + cfg.latency_s + prefill}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Small NDJSON writes must not wait on Nagle/delayed-ACK (~40ms per line)
+    disable_nagle_algorithm = True
+    server_mock: MockOllama
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+    # -- plumbing --
+
+    def _body(self) -> Dict[str, Any]:
+        n = int(self.headers.get("Content-Length") or 0)
+        try:
+            data = json.loads(self.rfile.read(n) or b"{}")
+        except ValueError:
+            data = {}
+        return data if isinstance(data, dict) else {}
+
+    def _json(self, obj: Any, code: int = 200) -> None:
+        body = json.dumps(obj).encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _start_stream(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+    def _line(self, obj: Dict[str, Any]) -> bool:
+        data = (json.dumps(obj) + "\n").encode()
+        try:
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+            self.wfile.flush()
+            return True
+        except (BrokenPipeError, ConnectionResetError):
+            # Client closed the stream (stop_when / cancellation): stop generating
+            return False
+
+    def _end_stream(self) -> None:
+        try:
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    # -- endpoints --
+
+    def do_GET(self) -> None:
+        cfg = self.server_mock.config
+        if self.path == "/api/tags":
+            self._json({"models": [{"name": m, "model": m, "size": 1_000_000_000, "details": {}} for m in cfg.models]})
+        elif self.path == "/api/ps":
+            self._json({"models": [{"name": m, "model": m} for m in list(self.server_mock._loaded)]})
+        elif self.path in ("/", "/api/version"):
+            self._json({"version": "0.0.0-mock"})
+        else:
+            self._json({"error": "not found"}, 404)
+
+    def do_DELETE(self) -> None:
+        self.do_POST()
+
+    def do_POST(self) -> None:
+        body = self._body()
+        if self.path == "/api/generate":
+            prompt = f"{body.get('system', '')}\n{body.get('prompt', '')}"
+            self._generate(body, prompt, chat=False)
+        elif self.path == "/api/chat":
+            prompt = "\n".join(f"{m.get('role')}: {m.get('content', '')}" for m in body.get("messages") or [])
+            self._generate(body, prompt, chat=True)
+        elif self.path == "/api/show":
+            self._show(body)
+        elif self.path == "/api/pull":
+            self._pull(body)
+        elif self.path == "/api/delete":
+            name = body.get("model") or body.get("name")
+            models = self.server_mock.config.models
+            if name in models:
+                models.remove(name)
+                self._json({})
+            else:
+                self._json({"error": f"model '{name}' not found"}, 404)
+        else:
+            self._json({"error": "not found"}, 404)
+
+    def _generate(self, body: Dict[str, Any], prompt: str, chat: bool) -> None:
+        mock = self.server_mock
+        cfg = mock.config
+        model = body.get("model") or ""
+        if model not in cfg.models:
+            self._json({"error": f"model '{model}' not found, try pulling it first"}, 404)
+            return
+        t = mock._first_token_delay(model, prompt)
+        opts = body.get("options") or {}
+        reply = cfg.reply
+        # Like the server: the reply ends before the first stop sequence, which is not sent
+        cuts = [reply.find(stop) for stop in opts.get("stop") or [] if stop and stop in reply]
+        if cuts:
+            reply = reply[: min(cuts)]
+        tokens = _split_tokens(reply)
+        if opts.get("num_predict"):
+            tokens = tokens[: int(opts["num_predict"])]
+        if not (body.get("prompt") or body.get("messages")):
+            tokens = []  # empty request: load only (warm-up)
+
+        def line(text: str, done: bool) -> Dict[str, Any]:
+            j: Dict[str, Any] = {"model": model, "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ"), "done": done}
+            if chat:
+                j["message"] = {"role": "assistant", "content": text}
+            else:
+                j["response"] = text
+            return j
+
+        t0 = time.perf_counter()
+        time.sleep(t["delay"])
+        per_token = 1.0 / cfg.tokens_per_sec if cfg.tokens_per_sec > 0 else 0.0
+        final = line("", True)
+        final.update(
+            load_duration=int(t["load"] * 1e9),
+            prompt_eval_count=t["prompt_tokens"],
+            prompt_eval_duration=int(t["prefill"] * 1e9),
+            eval_count=len(tokens),
+            eval_duration=int(len(tokens) * per_token * 1e9),
+        )
+        mock.last_done = final
+        if body.get("stream", True) is False:
+            time.sleep(len(tokens) * per_token)
+            out = line("".join(tokens), True)
+            final.pop("message", None)
+            final.pop("response", None)
+            out.update(final, total_duration=int((time.perf_counter() - t0) * 1e9))
+            self._json(out)
+            return
+        self._start_stream()
+        for tok in tokens:
+            if not self._line(line(tok, False)):
+                return
+            time.sleep(per_token)
+        final["total_duration"] = int((time.perf_counter() - t0) * 1e9)
+        self._line(final)
+        self._end_stream()
+
+    def _show(self, body: Dict[str, Any]) -> None:
+        cfg = self.server_mock.config
+        model = body.get("model") or body.get("name") or ""
+        if model not in cfg.models:
+            self._json({"error": f"model '{model}' not found"}, 404)
+            return
+        self._json(
+            {
+                "parameters": "stop \"<|eot_id|>\"",
+                "details": {"family": "llama", "parameter_size": "1.1B", "quantization_level": "Q4_0"},
+                "model_info": {
+                    "general.architecture": "llama",
+                    "general.parameter_count": 1_100_000_000,
+                    "llama.context_length": cfg.context_length,
+                },
+            }
+        )
+
+    def _pull(self, body: Dict[str, Any]) -> None:
+        cfg = self.server_mock.config
+        model = body.get("model") or body.get("name") or ""
+        total = 1_000_000_000
+        self._start_stream()
+        self._line({"status": "pulling manifest"})
+        for i in range(1, cfg.pull_steps + 1):
+            if not self._line({"status": "pulling model", "digest": "sha256:mock", "total": total, "completed": total * i // cfg.pull_steps}):
+                return
+            time.sleep(0.01)
+        if model and model not in cfg.models:
+            cfg.models.append(model)
+        self._line({"status": "success"})
+        self._end_stream()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=int(os.getenv("MOCK_OLLAMA_PORT", "11435")))
+    ap.add_argument("--tokens-per-sec", type=float, default=50.0)
+    ap.add_argument("--latency-ms", type=float, default=20.0)
+    ap.add_argument("--load-ms", type=float, default=0.0, help="one-off load delay per model")
+    ap.add_argument("--models", default="tinyllama:1.1b,llama3.2:3b")
+    args = ap.parse_args(argv)
+
+    cfg = MockConfig(
+        tokens_per_sec=args.tokens_per_sec,
+        latency_s=args.latency_ms / 1000.0,
+        load_s=args.load_ms / 1000.0,
+        models=[m.strip() for m in args.models.split(",") if m.strip()],
+    )
+    mock = MockOllama(cfg, args.host, args.port).start()
+    print(f"Mock Ollama listening on {mock.url} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        mock.stop()
+
+
+if __name__ == "__main__":
+    main()
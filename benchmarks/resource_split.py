@@ -0,0 +1,152 @@
+"""Find the best LLM/STT thread split for overlapped turns on this machine.
+
+For every candidate split a turn is replayed N times against a local Ollama
+server with the fixture corpus (see ``benchmarks.stt_fixtures``):
+
+    sequential  transcribe an answer, then stream the next question
+    overlapped  transcribe while the question streams (streaming STT + LLM)
+
+Reported per split: STT time, LLM TTFT, LLM tokens/s and turn wall time. The
+"default" row sends no num_thread and lets CTranslate2 pick its thread count,
+which is the contention this layer is meant to remove. Changing num_thread
+reloads the model, so each split gets an untimed warm-up request first.
+
+    python -m benchmarks.stt_fixtures
+    python -m benchmarks.resource_split --model llama3.2:1b --stt-model base.en
+    AI_PIN_CPUS=1 python -m benchmarks.resource_split --ollama-pid $(pgrep -f "ollama serve")
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from ai_interviewer.hardware import get_hardware
+from ai_interviewer.llm import OllamaLLM, warm_model
+from ai_interviewer.metrics import percentile
+from ai_interviewer.prompts import INTERVIEWER_NUM_PREDICT, build_chat_messages, build_system_prompt
+from ai_interviewer.resources import PIN_CPUS, ResourcePlan, _split_cpus, available_cpus, pin_process
+from ai_interviewer.stt import STTConfig, _get_model, transcribe_file
+from ai_interviewer.utils.log import set_level
+from benchmarks.chat_ttft import scripted_history
+from benchmarks.stt_fixtures import load_corpus
+
+
+def candidate_splits(cores: int) -> List[Tuple[int, int]]:
+    """(llm_threads, stt_threads) pairs; (0, 0) is the unmanaged default."""
+    out = [(0, 0)]
+    for stt in range(1, max(1, cores // 2) + 1):
+        out.append((max(1, cores - stt), stt))
+    return out
+
+
+def _plan(llm: int, stt: int, pin: bool) -> ResourcePlan:
+    plan = ResourcePlan(mode="overlapped", llm_threads=llm, stt_threads=stt, stt_workers=1, tts_threads=0)
+    if pin and llm and stt:
+        plan.llm_cpus, plan.stt_cpus = _split_cpus(available_cpus(), [llm, stt])
+    return plan
+
+
+def _stream(llm: OllamaLLM, chat: List[Dict[str, str]], out: Dict[str, float]) -> None:
+    t0 = time.perf_counter()
+    first = None
+    chunks = 0
+    for _ in llm.stream_chat(chat):
+        if first is None:
+            first = time.perf_counter() - t0
+        chunks += 1
+    total = time.perf_counter() - t0
+    out["ttft_s"] = first if first is not None else total
+    out["llm_s"] = total
+    out["tok_s"] = chunks / (total - out["ttft_s"]) if chunks > 1 and total > out["ttft_s"] else 0.0
+
+
+def run_split(
+    args: argparse.Namespace, llm_threads: int, stt_threads: int, corpus: List[Dict[str, str]], ollama_pid: Optional[int]
+) -> Dict[str, Any]:
+    plan = _plan(llm_threads, stt_threads, args.pin)
+    options = {"num_thread": llm_threads} if llm_threads else {}
+    llm = OllamaLLM(model=args.model, host=args.host, num_predict=INTERVIEWER_NUM_PREDICT, options=options, scheduled=False)
+    cfg = STTConfig(model=args.stt_model, compute_type=args.compute_type, cpu_threads=stt_threads, cpus=tuple(plan.stt_cpus) or None)
+    if ollama_pid:
+        pin_process(ollama_pid, plan.llm_cpus or available_cpus())
+    # Untimed: load the model with this num_thread and the Whisper model with these threads
+    warm_model(args.model, args.host, options=options)
+    _get_model(cfg.model, compute_type=cfg.compute_type, device=cfg.device, cpu_threads=cfg.cpu_threads)
+    chat = build_chat_messages(build_system_prompt("Backend Engineer (Python)"), scripted_history(3))
+
+    rows: Dict[str, List[float]] = {k: [] for k in ("stt_s", "ttft_s", "tok_s", "turn_s")}
+    for i in range(args.n):
+        wav = corpus[i % len(corpus)]["audio"]
+        r: Dict[str, float] = {}
+        t0 = time.perf_counter()
+        if args.mode == "sequential":
+            transcribe_file(wav, cfg)
+            r["stt_s"] = time.perf_counter() - t0
+            _stream(llm, chat, r)
+        else:
+            th = threading.Thread(target=_stream, args=(llm, chat, r))
+            th.start()
+            transcribe_file(wav, cfg)
+            r["stt_s"] = time.perf_counter() - t0
+            th.join()
+        r["turn_s"] = time.perf_counter() - t0
+        for k in rows:
+            rows[k].append(r.get(k, 0.0))
+    return {
+        "llm_threads": llm_threads or "default",
+        "stt_threads": stt_threads or "default",
+        "pinned": plan.pinned,
+        **{f"{k}_p50": round(percentile(v, 50), 3) for k, v in rows.items()},
+        "turn_s_p95": round(percentile(rows["turn_s"], 95), 3),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--host", default="http://localhost:11434", help="a local Ollama; num_thread is ignored remotely")
+    ap.add_argument("--model", default="llama3.2:1b")
+    ap.add_argument("--stt-model", default="tiny.en")
+    ap.add_argument("--compute-type", default="int8")
+    ap.add_argument("--corpus", default=".cache/stt_fixtures")
+    ap.add_argument("--mode", choices=("overlapped", "sequential"), default="overlapped")
+    ap.add_argument("--splits", help="comma separated llm:stt pairs, e.g. 6:2,5:3 (default: a sweep)")
+    ap.add_argument("--pin", action="store_true", default=PIN_CPUS, help="pin STT (and --ollama-pid) to disjoint CPUs")
+    ap.add_argument("--ollama-pid", type=int, help="pid of the local `ollama serve` to pin with --pin")
+    ap.add_argument("-n", type=int, default=5, help="turns per split")
+    ap.add_argument("--json", help="also write results to this file")
+    args = ap.parse_args(argv)
+    set_level("WARN")
+
+    corpus = load_corpus(args.corpus)
+    if not corpus:
+        raise SystemExit(f"No fixtures in {args.corpus}; run `python -m benchmarks.stt_fixtures --out {args.corpus}` first.")
+    cores = min(get_hardware().physical_cores, len(available_cpus()))
+    if args.splits:
+        splits = [tuple(int(x) for x in p.split(":")) for p in args.splits.split(",") if p.strip()]
+    else:
+        splits = candidate_splits(cores)
+
+    print(f"{cores} physical cores, mode={args.mode}, pin={args.pin}")
+    print(f"{'llm':>7} {'stt':>7} {'stt_s':>7} {'ttft_s':>7} {'tok/s':>7} {'turn_s':>7} {'p95':>7}")
+    results = []
+    for llm_threads, stt_threads in splits:
+        r = run_split(args, llm_threads, stt_threads, corpus, args.ollama_pid if args.pin else None)
+        results.append(r)
+        print(
+            f"{r['llm_threads']!s:>7} {r['stt_threads']!s:>7} {r['stt_s_p50']:>7.2f} {r['ttft_s_p50']:>7.2f} "
+            f"{r['tok_s_p50']:>7.1f} {r['turn_s_p50']:>7.2f} {r['turn_s_p95']:>7.2f}"
+        )
+    best = min(results, key=lambda r: r["turn_s_p50"])
+    print(f"\nBest: LLM_THREADS={best['llm_threads']} STT_THREADS={best['stt_threads']} (turn p50 {best['turn_s_p50']:.2f}s)")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"config": vars(args), "cores": cores, "results": results, "best": best}, f, indent=2)
+        print(f"Wrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
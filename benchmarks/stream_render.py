@@ -0,0 +1,69 @@
+"""Render-loop overhead vs. token count: per-chunk updates vs. ThrottledText.
+
+Tokens are produced instantly so the numbers are pure UI-loop cost. Each sink
+update sleeps ``--update-cost-ms`` to stand in for a Streamlit websocket push.
+
+    python -m benchmarks.stream_render --tokens 50,200,1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable, Iterator, List
+
+from ai_interviewer.utils.stream import ThrottledText
+
+
+def fake_tokens(n: int) -> Iterator[str]:
+    for i in range(n):
+        yield f" tok{i}"
+
+
+def make_sink(cost_s: float) -> Callable[[str], None]:
+    def sink(_text: str) -> None:
+        if cost_s > 0:
+            time.sleep(cost_s)
+    return sink
+
+
+def legacy_loop(n: int, sink: Callable[[str], None]) -> int:
+    """The previous loop: a progress update plus a 10ms sleep for every chunk."""
+    accum: List[str] = []
+    updates = 0
+    for chunk in fake_tokens(n):
+        accum.append(chunk)
+        sink("".join(accum))
+        updates += 1
+        time.sleep(0.01)
+    return updates
+
+
+def throttled_loop(n: int, sink: Callable[[str], None], fps: float) -> int:
+    view = ThrottledText(sink, fps=fps)
+    for chunk in fake_tokens(n):
+        view.feed(chunk)
+    view.flush()
+    return view.updates
+
+
+def main(argv: List[str] | None = None) -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--tokens", default="50,200,1000")
+    ap.add_argument("--update-cost-ms", type=float, default=2.0)
+    ap.add_argument("--fps", type=float, default=30.0)
+    args = ap.parse_args(argv)
+
+    sink = make_sink(args.update_cost_ms / 1000.0)
+    print(f"{'tokens':>7} {'legacy_ms':>10} {'legacy_upd':>10} {'throttled_ms':>13} {'throttled_upd':>13}")
+    for n in [int(t) for t in args.tokens.split(",") if t.strip()]:
+        t0 = time.perf_counter()
+        lu = legacy_loop(n, sink)
+        t1 = time.perf_counter()
+        tu = throttled_loop(n, sink, args.fps)
+        t2 = time.perf_counter()
+        print(f"{n:>7} {(t1 - t0) * 1000:>10.1f} {lu:>10} {(t2 - t1) * 1000:>13.1f} {tu:>13}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Build the STT benchmark corpus offline: WAV answers plus reference text.
+
+Sentences are rendered with the app's own TTS engine (pyttsx3, no network),
+one ``NNN.wav`` + ``NNN.txt`` pair per answer. A directory of real recordings
+laid out the same way works as a corpus too.
+
+    python -m benchmarks.stt_fixtures --out .cache/stt_fixtures
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from benchmarks.chat_ttft import ANSWERS
+
+
+# Interview-style answers: technical vocabulary, numbers and a few long sentences
+EXTRA_ANSWERS = [
+    "My name is Alex and I have five years of experience building data pipelines in Python.",
+    "We reduced the p95 latency from eight hundred milliseconds to about two hundred.",
+    "I usually start by writing a failing test, then I make the smallest change that fixes it.",
+    "The cache was keyed by user ID and invalidated whenever the profile was updated.",
+    "In the last quarter our team migrated three services from virtual machines to Kubernetes.",
+    "I prefer code reviews that focus on correctness first and style second.",
+    "When the database became the bottleneck we added read replicas and moved reporting queries there.",
+]
+
+
+def corpus_sentences() -> List[str]:
+    return list(ANSWERS) + EXTRA_ANSWERS
+
+
+def load_corpus(root: str) -> List[Dict[str, str]]:
+    """``[{"audio": path, "text": reference}]`` for every WAV with a matching .txt."""
+    items = []
+    for wav in sorted(Path(root).glob("*.wav")):
+        ref = wav.with_suffix(".txt")
+        if ref.exists():
+            items.append({"audio": str(wav), "text": ref.read_text(encoding="utf-8").strip()})
+    return items
+
+
+def build(out: str, voice: Optional[str] = None, rate: Optional[int] = None) -> List[Dict[str, str]]:
+    from ai_interviewer.tts import synthesize
+
+    root = Path(out)
+    root.mkdir(parents=True, exist_ok=True)
+    for i, text in enumerate(corpus_sentences()):
+        wav = root / f"{i:03d}.wav"
+        if not wav.exists():
+            synthesize(text, voice, str(wav), rate)
+        wav.with_suffix(".txt").write_text(text + "\n", encoding="utf-8")
+    items = load_corpus(out)
+    (root / "manifest.json").write_text(json.dumps(items, indent=2), encoding="utf-8")
+    return items
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--out", default=".cache/stt_fixtures")
+    ap.add_argument("--voice", default=None, help="pyttsx3 voice id or name")
+    ap.add_argument("--rate", type=int, default=None, help="speaking rate (words per minute)")
+    args = ap.parse_args(argv)
+    items = build(args.out, args.voice, args.rate)
+    print(f"{len(items)} fixtures in {args.out}")
+
+
+if __name__ == "__main__":
+    main()
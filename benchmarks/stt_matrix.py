@@ -0,0 +1,197 @@
+"""STT accuracy/latency matrix: catalog models x compute_type x vad_filter.
+
+Every combination runs ``transcribe_file`` over the fixture corpus (see
+``benchmarks.stt_fixtures``) in a fresh subprocess, so load time and peak RSS
+are not polluted by earlier models. Reported per combination:
+
+    load_s      model load time
+    rtf         real-time factor: transcription time / audio duration (lower is faster)
+    wer         word error rate against the reference text
+    peak_rss_mb peak resident memory of the worker process
+
+Results go to STT_BENCHMARK_RESULTS (default .cache/stt_benchmark.json), which
+``choose_stt_model_for_profile`` reads to pick the fastest model that meets
+the accuracy target for the profile.
+
+    python -m benchmarks.stt_fixtures
+    python -m benchmarks.stt_matrix --compute-types int8,float32
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from ai_interviewer.stt import STT_BENCHMARK_RESULTS, STT_MODEL_CATALOG, STTConfig, _get_model, _rss_bytes, transcribe_file
+from benchmarks.stt_fixtures import load_corpus
+
+
+_ONES = "zero one two three four five six seven eight nine ten eleven twelve thirteen fourteen fifteen sixteen seventeen eighteen nineteen".split()
+_TENS = "_ _ twenty thirty forty fifty sixty seventy eighty ninety".split()
+
+
+def _num_words(n: int) -> str:
+    if n < 20:
+        return _ONES[n]
+    if n < 100:
+        return _TENS[n // 10] + ("" if n % 10 == 0 else " " + _ONES[n % 10])
+    if n < 1000:
+        rest = n % 100
+        return _ONES[n // 100] + " hundred" + ("" if rest == 0 else " " + _num_words(rest))
+    return str(n)
+
+
+def normalize_words(text: str) -> List[str]:
+    """Lowercase words without punctuation; small numbers spelled out."""
+    words: List[str] = []
+    for w in re.findall(r"[a-z0-9']+", text.lower().replace("-", " ")):
+        w = w.strip("'")
+        if w.isdigit():
+            words.extend(_num_words(int(w)).split())
+        elif w:
+            words.append(w)
+    return words
+
+
+def wer(reference: str, hypothesis: str) -> float:
+    """Word error rate (substitutions + insertions + deletions) / reference words."""
+    ref, hyp = normalize_words(reference), normalize_words(hypothesis)
+    if not ref:
+        return 0.0 if not hyp else 1.0
+    prev = list(range(len(hyp) + 1))
+    for i, r in enumerate(ref, 1):
+        cur = [i] + [0] * len(hyp)
+        for j, h in enumerate(hyp, 1):
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (r != h))
+        prev = cur
+    return prev[-1] / len(ref)
+
+
+def _peak_rss_mb() -> Optional[float]:
+    try:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports KiB, macOS bytes
+        return round(peak / (1024**2 if sys.platform == "darwin" else 1024), 1)
+    except Exception:
+        rss = _rss_bytes()
+        return round(rss / 1024**2, 1) if rss else None
+
+
+def _audio_seconds(path: str) -> float:
+    from ai_interviewer.stt import SAMPLE_RATE, decode_audio_bytes
+
+    with open(path, "rb") as f:
+        return len(decode_audio_bytes(f.read())) / SAMPLE_RATE
+
+
+def run_one(model: str, compute_type: str, vad_filter: bool, corpus: str, device: str = "cpu") -> Dict[str, Any]:
+    """Measure one combination in this process (the worker side)."""
+    items = load_corpus(corpus)
+    cfg = STTConfig(model=model, compute_type=compute_type, vad_filter=vad_filter, device=device)
+    t0 = time.perf_counter()
+    _get_model(cfg.model, compute_type=cfg.compute_type, device=cfg.device)
+    load_s = time.perf_counter() - t0
+    audio_s = transcribe_s = 0.0
+    errors = ref_words = 0.0
+    for it in items:
+        dur = _audio_seconds(it["audio"])
+        t0 = time.perf_counter()
+        hyp = transcribe_file(it["audio"], cfg)
+        transcribe_s += time.perf_counter() - t0
+        audio_s += dur
+        n = len(normalize_words(it["text"]))
+        errors += wer(it["text"], hyp) * n
+        ref_words += n
+    return {
+        "model": model,
+        "compute_type": compute_type,
+        "vad_filter": vad_filter,
+        "device": device,
+        "files": len(items),
+        "audio_s": round(audio_s, 2),
+        "load_s": round(load_s, 3),
+        "transcribe_s": round(transcribe_s, 3),
+        "rtf": round(transcribe_s / audio_s, 4) if audio_s else None,
+        "wer": round(errors / ref_words, 4) if ref_words else None,
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def run_isolated(model: str, compute_type: str, vad_filter: bool, corpus: str, device: str, timeout_s: float) -> Dict[str, Any]:
+    spec = json.dumps({"model": model, "compute_type": compute_type, "vad_filter": vad_filter, "device": device})
+    cmd = [sys.executable, "-m", "benchmarks.stt_matrix", "--worker", spec, "--corpus", corpus]
+    try:
+        p = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout_s)
+    except subprocess.TimeoutExpired:
+        return {"model": model, "compute_type": compute_type, "vad_filter": vad_filter, "error": "timeout"}
+    lines = [l for l in p.stdout.splitlines() if l.startswith("{")]
+    if p.returncode != 0 or not lines:
+        err = (p.stderr.strip().splitlines() or ["worker failed"])[-1]
+        return {"model": model, "compute_type": compute_type, "vad_filter": vad_filter, "error": err}
+    return json.loads(lines[-1])
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--corpus", default=".cache/stt_fixtures")
+    ap.add_argument("--models", default=",".join(STT_MODEL_CATALOG))
+    ap.add_argument("--compute-types", default="int8,float32")
+    ap.add_argument("--vad", default="on,off", help="vad_filter settings to cover: on,off")
+    ap.add_argument("--device", default="cpu")
+    ap.add_argument("--timeout", type=float, default=1800, help="per-combination timeout in seconds")
+    ap.add_argument("--out", default=STT_BENCHMARK_RESULTS)
+    ap.add_argument("--worker", help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+
+    if args.worker:
+        spec = json.loads(args.worker)
+        print(json.dumps(run_one(corpus=args.corpus, **spec)))
+        return
+
+    if not load_corpus(args.corpus):
+        sys.exit(f"No fixtures in {args.corpus}; run `python -m benchmarks.stt_fixtures --out {args.corpus}` first.")
+
+    models = [m.strip() for m in args.models.split(",") if m.strip()]
+    compute_types = [c.strip() for c in args.compute_types.split(",") if c.strip()]
+    vads = [v.strip().lower() in ("on", "true", "1") for v in args.vad.split(",") if v.strip()]
+
+    rows: List[Dict[str, Any]] = []
+    print(f"{'model':<11} {'compute':<8} {'vad':<4} {'load_s':>7} {'rtf':>7} {'wer':>6} {'rss_mb':>7}")
+    for model in models:
+        for ct in compute_types:
+            for vad in vads:
+                r = run_isolated(model, ct, vad, args.corpus, args.device, args.timeout)
+                rows.append(r)
+                if "error" in r:
+                    print(f"{model:<11} {ct:<8} {'on' if vad else 'off':<4} error: {r['error'][:60]}")
+                else:
+                    print(
+                        f"{model:<11} {ct:<8} {'on' if vad else 'off':<4} {r['load_s']:>7.2f} "
+                        f"{r['rtf']:>7.3f} {r['wer']:>6.3f} {r['peak_rss_mb'] or 0:>7.0f}"
+                    )
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    doc = {
+        "generated_at": time.time(),
+        "machine": {"platform": platform.platform(), "cpu_count": os.cpu_count(), "python": platform.python_version()},
+        "corpus": args.corpus,
+        "results": rows,
+    }
+    tmp = f"{args.out}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(doc, f, indent=2)
+    os.replace(tmp, args.out)
+    print(f"\nWrote {args.out}")
+
+
+if __name__ == "__main__":
+    main()
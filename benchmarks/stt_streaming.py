@@ -0,0 +1,68 @@
+"""End-of-speech-to-transcript latency: whole-clip vs. streaming transcription.
+
+Each WAV is replayed in real time (``--chunk-ms`` chunks, sleeping between
+them, as a recorder would deliver it). Latency is measured from the moment the
+last chunk is delivered (the candidate presses stop) until the final
+transcript is available.
+
+    python -m benchmarks.stt_streaming answers/*.wav --model tiny.en
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+from typing import List
+
+from ai_interviewer.stt import (
+    SAMPLE_RATE,
+    STTConfig,
+    StreamingTranscriber,
+    _get_model,
+    decode_audio_bytes,
+    transcribe_audio,
+)
+
+
+def replay(audio, chunk: int, speed: float, sink) -> None:
+    for i in range(0, len(audio), chunk):
+        part = audio[i:i + chunk]
+        sink(part)
+        if speed > 0:
+            time.sleep(len(part) / SAMPLE_RATE / speed)
+
+
+def main(argv: List[str] | None = None) -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("files", nargs="+")
+    ap.add_argument("--model", default="tiny.en")
+    ap.add_argument("--compute-type", default="int8")
+    ap.add_argument("--chunk-ms", type=int, default=100)
+    ap.add_argument("--speed", type=float, default=1.0, help="replay speed; 0 = as fast as possible")
+    args = ap.parse_args(argv)
+
+    cfg = STTConfig(model=args.model, compute_type=args.compute_type)
+    _get_model(cfg.model, compute_type=cfg.compute_type)  # keep load time out of the numbers
+    chunk = int(SAMPLE_RATE * args.chunk_ms / 1000)
+
+    print(f"{'file':<30} {'audio_s':>8} {'batch_ms':>9} {'stream_ms':>10}")
+    for f in args.files:
+        audio = decode_audio_bytes(Path(f).read_bytes())
+
+        replay(audio, chunk, args.speed, lambda _part: None)
+        t0 = time.perf_counter()
+        transcribe_audio(audio, cfg)
+        batch_ms = (time.perf_counter() - t0) * 1000
+
+        st = StreamingTranscriber(cfg)
+        replay(audio, chunk, args.speed, st.feed)
+        t0 = time.perf_counter()
+        st.finish()
+        stream_ms = (time.perf_counter() - t0) * 1000
+
+        print(f"{Path(f).name[:30]:<30} {len(audio) / SAMPLE_RATE:>8.1f} {batch_ms:>9.0f} {stream_ms:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()